@@ -1,7 +1,13 @@
 # coding=utf-8
 """Ladybug analysis period class."""
 from .dt import DateTime
-from datetime import datetime, timedelta
+from datetime import timedelta
+
+try:
+    xrange
+except NameError:
+    # python 3
+    xrange = range
 
 
 class AnalysisPeriod(object):
@@ -27,6 +33,7 @@ class AnalysisPeriod(object):
     Properties:
         isAnalysisPeriod: Always return True. Useful for type checking.
         datetimes: Sorted list of datetimes in this analysis period.
+        moys: A sorted list of minutes of year in this analysis period.
         hoys: A sorted list of hours of year in this analysis period.
         int_hoys: A sorted list of hours of year values in this analysis period as
             integers.
@@ -224,6 +231,11 @@ class AnalysisPeriod(object):
         return tuple(DateTime.from_moy(moy, self.is_leap_year)
                      for moy in self._timestamps_data)
 
+    @property
+    def moys(self):
+        """A sorted list of minutes of year in this analysis period as integers."""
+        return tuple(self._timestamps_data)
+
     @property
     def hoys(self):
         """A sorted list of hours of year in this analysis period."""
@@ -274,31 +286,35 @@ class AnalysisPeriod(object):
 
         Use this method only when start time month is before end time month.
         """
-        # calculate based on minutes
-        # I have to convert the object to DateTime because of how Dynamo
-        # works: https://github.com/DynamoDS/Dynamo/issues/6683
-        # Do not modify this line to datetime
-        curr = datetime(st_time.year, st_time.month, st_time.day, st_time.hour,
-                        st_time.minute, self.is_leap_year)
-        end_time = datetime(end_time.year, end_time.month, end_time.day,
-                            end_time.hour, end_time.minute, self.is_leap_year)
-
-        while curr <= end_time:
-            if self.is_possible_hour(curr.hour + (curr.minute / 60.0)):
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
-            curr += self.minute_intervals
-
-        if self.timestep != 1 and curr.hour == 23 and self.is_possible_hour(0):
+        # minutes of the year until the start of each month
+        num_of_days_each_month = self.NUMOFDAYSEACHMONTH if not self.is_leap_year \
+            else self.NUMOFDAYSEACHMONTHLEAP
+        month_moys = [0]
+        for days in num_of_days_each_month[:-1]:
+            month_moys.append(month_moys[-1] + days * 1440)
+
+        # calculate based on minutes of the year instead of stepping a datetime
+        st_moy = month_moys[st_time.month - 1] + (st_time.day - 1) * 1440 + \
+            st_time.hour * 60 + st_time.minute
+        end_moy = month_moys[end_time.month - 1] + (end_time.day - 1) * 1440 + \
+            end_time.hour * 60 + end_time.minute
+        step = 60 // self.timestep
+
+        # check the hours of a day once
+        possible_steps = [self.is_possible_hour(minute / 60.0)
+                          for minute in xrange(0, 1440, step)]
+        self._timestamps_data.extend(
+            moy for moy in xrange(st_moy, end_moy + 1, step)
+            if possible_steps[moy % 1440 // step])
+
+        # minute of the year after the last step
+        curr_moy = end_moy - (end_moy - st_moy) % step + step
+        if self.timestep != 1 and curr_moy % 1440 // 60 == 23 and \
+                self.is_possible_hour(0):
             # This is for cases that timestep is more than one
             # and last hour of the day is part of the calculation
-            curr = end_time
-            for i in range(self.timestep)[1:]:
-                curr += self.minute_intervals
-                time = DateTime(curr.month, curr.day, curr.hour, curr.minute,
-                                self.is_leap_year)
-                self._timestamps_data.append(time.moy)
+            self._timestamps_data.extend(
+                end_moy + i * step for i in xrange(1, self.timestep))
 
     def _calculate_timestamps(self):
         """Return a list of Ladybug DateTime in this analysis period."""
@@ -348,7 +364,7 @@ class AnalysisPeriod(object):
 
         The length will be number of hours * timestep.
         """
-        return len(self.hoys)
+        return len(self._timestamps_data)
 
     def __str__(self):
         """Return analysis period as a string."""
@@ -1,6 +1,9 @@
 """PMV Comfort object."""
 import math
-from collections import Iterable
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
 from .comfortmodel import ComfortModel
 from ..psychrometrics import humid_ratio_from_db_rh
 from ..psychrometrics import saturated_vapor_pressure_torr
@@ -8,6 +11,7 @@ from ..rootfind import secant
 from ..rootfind import bisect
 from ..listoperations import duplicate
 from ..epw import EPW
+from ..datacollection import DataCollection
 
 
 class PMV(ComfortModel):
@@ -390,6 +394,32 @@ class PMV(ComfortModel):
         Checks to be sure that the lists of PMV input variables are aligned and fills in
         defaults where possible.
         """
+        # Join data collections on their datetimes so gaps in one of them don't
+        # silently shift the values of the others.
+        inputs = [self.__air_temperature, self.__rad_temperature, self.__wind_speed,
+                  self.__rel_humidity, self.__met_rate, self.__clo_value,
+                  self.__external_work]
+        collections = [i for i, inp in enumerate(inputs)
+                       if hasattr(inp, 'isDataCollection')]
+        if len(collections) > 1:
+            aligned = DataCollection.align(*[inputs[i] for i in collections])
+            if len(aligned[0]) != max(len(inputs[i]) for i in collections):
+                # lists can't be joined on datetimes the same way as collections
+                lists = [i for i, inp in enumerate(inputs)
+                         if i not in collections and isinstance(inp, Iterable) and
+                         len(inp) > 1]
+                if lists:
+                    raise ValueError(
+                        'Data collections with different datetimes are aligned on '
+                        'their shared datetimes ({} values) and can not be mixed '
+                        'with lists of values. Use data collections or single '
+                        'values for the other inputs.'.format(len(aligned[0])))
+            for i, collection in zip(collections, aligned):
+                inputs[i] = list(collection.values)
+            self.__air_temperature, self.__rad_temperature, self.__wind_speed, \
+                self.__rel_humidity, self.__met_rate, self.__clo_value, \
+                self.__external_work = inputs
+
         # Check each list to be sure that the contents are what we want.
         check_data1, air_temp, airMultVal = self._check_input_list(
             self.__air_temperature, [20], "air_temperature", "Temperature")
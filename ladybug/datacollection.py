@@ -1,8 +1,21 @@
 """Ladybug data collection."""
 from .header import Header
-from .datatype import DataPoint
-
-from collections import OrderedDict
+from .analysisperiod import AnalysisPeriod
+from .datatype import DataPoint, unit_conversion
+from .dt import DateTime
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+import ast
+import heapq
+import json
+import keyword
+import math
+import operator
+import re
+import struct
+import sys
 
 try:
     from itertools import izip as zip
@@ -10,12 +23,335 @@ except ImportError:
     # python 3
     xrange = range
 
+try:
+    basestring
+except NameError:
+    # python 3
+    basestring = str
+
+
+# syntax which is allowed in conditional statements. attribute access, subscripts,
+# calls and any other syntax that can reach outside the values is rejected. powers
+# are rejected since a short statement (e.g. 9 ** 9 ** 9) can take forever.
+_STATEMENT_NODES = tuple(getattr(ast, name) for name in (
+    'Expression', 'Load', 'Name', 'Num', 'Constant', 'NameConstant', 'Tuple', 'List',
+    'BoolOp', 'And', 'Or', 'UnaryOp', 'Not', 'USub', 'UAdd', 'BinOp', 'Add', 'Sub',
+    'Mult', 'Div', 'FloorDiv', 'Mod', 'Compare', 'Eq', 'NotEq', 'Lt', 'LtE',
+    'Gt', 'GtE', 'In', 'NotIn', 'Is', 'IsNot', 'IfExp') if hasattr(ast, name))
+
+
+def _compile_statement(statement, names):
+    """Compile a conditional statement to a function of the variables in names.
+
+    The statement is parsed once and only comparisons, boolean and arithmetic
+    operations between the variables and numbers are allowed. Tuples and lists are
+    only allowed on the right side of in and not in (e.g. x in (1, 2)) so they can't
+    be repeated into large sequences.
+    """
+    for name in names:
+        if not re.match(r'^[A-Za-z_]\w*\Z', str(name)) or keyword.iskeyword(name) or \
+                name in ('True', 'False', 'None'):
+            raise ValueError(
+                'Invalid variable name: %s\n\tVariable names should be valid '
+                'identifiers which are not keywords.' % name)
+
+    try:
+        tree = ast.parse(statement.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError('Invalid input statement: %s\n\t%s' % (statement, e))
+
+    members = set()  # tuples and lists which are checked for membership
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Compare):
+            members.update(
+                id(comp) for op, comp in zip(node.ops, node.comparators)
+                if isinstance(op, (ast.In, ast.NotIn)) and
+                isinstance(comp, (ast.Tuple, ast.List)))
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Tuple, ast.List)) and id(node) not in members:
+            raise ValueError(
+                'Invalid input statement: %s\n\tTuples and lists are only allowed '
+                'after in and not in.' % statement)
+        if not isinstance(node, _STATEMENT_NODES):
+            raise ValueError(
+                'Invalid input statement: %s\n\t%s is not allowed in statements.'
+                % (statement, type(node).__name__))
+        if isinstance(node, ast.Name) and node.id not in names and \
+                node.id not in ('True', 'False', 'None'):
+            raise ValueError(
+                'Invalid input statement: %s\n\tUnknown variable "%s". Valid '
+                'variables are: %s' % (statement, node.id, ', '.join(names)))
+        if type(node).__name__ == 'Constant' and \
+                not isinstance(node.value, (int, float, bool, type(None))):
+            raise ValueError(
+                'Invalid input statement: %s\n\tOnly numbers are allowed as '
+                'constants in statements.' % statement)
+
+    # the statement is a valid expression on its own and can be wrapped in a lambda
+    source = 'lambda %s: (\n%s\n)' % (', '.join(names), statement.strip())
+    return eval(compile(source, '<statement>', 'eval'), {'__builtins__': {}})
+
+
+_AGGREGATION_KEYS = ('month', 'day', 'hour')
+_AGGREGATION_FUNCS = ('mean', 'min', 'max', 'sum', 'count', 'std')
+_ANNUAL_GROUPS = {}  # groups of annual collections for (by, timestep, leap_year)
+
+
+def _month_of_days(leap_year):
+    """Return a list of months for each day of the year."""
+    days = (31, 29 if leap_year else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+    return [month for month, count in enumerate(days, 1) for _ in xrange(count)]
+
+
+def _group_getter(indices):
+    """Return a function to get the values at a sorted list of indices."""
+    start = indices[0]
+    if len(indices) == 1:
+        return operator.itemgetter(slice(start, start + 1))
+    step = indices[1] - start
+    if indices[-1] == start + step * (len(indices) - 1) and \
+            indices == list(xrange(start, indices[-1] + 1, step)):
+        # evenly spaced indices (e.g. an hour in each month) can be sliced
+        return operator.itemgetter(slice(start, indices[-1] + 1, step))
+    return operator.itemgetter(*indices)
+
+
+def _group_keys(keys, sort=True):
+    """Group indices of a list of keys.
+
+    Returns:
+        A list of (key, getter) where getter returns the values of the group from
+        a list of values. Groups are sorted by key or are in the order that the
+        keys first appear if sort is False.
+    """
+    groups = OrderedDict() if not sort else {}
+    for index, key in enumerate(keys):
+        try:
+            groups[key].append(index)
+        except KeyError:
+            groups[key] = [index]
+    return [(key, _group_getter(groups[key]))
+            for key in (sorted(groups) if sort else groups)]
+
+
+def _group_indices(moys, by, leap_year=False):
+    """Group indices of moys by month, day of the year and hour of the day.
+
+    Keys are calculated from the minutes of the year without creating datetimes.
+
+    Returns:
+        A sorted list of (key, getter) where key is a tuple of values for by and
+        getter returns the values of the group from a list of values.
+    """
+    month_of_day = _month_of_days(leap_year)
+    key_funcs = {
+        'month': lambda moy: month_of_day[moy // 1440],
+        'day': lambda moy: moy // 1440 + 1,
+        'hour': lambda moy: moy // 60 % 24
+    }
+    return _group_keys(zip(*[map(key_funcs[b], moys) for b in by]))
+
+
+def _statistics(groups, funcs):
+    """Calculate statistics for a list of groups of values.
+
+    Returns:
+        A list with a list of values for each statistic in funcs.
+    """
+    counts = list(map(len, groups))
+    totals = list(map(sum, groups))
+    means = [total / float(count) for total, count in zip(totals, counts)]
+    results = []
+    for func in funcs:
+        if func == 'mean':
+            results.append(means)
+        elif func == 'min':
+            results.append(list(map(min, groups)))
+        elif func == 'max':
+            results.append(list(map(max, groups)))
+        elif func == 'sum':
+            results.append(totals)
+        elif func == 'count':
+            results.append(counts)
+        else:
+            # sum the squares of deviations from the mean. the sum of squares minus
+            # the square of the mean loses precision for large values (e.g. pressure)
+            stds = []
+            for values, mean, count in zip(groups, means, counts):
+                deviations = [v - mean for v in values]
+                stds.append(math.sqrt(
+                    sum(map(operator.mul, deviations, deviations)) / count))
+            results.append(stds)
+    return results
+
+
+_ROLLING_FUNCS = ('mean', 'min', 'max', 'sum')
+
+
+def _rolling_sum(values, count):
+    """Return the sum of the last count values for each value."""
+    result = []
+    total = 0
+    for i, v in enumerate(values):
+        total += v
+        if i >= count:
+            total -= values[i - count]
+        result.append(total)
+    return result
+
+
+def _rolling_extreme(values, count, keep):
+    """Return the extreme of the last count values for each value.
+
+    A deque of indices is kept where each value is kept over the later values
+    (e.g. operator.gt for maximum), so each value is added and removed once.
+    """
+    result = []
+    window = deque()
+    for i, v in enumerate(values):
+        while window and not keep(values[window[-1]], v):
+            window.pop()
+        window.append(i)
+        if window[0] <= i - count:
+            window.popleft()
+        result.append(values[window[0]])
+    return result
+
+
+_INTERPOLATION_METHODS = ('linear', 'monotone')
+
+
+def _interpolate(values, factor, method='linear'):
+    """Interpolate factor number of values from each value towards the next value.
+
+    The last value is interpolated towards the first value. The monotone method is
+    a cubic Hermite interpolation with Fritsch-Butland tangents which does not
+    overshoot the values (e.g. negative radiation values around sunrise).
+    """
+    nexts = values[1:] + values[:1]
+    if method == 'linear':
+        steps = [(n - v) / float(factor) for v, n in zip(values, nexts)]
+        return [v + i * step for v, step in zip(values, steps) for i in xrange(factor)]
+
+    secants = [n - v for v, n in zip(values, nexts)]
+    tangents = [2.0 * a * b / (a + b) if a * b > 0 else 0.0
+                for a, b in zip(secants[-1:] + secants[:-1], secants)]
+    next_tangents = tangents[1:] + tangents[:1]
+    basis = []
+    for i in xrange(factor):
+        t = i / float(factor)
+        basis.append((2 * t ** 3 - 3 * t ** 2 + 1, t ** 3 - 2 * t ** 2 + t,
+                      -2 * t ** 3 + 3 * t ** 2, t ** 3 - t ** 2))
+    return [h00 * v + h10 * m0 + h01 * n + h11 * m1
+            for v, n, m0, m1 in zip(values, nexts, tangents, next_tangents)
+            for h00, h10, h01, h11 in basis]
+
+
+# magic, version, json document size
+_BYTES_HEADER = struct.Struct('<5sBI')
+
+
+def _array_to_bytes(column):
+    """Return the machine values of an array as bytes."""
+    try:
+        return column.tobytes()
+    except AttributeError:
+        # python 2
+        return column.tostring()
+
+
+def _array_from_bytes(column, data):
+    """Append items from machine values in bytes to an array."""
+    try:
+        column.frombytes(data)
+    except AttributeError:
+        # python 2
+        column.fromstring(data)
+
+
+class _SequenceView(object):
+    """A read-only view of a sequence for a list or a range of indices."""
+
+    __slots__ = ('_sequence', '_indices')
+
+    def __init__(self, sequence, indices):
+        self._sequence = sequence
+        self._indices = indices
+
+    def __len__(self):
+        return len(self._indices)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return _SequenceView(self._sequence, self._indices[key])
+        return self._sequence[self._indices[key]]
+
+    def __iter__(self):
+        return iter(map(self._sequence.__getitem__, self._indices))
+
+
+def _annual_indices(moys, timestep, count):
+    """Return the sorted indices of moys in continuous annual values.
+
+    Minutes of the year which are not on a timestep or are out of range are ignored.
+    """
+    step = 60 // timestep
+    indices = sorted(set([int(moy // step) for moy in moys if moy % step == 0]))
+    return indices[bisect_left(indices, 0):bisect_left(indices, count)]
+
+
+def _view_of(sequence, key):
+    """Return a view of a sequence for a slice or a sorted list of indices.
+
+    Evenly spaced indices are sliced from a memoryview of arrays so the values are
+    not copied. Other indices are looked up in the sequence on request.
+    """
+    if not isinstance(key, slice):
+        if len(key) > 1 and key[1] > key[0] and \
+                key == list(xrange(key[0], key[-1] + 1, key[1] - key[0])):
+            key = slice(key[0], key[-1] + 1, key[1] - key[0])
+        elif len(key) == 1:
+            key = slice(key[0], key[0] + 1)
+        else:
+            if isinstance(sequence, _SequenceView):
+                # avoid chains of views
+                return _SequenceView(sequence._sequence,
+                                     [sequence._indices[i] for i in key])
+            return _SequenceView(sequence, key)
+    if isinstance(sequence, (array, memoryview)):
+        try:
+            return memoryview(sequence)[key]
+        except TypeError:
+            # arrays don't support the buffer protocol in python 2
+            pass
+    elif isinstance(sequence, _SequenceView):
+        return sequence[key]
+    return _SequenceView(sequence, xrange(*key.indices(len(sequence))))
+
+
+def _typecode_of(values):
+    """Return the array typecode of packed values or a view of them.
+
+    Values which are not packed get the typecode for floats.
+    """
+    if isinstance(values, _SequenceView):
+        values = values._sequence
+    if isinstance(values, array):
+        return values.typecode
+    if isinstance(values, memoryview) and values.format in ('i', 'd'):
+        return values.format
+    return 'd'
+
 
 class DataCollection(object):
     """A list of data with a header."""
 
     __slots__ = ('_header', '_data')
 
+    JSON_VERSION = 1
+    BYTESVERSION = 1
+
     def __init__(self, data=None, header=None):
         """Init class."""
         self.header = header
@@ -37,21 +373,40 @@ class DataCollection(object):
     def from_json(cls, data):
         """Create a data collection from a dictionary.
 
+        Dictionaries which are created using to_json create a compact data
+        collection. Dictionaries with a list of data points from older versions
+        are also supported.
+
         Args:
             {
-                "data": [], //An array of Ladybug data points,
-                "header": {} // A Ladybug header
+                "version": 1, // Version of the schema
+                "header": {}, // A Ladybug header
+                "values": [], // A list of values
+                "moys": [], // Optional minutes of the year for values
+                "is_leap_year": false // Whether moys are for a leap year
             }
         """
-        if 'data' not in data:
-            input_data = []
-        else:
-            input_data = [DataPoint.from_json(d) for d in data['data']]
+        if 'values' not in data:
+            # a list of data points
+            input_data = [DataPoint.from_json(dict(d)) for d in data.get('data', ())]
+            return cls(input_data, Header.from_json(data.get('header') or {}))
+
+        if data.get('version', cls.JSON_VERSION) > cls.JSON_VERSION:
+            raise ValueError('Unsupported data collection version: %s'
+                             % data['version'])
+        header = Header.from_json(data['header']) if data.get('header') else None
+        return CompactDataCollection(data['values'], header, data.get('moys'),
+                                     data.get('is_leap_year'))
 
-        if 'header' not in data:
-            data['header'] = {}
+    @classmethod
+    def from_json_file(cls, file_path):
+        """Create a data collection from a json file.
 
-        return cls(input_data, Header.from_json(data['header']))
+        Args:
+            file_path: Path to a json file which is created using write_json.
+        """
+        with open(file_path, 'r') as inf:
+            return cls.from_json(json.load(inf))
 
     @classmethod
     def from_list(cls, lst, location=None, data_type=None, unit=None,
@@ -86,6 +441,97 @@ class DataCollection(object):
         """Create a list from data and analysis period."""
         return cls.from_data_and_datetimes(data, analysis_period.datetimes, header)
 
+    @staticmethod
+    def align(*collections, **kwargs):
+        """Align data collections on their datetimes.
+
+        Collections are joined on the minutes of the year with a dictionary of
+        indices for each collection so gaps in any of the collections don't
+        shift the values of the others.
+
+        Args:
+            collections: Data collections to be aligned.
+            how: inner to only keep the datetimes which are in all the
+                collections or outer to keep the datetimes which are in any of
+                the collections (Default: inner).
+            fill: Value for the datetimes which are missing in a collection for an
+                outer alignment (Default: None).
+
+        Returns:
+            A list of compact data collections with the same datetimes sorted by
+            time. Use moys of any of them as the shared time index.
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            dbt, sensor = DataCollection.align(epw.dry_bulb_temperature, sensor_data)
+            difference = sensor - dbt
+        """
+        how = kwargs.pop('how', 'inner')
+        fill = kwargs.pop('fill', None)
+        if kwargs:
+            raise TypeError('Unexpected arguments: %s' % ', '.join(kwargs))
+        if how not in ('inner', 'outer'):
+            raise ValueError('how should be inner or outer. Got %s' % how)
+        for collection in collections:
+            if not hasattr(collection, 'isDataCollection'):
+                raise ValueError('Expected a data collection. Got %s'
+                                 % type(collection).__name__)
+        if not collections:
+            return []
+
+        data = [collection._aggregation_data() for collection in collections]
+        leap_years = set(leap_year for values, moys, leap_year in data)
+        if len(leap_years) > 1:
+            raise ValueError('Cannot align collections for leap and non-leap years.')
+        leap_year = leap_years.pop()
+
+        first_moys = tuple(data[0][1])
+        if all(tuple(moys) == first_moys for values, moys, leap_year in data[1:]) \
+                and list(first_moys) == sorted(first_moys):
+            # collections are already aligned
+            aligned_moys = first_moys
+            aligned_values = [values for values, moys, leap_year in data]
+        else:
+            indices = []
+            for values, moys, _ in data:
+                index = {}
+                for i, moy in enumerate(moys):
+                    index.setdefault(moy, i)
+                indices.append(index)
+            if how == 'inner':
+                common = set(indices[0])
+                for index in indices[1:]:
+                    common.intersection_update(index)
+            else:
+                common = set()
+                for index in indices:
+                    common.update(index)
+            aligned_moys = sorted(common)
+            aligned_values = []
+            for (values, moys, _), index in zip(data, indices):
+                if how == 'inner':
+                    aligned_values.append([values[index[moy]] for moy in aligned_moys])
+                else:
+                    aligned_values.append(
+                        [values[index[moy]] if moy in index else fill
+                         for moy in aligned_moys])
+
+        aligned = []
+        for collection, values in zip(collections, aligned_values):
+            header = None
+            if collection.header:
+                header = collection.header.duplicate()
+                ap = header.analysis_period
+                if ap is None or ap.moys != aligned_moys:
+                    header.analysis_period = None
+            if header and header.analysis_period:
+                aligned.append(CompactDataCollection(values, header))
+            else:
+                aligned.append(
+                    CompactDataCollection(values, header, aligned_moys, leap_year))
+        return aligned
+
     @property
     def header(self):
         """Get or set header."""
@@ -99,14 +545,14 @@ class DataCollection(object):
         """Append a single item to the list."""
         assert hasattr(d, 'isDataPoint'), \
             'Expected DataPoint got {}'.format(type(d))
-        self._data.append(d)
+        self.data.append(d)
 
     def extend(self, new_data):
         """Extend a number of items to the end of items."""
         for d in new_data:
             assert hasattr(d, 'isDataPoint'), \
                 'Expected DataPoint got {}'.format(type(d))
-        self._data.extend(new_data)
+        self.data.extend(new_data)
 
     def insert(self, i, d):
         """Insert an item at a given position."""
@@ -114,7 +560,7 @@ class DataCollection(object):
             'Expected DataPoint got {}'.format(type(d))
         assert isinstance(i, int), \
             'Expected Integer got {}'.format(type(i))
-        self._data.insert(i, d)
+        self.data.insert(i, d)
 
     def pop(self, i=-1):
         """Remove the item at the given position in the data collection, and return it.
@@ -124,20 +570,25 @@ class DataCollection(object):
         """
         assert isinstance(i, int), \
             'Expected Integer got {}'.format(type(i))
-        assert i < len(self._data), \
+        assert i < len(self.data), \
             'Item({}) is larger than the length of the data collection({})' \
-            .format(i, len(self._data))
-        return self._data.pop(i)
+            .format(i, len(self.data))
+        return self.data.pop(i)
 
     @property
     def datetimes(self):
         """Return datetimes for this collection as a tuple."""
         return tuple(value.datetime for value in self)
 
+    @property
+    def moys(self):
+        """Return minutes of the year for this collection as a tuple."""
+        return tuple(value.datetime.moy for value in self)
+
     @property
     def values(self):
         """Return the list of numerical values."""
-        return [x.value for x in self._data]
+        return [x.value for x in self.data]
 
     @property
     def data(self):
@@ -146,7 +597,10 @@ class DataCollection(object):
 
     def duplicate(self):
         """Duplicate current data list."""
-        return DataCollection(self.data, self.header)
+        # data points are already validated
+        collection = DataCollection(header=self.header)
+        collection._data = list(self.data)
+        return collection
 
     @staticmethod
     def average(data):
@@ -156,38 +610,159 @@ class DataCollection(object):
 
     def get_highest_values(self, count):
         """Find highest values in a list of DataPoints
-        
+
         Args:
             data: A list of DataPoint to be processed
             count: Number of highest values to account for
-            
+
         Return:
             highest_values: The n highest values in data list, ordered from
                 highest to lowest
-            highest_values_index: Indicies of the n highest values in data 
+            highest_values_index: Indicies of the n highest values in data
                 list, ordered from highest to lowest
         """
-        data_points = self._data
-        
-        values = [obj._value for obj in data_points]
-        
-        lenght_values = len(values)
-        
         count = int(count)
-        
-        assert count <= lenght_values, \
+
+        assert count <= len(self), \
             'Count must be equal to or smaller than list of data lenght'
-            
+
         assert count > 0, \
             'Count must be higher than zero'
-        
-        highest_values = sorted(values, reverse = True)[0:count]
-        
-        highest_values_index = sorted(range(lenght_values), 
-                                      key = lambda k: values[k],
-                                      reverse = True)[0:count]
-        
-        return highest_values, highest_values_index
+
+        return self.top_k(count)
+
+    def top_k(self, count):
+        """Find the highest values without sorting all the values.
+
+        Args:
+            count: Number of highest values.
+
+        Return:
+            A tuple of two lists for the highest values and their indices, ordered
+            from highest to lowest. Equal values are ordered by their indices.
+        """
+        values = self.values
+        indices = heapq.nlargest(int(count), xrange(len(values)),
+                                 key=values.__getitem__)
+        return [values[i] for i in indices], indices
+
+    def bottom_k(self, count):
+        """Find the lowest values without sorting all the values.
+
+        Args:
+            count: Number of lowest values.
+
+        Return:
+            A tuple of two lists for the lowest values and their indices, ordered
+            from lowest to highest. Equal values are ordered by their indices.
+        """
+        values = self.values
+        indices = heapq.nsmallest(int(count), xrange(len(values)),
+                                  key=values.__getitem__)
+        return [values[i] for i in indices], indices
+
+    def percentile(self, percentile):
+        """Return a percentile of the values.
+
+        Values between two data points are linearly interpolated.
+
+        Args:
+            percentile: A number between 0 and 100 (e.g. 99.6).
+        """
+        return self.percentiles((percentile,))[0]
+
+    def percentiles(self, percentiles):
+        """Return a list of percentiles of the values.
+
+        Values are only sorted once for all the percentiles. If all the percentiles
+        are close to the ends (e.g. 0.4 and 99.6 for design conditions) only the
+        values at the ends are selected with a heap instead of sorting all the
+        values.
+
+        Args:
+            percentiles: A list of numbers between 0 and 100.
+        """
+        values = self.values
+        length = len(values)
+        if length == 0:
+            raise ValueError('Cannot calculate percentiles for an empty collection.')
+        ranks = []
+        for p in percentiles:
+            if not 0 <= p <= 100:
+                raise ValueError('Percentile should be between 0 and 100. Got %s' % p)
+            ranks.append(p / 100.0 * (length - 1))
+
+        # number of values to be selected from each end of the sorted values
+        low = max([int(math.ceil(r)) + 1 for r in ranks if r < length / 2.0] or [0])
+        high = max([length - int(r) for r in ranks if r >= length / 2.0] or [0])
+        if low + high < length / 8:
+            lowest = heapq.nsmallest(low, values)
+            highest = heapq.nlargest(high, values)
+
+            def get_value(i):
+                return lowest[i] if i < low else highest[length - 1 - i]
+        else:
+            get_value = sorted(values).__getitem__
+
+        result = []
+        for rank in ranks:
+            i = int(rank)
+            fraction = rank - i
+            value = get_value(i)
+            if fraction:
+                value += fraction * (get_value(i + 1) - value)
+            result.append(value)
+        return result
+
+    def histogram(self, bins=10, limits=None):
+        """Count the number of values in bins in one pass over the values.
+
+        Args:
+            bins: Number of bins with equal width or a sorted list of bin edges
+                (e.g. [-10, 0, 10, 20, 30]) (Default: 10).
+            limits: An optional tuple of (lower, upper) limits for bins with equal
+                width. Default is the minimum and the maximum of the values.
+                Values outside of the limits are not counted.
+
+        Return:
+            A tuple of two lists for the count of values in each bin and the bin
+            edges. Each bin includes its lower edge and the last bin also includes
+            its upper edge.
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            counts, edges = epw.dry_bulb_temperature.histogram(range(-20, 41, 5))
+        """
+        values = self.values
+        if isinstance(bins, int):
+            if bins < 1:
+                raise ValueError('Number of bins should be at least 1.')
+            lower, upper = limits if limits is not None else \
+                (min(values), max(values)) if values else (0, 1)
+            if lower == upper:
+                lower, upper = lower - 0.5, upper + 0.5
+            width = (upper - lower) / float(bins)
+            edges = [lower + i * width for i in xrange(bins)] + [upper]
+            counts = [0] * bins
+            for v in values:
+                if lower <= v <= upper:
+                    i = int((v - lower) / width)
+                    counts[i if i < bins else bins - 1] += 1
+            return counts, edges
+
+        edges = list(bins)
+        if len(edges) < 2 or any(a >= b for a, b in zip(edges, edges[1:])):
+            raise ValueError(
+                'Bin edges should be a sorted list of at least 2 values.')
+        last = len(edges) - 1
+        counts = [0] * last
+        lower, upper = edges[0], edges[-1]
+        for v in values:
+            if lower <= v <= upper:
+                i = bisect_right(edges, v) - 1
+                counts[i if i < last else last - 1] += 1
+        return counts, edges
 
     @staticmethod
     def group_data_by_month(data, month_range=xrange(1, 13)):
@@ -326,27 +901,20 @@ class DataCollection(object):
         """
         # check length of data vs length of analysis hours_of_year
         if len(values) != len(hours_of_year):
-            raise ValueError("Length of values %d is not equal to " +
-                             "number of hours in analysis period %d" %
-                             (str(len(values)), str(len(hours_of_year))))
+            raise ValueError(
+                "Length of values %d is not equal to number of hours in analysis "
+                "period %d" % (len(values), len(hours_of_year)))
+
+        # map each hour to the index of its value once
+        value_index = {}
+        for index, hoy in enumerate(hours_of_year):
+            value_index.setdefault(hoy, index)
 
         # update values
-        updated_count = 0
         for data in self.data:
-            try:
-                # find matching index for input data
-                index = hours_of_year.index(data.datetime.hoy)
-            except ValueError:
-                continue
-            else:
-                # update the value
+            index = value_index.get(data.datetime.hoy)
+            if index is not None:
                 data.value = values[index]
-                updated_count += 1
-
-        print("%s updated for %d hour%s." %
-              ('Values are' if len(values) > 1 else 'Value is',
-               updated_count,
-               's' if len(values) > 1 else ''))
 
         # return self for chaining methods
         return self
@@ -384,6 +952,10 @@ class DataCollection(object):
                 which case the value at each timestep is the value over
                 that timestep (instead of over the hour). The default is set to
                 False to yeild average values in between each of the hours.
+
+        Returns:
+            A list of data points. Use interpolate_to_timestep to get a data
+            collection without creating the data points.
         """
         assert self.header is not None, 'Header cannot be None for interpolation.'
         assert timestep % self.header.analysis_period.timestep == 0, \
@@ -392,31 +964,70 @@ class DataCollection(object):
         assert isinstance(cumulative, bool), \
             'Expected Boolean got {}'.format(type(cumulative))
 
-        _minutes_step = int(60 / int(timestep / self.header.analysis_period.timestep))
-        _data_length = len(self.data)
-        # generate new data
-        _data = [
-            self[d].__class__(_v, self[d].datetime.add_minute(step * _minutes_step))
-            for d in xrange(_data_length)
-            for _v, step in zip(self.xxrange(self[d],
-                                             self[(d + 1) % _data_length],
-                                             timestep),
-                                xrange(timestep))
-            ]
+        factor = timestep // self.header.analysis_period.timestep
+        values = self._interpolated_values(factor, cumulative)
+        minutes_step = 60 // timestep
+        leap_year = self.header.analysis_period.is_leap_year
+        moys = (moy + step * minutes_step
+                for moy in self.moys for step in xrange(factor))
+        return [DataPoint(v, DateTime.from_moy(moy, leap_year))
+                for v, moy in zip(values, moys)]
+
+    def interpolate_to_timestep(self, timestep, cumulative=False, method='linear'):
+        """Return a new collection for a finer timestep using interpolation.
+
+        Values are interpolated as a list and the datetimes of the new collection
+        come from its analysis period so no data point is created.
+
+        Args:
+            timestep: Target timestep as an integer. Target timestep must be
+                divisable by current timestep.
+            cumulative: A boolean that sets whether the interpolation
+                should treat the data colection values as cumulative, in
+                which case the value at each timestep is the value over
+                that timestep (instead of over the hour). The default is set to
+                False to yeild average values in between each of the hours.
+            method: Interpolation method. linear or monotone for a cubic
+                interpolation which doesn't overshoot the values (Default: linear).
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            dbt = epw.dry_bulb_temperature.interpolate_to_timestep(6, method='monotone')
+        """
+        ap = self.header.analysis_period if self.header else None
+        if ap is None or len(self) != len(ap):
+            raise ValueError('Only collections with values for all the timesteps of '
+                             'their analysis period can be interpolated.')
+        if timestep % ap.timestep != 0:
+            raise ValueError(
+                'Target timestep({}) must be divisable by current timestep({})'
+                .format(timestep, ap.timestep))
+        if method not in _INTERPOLATION_METHODS:
+            raise ValueError('Invalid interpolation method "%s". Valid methods are: %s'
+                             % (method, ', '.join(_INTERPOLATION_METHODS)))
+
+        values = self._interpolated_values(timestep // ap.timestep, cumulative, method)
+        header = self.header.duplicate()
+        header.analysis_period = AnalysisPeriod(
+            ap.st_month, ap.st_day, ap.st_hour, ap.end_month, ap.end_day, ap.end_hour,
+            timestep, ap.is_leap_year)
+        return CompactDataCollection(values, header)
+
+    def _interpolated_values(self, factor, cumulative=False, method='linear'):
+        """Return a list of interpolated values for factor values in each timestep."""
+        values = _interpolate(self.values, factor, method)
 
         # divide cumulative values by timestep
-        if cumulative is True:
-            for i, d in enumerate(_data):
-                _data[i].value = d.value / timestep
+        if cumulative:
+            values = [v / factor for v in values]
 
         # shift data if half-hour interpolation has been selected.
         if self.header.middle_hour is True:
-            shift_dist = int(timestep / 2)
-            _data = _data[-shift_dist:] + _data[:-shift_dist]
-            for i, d in enumerate(_data):
-                _data[i - shift_dist].datetime = d.datetime
+            shift_dist = int(factor / 2)
+            values = values[-shift_dist:] + values[:-shift_dist]
 
-        return _data
+        return values
 
     @staticmethod
     def xxrange(start, end, step_count):
@@ -442,7 +1053,12 @@ class DataCollection(object):
            DBT = epw.dry_bulb_temperature
            filteredDBT = DBT.filter_by_analysis_period(analysis_period)
         """
-        if analysis_period.timestep != 1:
+        if not analysis_period:
+            return self.duplicate()
+
+        ap = self.header.analysis_period if self.header else None
+        timestep = ap.timestep if ap else 1
+        if analysis_period.timestep != timestep:
             # interpolate data for smaller timestep
             _int_data = self.interpolate_data(timestep=analysis_period.timestep)
             # create a new header
@@ -452,7 +1068,7 @@ class DataCollection(object):
         else:
             _data = self
 
-        if not analysis_period or analysis_period.is_annual:
+        if analysis_period.is_annual:
             return _data.duplicate()
 
         # create a new filtered_data
@@ -478,9 +1094,21 @@ class DataCollection(object):
            DBT = epw.dry_bulb_temperature
            filteredDBT = DBT.filter_by_moys(moys)
         """
-        # There is no guarantee that data is continuous so I iterate through the
-        # each data point one by one
-        _filtered_data = [d for d in self.data if d.datetime.moy in moys]
+        data = self.data
+        moys = set(moys)
+        ap = self.header.analysis_period if self.header else None
+        _filtered_data = None
+        if ap and ap.is_annual and len(data) == len(ap):
+            # data should be continuous. calculate the indices from the moys and
+            # check that the data points at the indices are for the same moys.
+            step = 60 // ap.timestep
+            indices = _annual_indices(moys, ap.timestep, len(data))
+            if all(data[i].datetime.moy == i * step for i in indices):
+                _filtered_data = [data[i] for i in indices]
+        if _filtered_data is None:
+            # There is no guarantee that data is continuous so I iterate through
+            # the each data point one by one
+            _filtered_data = [d for d in data if d.datetime.moy in moys]
 
         # create a new filtered_data
         if self.header:
@@ -509,12 +1137,20 @@ class DataCollection(object):
         _moys = tuple(int(hour * 60) for hour in hoys)
         return self.filter_by_moys(_moys)
 
-    def filter_by_conditional_statement(self, statement):
+    def filter_by_conditional_statement(self, statement, variables=None):
         """Filter the list based on a conditional statement.
 
+        The statement is compiled once and evaluated for all the values. Only
+        comparisons, boolean and arithmetic operations between the variables and
+        numbers are allowed in the statement.
+
         Args:
            statement: A conditional statement as a string (e.g. x>25 and x%5==0).
-            The variable should always be named as x
+            The variable for the values of this collection should always be
+            named as x.
+           variables: An optional dictionary of variable names and data
+            collections that are aligned with this collection to be used in the
+            statement (e.g. {'rh': relative_humidity}).
 
         Return:
             A new _dataList with filtered data
@@ -527,31 +1163,33 @@ class DataCollection(object):
            filtered_DBT = DBT.filter_by_conditional_statement('x > 25')
            # get the list of time stamps that meet the conditional statement
            print(filtered_DBT.time_stamps)
+           # filter data for when it is hot and dry
+           filtered_DBT = DBT.filter_by_conditional_statement(
+               'x > 25 and rh < 40', {'rh': epw.relative_humidity})
         """
-        def check_input_statement(statement):
-            st_statement = statement.lower() \
-                .replace("and", "").replace("or", "") \
-                .replace("not", "").replace("in", "").replace("is", "")
-
-            parsed_st = [s for s in st_statement if s.isalpha()]
-            if list(set(parsed_st)) != ['x']:
-                statement_error_msg = 'Invalid input statement. ' + \
-                    'Statement should be a valid Python statement' + \
-                    ' and the variable should be named as x'
-                raise ValueError(statement_error_msg)
-
-        check_input_statement(statement)
-
-        statement = statement.replace('x', 'd.value')
-        _filtered_data = [d for d in self.data if eval(statement)]
-
-        # create a new filtered_data
-        if self.header:
-            _filteredHeader = self.header.duplicate()
-            _filteredHeader.analysis_period = None
-            return DataCollection(_filtered_data, _filteredHeader)
-        else:
-            return DataCollection(_filtered_data)
+        return self.filter_by_pattern(
+            self._statement_pattern(statement, variables))
+
+    def _statement_pattern(self, statement, variables=None):
+        """Return a list of booleans for values that meet a conditional statement."""
+        names = ['x']
+        columns = [self.values]
+        for name, collection in sorted((variables or {}).items()):
+            if name in names:
+                raise ValueError('Variable %s is already used for values of this '
+                                 'collection.' % name)
+            values = self._values_of(collection)
+            if values is None:
+                raise ValueError('Variable %s should be a data collection not a %s.'
+                                 % (name, type(collection).__name__))
+            names.append(name)
+            columns.append(values)
+
+        condition = _compile_statement(statement, names)
+        try:
+            return [bool(v) for v in map(condition, *columns)]
+        except (TypeError, ArithmeticError) as e:
+            raise ValueError('Failed to evaluate %s:\n\t%s' % (statement, e))
 
     def filter_by_pattern(self, pattern):
         """Filter the list based on a list of Boolean.
@@ -599,7 +1237,7 @@ class DataCollection(object):
 
     def average_monthly(self):
         """Return a dictionary of values for average values for available months."""
-        return self.average_data_monthly(self.data)
+        return self.aggregate('month', 'mean')
 
     def average_data_monthly_for_each_hour(self, data):
         """Calculate average value for each hour during each month.
@@ -627,35 +1265,619 @@ class DataCollection(object):
 
         This method returns a dictionary with nested dictionaries for each hour
         """
-        return self.average_data_monthly_for_each_hour(self.data)
+        averaged_monthly_values_per_hour = OrderedDict()
+        for (month, hour), value in self.aggregate(('month', 'hour'), 'mean').items():
+            try:
+                averaged_monthly_values_per_hour[month][hour] = value
+            except KeyError:
+                averaged_monthly_values_per_hour[month] = OrderedDict([(hour, value)])
+        return averaged_monthly_values_per_hour
+
+    def aggregate(self, by=('month',), funcs=('mean',)):
+        """Calculate statistics of values grouped by month, day or hour in one pass.
+
+        The groups are calculated from minutes of the year and all the statistics
+        for all the groups are calculated together without creating datetimes.
+        Only the groups with values are included in the results.
+
+        Args:
+            by: A key or a tuple of keys to group the values. Valid keys are month
+                (1-12), day (day of the year 1-366) and hour (hour of the day 0-23)
+                (Default: ('month',)).
+            funcs: A statistic or a tuple of statistics to be calculated for each
+                group. Valid statistics are mean, min, max, sum, count and std
+                which is the population standard deviation (Default: ('mean',)).
+
+        Returns:
+            An OrderedDict of statistics for each group sorted by the keys. Keys of
+            the dictionary are tuples of values for by, or a single value if by is
+            a single key. If funcs is a single statistic the values of the
+            dictionary are the statistic, otherwise they are OrderedDicts of the
+            statistics.
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            stats = epw.dry_bulb_temperature.aggregate(('month', 'hour'),
+                                                       ('mean', 'min', 'max'))
+            print(stats[(7, 14)]['max'])  # maximum temperature of July at 2 PM
+            monthly_total = epw.global_horizontal_radiation.aggregate('month', 'sum')
+        """
+        single_key = isinstance(by, basestring)
+        by = (by,) if single_key else tuple(by)
+        for key in by:
+            if key not in _AGGREGATION_KEYS:
+                raise ValueError('Invalid key "%s". Valid keys are: %s'
+                                 % (key, ', '.join(_AGGREGATION_KEYS)))
+        single_func = isinstance(funcs, basestring)
+        funcs = (funcs,) if single_func else tuple(funcs)
+        for func in funcs:
+            if func not in _AGGREGATION_FUNCS:
+                raise ValueError('Invalid statistic "%s". Valid statistics are: %s'
+                                 % (func, ', '.join(_AGGREGATION_FUNCS)))
+
+        values, groups = self._aggregation_groups(by)
+        stats = _statistics([getter(values) for key, getter in groups], funcs)
+
+        keys = [key[0] for key, getter in groups] if single_key \
+            else [key for key, getter in groups]
+        if single_func:
+            return OrderedDict(zip(keys, stats[0]))
+        return OrderedDict(
+            (key, OrderedDict(zip(funcs, row))) for key, row in zip(keys, zip(*stats)))
+
+    def resample(self, timestep, how='mean'):
+        """Return a new collection for a coarser timestep, days or months.
+
+        Each new value is calculated from the values from its datetime until the
+        next one (e.g. the value for 10:00 from 10:00 to 10:59 for an hourly
+        timestep).
+
+        Args:
+            timestep: Target number of values per hour which must be coarser
+                than the current timestep, daily for a value for each day or
+                monthly for a value for each month.
+            how: Statistic to calculate the new values. Valid statistics are
+                mean, min, max, sum, count and std (Default: mean).
+
+        Returns:
+            A compact data collection. Daily and monthly collections and
+            collections without a continuous analysis period keep the datetimes
+            of the values and their header doesn't have an analysis period.
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            daily_max = epw.dry_bulb_temperature.resample('daily', 'max')
+            monthly_ghr = epw.global_horizontal_radiation.resample('monthly', 'sum')
+        """
+        if how not in _AGGREGATION_FUNCS:
+            raise ValueError('Invalid statistic "%s". Valid statistics are: %s'
+                             % (how, ', '.join(_AGGREGATION_FUNCS)))
+        values, moys, leap_year = self._aggregation_data()
+        header = self.header.duplicate() if self.header else None
+        ap = header.analysis_period if header else None
+
+        if timestep == 'monthly':
+            month_of_day = _month_of_days(leap_year)
+            month_moys = [0]
+            for month in xrange(1, 12):
+                month_moys.append(month_of_day.index(month + 1) * 1440)
+            keys = [month_of_day[moy // 1440] for moy in moys]
+            groups = _group_keys(keys, False)
+            new_moys = [month_moys[key - 1] for key, getter in groups]
+        else:
+            if timestep == 'daily':
+                minutes = 1440
+            elif timestep in AnalysisPeriod.VALIDTIMESTEPS and \
+                    (ap is None or ap.timestep % timestep == 0):
+                minutes = 60 // timestep
+            else:
+                raise ValueError(
+                    'Invalid timestep: %s. Timestep should be daily, monthly or a '
+                    'valid timestep which is coarser than the current timestep.'
+                    % timestep)
+            groups = _group_keys([moy // minutes for moy in moys], False)
+            new_moys = [key * minutes for key, getter in groups]
+
+        new_values = _statistics([getter(values) for key, getter in groups], (how,))[0]
+        if header:
+            if ap is not None and timestep not in ('daily', 'monthly'):
+                new_ap = AnalysisPeriod(
+                    ap.st_month, ap.st_day, ap.st_hour, ap.end_month, ap.end_day,
+                    ap.end_hour, timestep, ap.is_leap_year)
+                if new_ap.moys == tuple(new_moys):
+                    header.analysis_period = new_ap
+                    return CompactDataCollection(new_values, header)
+            header.analysis_period = None
+        return CompactDataCollection(new_values, header, new_moys, leap_year)
+
+    def _aggregation_data(self):
+        """Return the values, the minutes of the year and a leap year boolean."""
+        datetimes = self.datetimes
+        leap_year = datetimes[0].year % 4 == 0 if datetimes else False
+        return self.values, [dt.moy for dt in datetimes], leap_year
+
+    def _aggregation_groups(self, by):
+        """Return the values and the sorted list of (key, getter) for groups."""
+        values, moys, leap_year = self._aggregation_data()
+        return values, _group_indices(moys, by, leap_year)
+
+    def _new_collection(self, values, header):
+        """Create a new data collection with the same datetimes as this collection.
+        """
+        return DataCollection.from_data_and_datetimes(values, self.datetimes, header)
+
+    def _values_of(self, other):
+        """Return values of a data collection which is aligned with this collection.
+
+        Returns None if other is not a data collection.
+        """
+        if not hasattr(other, 'isDataCollection'):
+            return None
+        if len(other) != len(self):
+            raise ValueError(
+                'Length of data collections does not match: %d != %d'
+                % (len(self), len(other)))
+        if other.moys != self.moys:
+            raise ValueError('Datetimes of data collections are not aligned.')
+        return other.values
+
+    def _derived_header(self, other, symbol, reverse=False):
+        """Return a header for the result of an operation between two collections.
+
+        Other can also be a number. Units which can't be derived are set to None.
+        """
+        if not self.header:
+            return None
+        header = self.header.duplicate()
+        other_header = getattr(other, 'header', None)
+        if not hasattr(other, 'isDataCollection'):
+            # operations with a number only change the unit for power and division
+            if symbol == '^':
+                header.unit = None if reverse or not self.header.unit else \
+                    '%s^%s' % (self.header.unit, other)
+            elif symbol == '/' and reverse:
+                header.unit = '1/%s' % self.header.unit if self.header.unit else None
+            return header
+        if not other_header:
+            return header
+        if symbol in ('+', '-', 'min', 'max'):
+            if self.header.unit and other_header.unit and \
+                    self.header.unit != other_header.unit:
+                raise ValueError(
+                    'Cannot apply %s to collections with different units: %s and %s'
+                    % (symbol, self.header.unit, other_header.unit))
+            return header
+        # multiplication, division and power change the data type and unit
+        header.data_type = '%s %s %s' % (self.header.data_type, symbol,
+                                         other_header.data_type) \
+            if self.header.data_type and other_header.data_type else None
+        header.unit = '%s%s%s' % (self.header.unit, symbol, other_header.unit) \
+            if self.header.unit and other_header.unit and symbol != '^' else None
+        return header
+
+    def _operate(self, other, op, symbol, reverse=False):
+        """Apply an operator between the values of this collection and a number
+        or another collection and return the result as a new collection.
+        """
+        values = self.values
+        other_values = self._values_of(other)
+        if other_values is None:
+            if reverse:
+                result = [op(other, v) for v in values]
+            else:
+                result = [op(v, other) for v in values]
+        else:
+            result = list(map(op, values, other_values))
+        return self._new_collection(
+            result, self._derived_header(other, symbol, reverse))
+
+    def _compare(self, other, op):
+        """Compare values of this collection with a number or another collection.
+
+        Returns a list of booleans which can be used with filter_by_pattern.
+        """
+        other_values = self._values_of(other)
+        if other_values is None:
+            return [op(v, other) for v in self.values]
+        return list(map(op, self.values, other_values))
+
+    def minimum(self, other):
+        """Return a new collection with the smaller value of the two for each value.
+
+        Args:
+            other: A number or a data collection aligned with this collection.
+        """
+        return self._operate(other, min, 'min')
+
+    def maximum(self, other):
+        """Return a new collection with the larger value of the two for each value.
+
+        Args:
+            other: A number or a data collection aligned with this collection.
+        """
+        return self._operate(other, max, 'max')
+
+    def clip(self, lower=None, upper=None):
+        """Return a new collection with the values limited between lower and upper.
+
+        Args:
+            lower: Lower limit for values (Default: None for no lower limit).
+            upper: Upper limit for values (Default: None for no upper limit).
+        """
+        values = self.values
+        if lower is not None:
+            values = [v if v > lower else lower for v in values]
+        if upper is not None:
+            values = [v if v < upper else upper for v in values]
+        header = self.header.duplicate() if self.header else None
+        return self._new_collection(values, header)
+
+    def to_ip(self):
+        """Return a new data collection with the values and the unit in IP.
+
+        The conversion function of the unit of the header is applied to all the
+        values at once and the data points are not created. Missing values of epw
+        fields (e.g. 9999 for radiation) are not converted.
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            dbt = epw.dry_bulb_temperature.to_ip()
+            print(dbt.header.unit)  # F
+        """
+        return self._to_standard('IP')
+
+    def to_si(self):
+        """Return a new data collection with the values and the unit in SI."""
+        return self._to_standard('SI')
+
+    def _to_standard(self, standard):
+        """Return a new data collection with the values and the unit in a standard."""
+        if not self.header:
+            raise ValueError('Unit of the data collection is unknown.')
+        if not self.header.unit:
+            # values with no unit are the same in both standards
+            return self.duplicate()
+        unit, convert = unit_conversion(self.header.unit, standard,
+                                        self.header.data_type)
+        header = self.header.duplicate()
+        header.unit = unit
+        if convert is None:
+            # values are the same in both units. keep them as they are (e.g. ints)
+            collection = self.duplicate()
+            collection.header = header
+            return collection
+        return self._new_collection(list(map(convert, self.values)), header)
+
+    def _steps_per_hour(self):
+        """Return number of values in an hour based on the analysis period."""
+        ap = self.header.analysis_period if self.header else None
+        return ap.timestep if ap else 1
+
+    def _is_continuous_annual(self):
+        """Check if the collection has values for all the timesteps of a year."""
+        ap = self.header.analysis_period if self.header else None
+        return ap is not None and ap.is_annual and len(self) == len(ap)
+
+    def _check_wrap(self, wrap):
+        """Return wrap for rolling calculations. Default is True for annual data."""
+        if wrap is None:
+            return self._is_continuous_annual()
+        if wrap and not self._is_continuous_annual():
+            raise ValueError('Values can only wrap around the end of the year for '
+                             'collections with values for the whole year.')
+        return wrap
+
+    def rolling(self, hours, func='mean', wrap=None):
+        """Return a new collection of a statistic of values in a moving window.
+
+        The window ends at each value and covers the values for the number of
+        hours before it. The window is converted to a number of values with the
+        timestep of the analysis period. Each value is added and removed from
+        the window once so the calculation time does not depend on the window.
+
+        Args:
+            hours: Length of the moving window in hours (e.g. 72).
+            func: Statistic for the values in the window. Valid statistics are
+                mean, min, max and sum (Default: mean).
+            wrap: A boolean to use the values from the end of the year for the
+                windows at the start of the year. Default is True for annual
+                collections. If False, windows at the start of the collection only
+                include the available values.
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            # maximum temperature in the last 72 hours for every hour
+            max_72 = epw.dry_bulb_temperature.rolling(72, 'max')
+        """
+        if func not in _ROLLING_FUNCS:
+            raise ValueError('Invalid statistic "%s". Valid statistics are: %s'
+                             % (func, ', '.join(_ROLLING_FUNCS)))
+        count = int(round(hours * self._steps_per_hour()))
+        if count < 1:
+            raise ValueError('Window should include at least one value.')
+        values = self.values
+        length = len(values)
+        if self._check_wrap(wrap):
+            # start the windows with values from the end of the year
+            lead = min(count - 1, length)
+            values = values[length - lead:] + values
+        else:
+            lead = 0
+
+        if func in ('mean', 'sum'):
+            result = _rolling_sum(values, count)
+            if func == 'mean':
+                result = [total / float(min(i + 1, count))
+                          for i, total in enumerate(result)]
+        else:
+            result = _rolling_extreme(
+                values, count, operator.lt if func == 'min' else operator.gt)
+
+        header = self.header.duplicate() if self.header else None
+        return self._new_collection(result[lead:], header)
+
+    def running_mean(self, alpha, wrap=None):
+        """Return a new collection of the exponentially weighted running mean.
+
+        Each running mean value is alpha * value + (1 - alpha) * previous running
+        mean. Use daily values for a running mean outdoor temperature based on
+        daily means.
+
+        Args:
+            alpha: Weight of the current value between 0 and 1. Larger values
+                follow the changes in values faster.
+            wrap: A boolean to start the running mean from the running mean at the
+                end of the year. Default is True for annual collections. If False,
+                the running mean starts from the first value.
+        """
+        if not 0 < alpha <= 1:
+            raise ValueError('alpha should be between 0 and 1. Got %s' % alpha)
+        values = self.values
+        beta = 1 - alpha
+        mean = values[0] if values else 0
+        if self._check_wrap(wrap):
+            # run the year once to get the running mean for the end of the year
+            for v in values:
+                mean = alpha * v + beta * mean
+        result = []
+        for v in values:
+            mean = alpha * v + beta * mean
+            result.append(mean)
+
+        header = self.header.duplicate() if self.header else None
+        return self._new_collection(result, header)
+
+    def cumulative_sum(self):
+        """Return a new collection of the sum of values up to each value.
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            ghr = epw.global_horizontal_radiation
+            # total radiation from the start of the year for every hour
+            total_ghr = ghr.cumulative_sum()
+        """
+        result = []
+        total = 0
+        for v in self.values:
+            total += v
+            result.append(total)
+        header = self.header.duplicate() if self.header else None
+        return self._new_collection(result, header)
+
+    def __add__(self, other):
+        return self._operate(other, operator.add, '+')
+
+    def __radd__(self, other):
+        return self._operate(other, operator.add, '+', True)
+
+    def __sub__(self, other):
+        return self._operate(other, operator.sub, '-')
+
+    def __rsub__(self, other):
+        return self._operate(other, operator.sub, '-', True)
+
+    def __mul__(self, other):
+        return self._operate(other, operator.mul, '*')
+
+    def __rmul__(self, other):
+        return self._operate(other, operator.mul, '*', True)
+
+    def __truediv__(self, other):
+        return self._operate(other, operator.truediv, '/')
+
+    def __rtruediv__(self, other):
+        return self._operate(other, operator.truediv, '/', True)
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, other):
+        return self._operate(other, operator.pow, '^')
+
+    def __rpow__(self, other):
+        return self._operate(other, operator.pow, '^', True)
+
+    def __neg__(self):
+        header = self.header.duplicate() if self.header else None
+        return self._new_collection([-v for v in self.values], header)
+
+    def __abs__(self):
+        header = self.header.duplicate() if self.header else None
+        return self._new_collection([abs(v) for v in self.values], header)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
 
     def __len__(self):
-        return len(self._data)
+        return len(self.data)
 
     def __getitem__(self, key):
-        return self._data[key]
+        return self.data[key]
 
     def __setitem__(self, key, value):
         raise TypeError('Use update_data_for_an_hour to set the values.')
 
     def __delitem__(self, key):
-        del self._data[key]
+        del self.data[key]
 
     def __iter__(self):
-        return iter(self._data)
+        return iter(self.data)
 
     def __reversed__(self):
-        return reversed(self._data)
+        return reversed(self.data)
 
     def __contains__(self, item):
-        return item in self._data
+        return item in self.data
 
     def to_json(self):
-        """Convert data collection to a dictionary."""
-        return {
-            'data': [d.to_json() for d in self._data],
-            'header': self.header.to_json() if self.header else {}
+        """Convert data collection to a dictionary.
+
+        Values are written as a flat list. Datetimes are only written as minutes of
+        the year if they are not the same as the analysis period of the header.
+        Properties of individual data points (e.g. nickname) are not written.
+        """
+        data, values, moys = self._serialization_data()
+        if values is not None:
+            data['values'] = values.tolist() if hasattr(values, 'tolist') \
+                else list(values)
+        if moys is not None:
+            data['moys'] = list(moys)
+        return data
+
+    def _serialization_data(self):
+        """Return the json document without values and moys, the values and the moys.
+
+        Values are None if the data points are written in the document and moys
+        are None if they are the same as the analysis period of the header.
+        """
+        if self._data is not None and any(d.datetime is None for d in self._data):
+            # minutes of the year are unknown. write the data points.
+            return {
+                'data': [d.to_json() for d in self._data],
+                'header': self.header.to_json() if self.header else {}
+            }, None, None
+        values, moys, is_leap_year = self._aggregation_data()
+        data = {
+            'version': self.JSON_VERSION,
+            'header': self.header.to_json() if self.header else None
         }
+        ap = self.header.analysis_period if self.header else None
+        if not ap or tuple(moys) != ap.moys:
+            data['is_leap_year'] = is_leap_year
+        else:
+            moys = None
+        return data, values, moys
+
+    def to_bytes(self):
+        """Convert the data collection to bytes.
+
+        The bytes start with a small binary header followed by the json document of
+        the collection. Values and minutes of the year are written as packed arrays
+        at the end so the size is about the size of the values.
+
+        Usage:
+
+            data = epw.dry_bulb_temperature.to_bytes()
+            dbt = DataCollection.from_bytes(data)
+        """
+        data, values, moys = self._serialization_data()
+        columns = []
+        if values is not None:
+            if not isinstance(values, array):
+                typecode = getattr(values, 'format', 'd')
+                try:
+                    values = array(typecode if typecode in ('d', 'i') else 'd', values)
+                except TypeError:
+                    # non-numerical values are written in the json document
+                    data['values'] = list(values)
+            if isinstance(values, array):
+                columns.append(('values', values))
+        if moys is not None:
+            columns.append(('moys', array('i', moys)))
+
+        data['byteorder'] = sys.byteorder
+        data['columns'] = [(key, col.typecode, len(col)) for key, col in columns]
+        meta = json.dumps(data).encode('utf-8')
+        return b''.join(
+            [_BYTES_HEADER.pack(b'LBCOL', self.BYTESVERSION, len(meta)), meta] +
+            [_array_to_bytes(col) for key, col in columns])
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Create a data collection from bytes which are created using to_bytes.
+
+        Args:
+            data: Bytes of a data collection.
+        """
+        magic, version, meta_size = _BYTES_HEADER.unpack_from(data)
+        if magic != b'LBCOL' or version != cls.BYTESVERSION:
+            raise ValueError('Bytes are not a valid data collection.')
+        offset = _BYTES_HEADER.size
+        meta = json.loads(data[offset:offset + meta_size].decode('utf-8'))
+        offset += meta_size
+        swap = meta.pop('byteorder') != sys.byteorder
+        for key, typecode, count in meta.pop('columns'):
+            column = array(str(typecode))
+            size = column.itemsize * count
+            _array_from_bytes(column, data[offset:offset + size])
+            offset += size
+            if swap:
+                column.byteswap()
+            meta[key] = column
+        return cls.from_json(meta)
+
+    def __reduce__(self):
+        if self._data and all(
+                type(d) is DataPoint and d.datetime is not None and
+                d.standard == 'SI' and d.nickname is None for d in self._data):
+            # pickle the packed values instead of data points
+            return _collection_from_bytes, (self.to_bytes(), False)
+        # data points of other types or with more information are pickled as is
+        return type(self), (), self.__getstate__()
+
+    def __getstate__(self):
+        return self._header, self._data
+
+    def __setstate__(self, state):
+        self._header, self._data = state
+
+    def write_json(self, file_path, chunk_size=8760):
+        """Write the data collection to a json file.
+
+        Values are written in chunks so the whole json string is never created in
+        memory.
+
+        Args:
+            file_path: Full path to the json file.
+            chunk_size: Number of values to be written at once (Default: 8760).
+
+        Returns:
+            file_path.
+        """
+        data = self.to_json()
+        values = data.pop('values')
+        with open(file_path, 'w') as outf:
+            outf.write(json.dumps(data)[:-1] + ', "values": [')
+            for i in xrange(0, len(values), chunk_size):
+                if i:
+                    outf.write(', ')
+                outf.write(json.dumps(values[i:i + chunk_size])[1:-1])
+            outf.write(']}')
+        return file_path
 
     def isDataCollection(self):
         """Return True."""
@@ -671,6 +1893,315 @@ class DataCollection(object):
                 and self.header.analysis_period:
                     return "{} ({}) DataCollection\n{}\n...{} values...".format(
                         self.header.data_type, self.header.unit,
-                        self.header.analysis_period, len(self._data))
+                        self.header.analysis_period, len(self))
+        else:
+            return "DataCollection\n\n...{} values...".format(len(self))
+
+
+class CompactDataCollection(DataCollection):
+    """A data collection that keeps the values in a packed array.
+
+    Datetimes are not stored for each value and are derived from the analysis
+    period of the header or from a list of minutes of the year. Data points are
+    only created once they are requested (e.g. by iterating over the collection or
+    using the data property) and the collection uses the data points from then on
+    so the changes to the data points are respected.
+
+    Slicing, filtering and duplicating a compact collection return views which
+    share the values with this collection. Values are only copied once a view or
+    the collection is updated.
+
+    Args:
+        values: A list or an array of values.
+        header: A Ladybug header. The analysis period of the header is used to
+            calculate the datetimes if moys is not provided.
+        moys: An optional list of minutes of the year for values.
+        is_leap_year: A boolean to indicate if moys are for a leap year. Default
+            is the same as the analysis period of the header.
+
+    Usage:
+
+        ap = AnalysisPeriod(1, 1, 0, 1, 1, 2)
+        header = Header(data_type='Temperature', analysis_period=ap)
+        dbt = CompactDataCollection([20, 22, 21], header)
+        print(dbt.average_data())
+    """
+
+    __slots__ = ('_values', '_moys', '_is_leap_year', '_shared')
+
+    def __init__(self, values=None, header=None, moys=None, is_leap_year=None):
+        """Init class."""
+        self.header = header
+        self._data = None  # data points will be created on request
+        self._shared = False  # values are shared with a view or a duplicate
+        if is_leap_year is None:
+            ap = self.header.analysis_period if self.header else None
+            is_leap_year = ap.is_leap_year if ap else False
+        self._is_leap_year = is_leap_year
+        if isinstance(values, array):
+            self._values = values
+        else:
+            values = list(values or ())
+            try:
+                self._values = array('d', values)
+            except TypeError:
+                # non-numerical values (e.g. uncertainty flags in epw files)
+                self._values = values
+
+        if moys is not None:
+            self._moys = array('i', moys)
+        elif self.header is None:
+            raise ValueError(
+                'Either header or moys should be provided for a compact collection.')
+        else:
+            self._moys = None
+
+        num_of_moys = len(self._moys) if self._moys is not None \
+            else len(self.header.analysis_period)
+        if len(self._values) != num_of_moys:
+            raise ValueError(
+                'Length of values (%d) does not match the number of datetimes (%d).'
+                % (len(self._values), num_of_moys))
+
+    @property
+    def is_compact(self):
+        """Return True if the data points are not created yet."""
+        return self._data is None
+
+    @property
+    def moys(self):
+        """Return minutes of the year for values as a tuple."""
+        if self._data is not None:
+            return tuple(d.datetime.moy for d in self._data)
+        if self._moys is not None:
+            return tuple(self._moys)
+        return self.header.analysis_period.moys
+
+    @property
+    def datetimes(self):
+        """Return datetimes for this collection as a tuple."""
+        if self._data is not None:
+            return DataCollection.datetimes.fget(self)
+        return tuple(DateTime.from_moy(moy, self._is_leap_year) for moy in self.moys)
+
+    @property
+    def values(self):
+        """Return the list of numerical values."""
+        if self._data is not None:
+            return DataCollection.values.fget(self)
+        return list(self._values)
+
+    @property
+    def data(self):
+        """Return the list of data points.
+
+        Data points are created on the first call.
+        """
+        if self._data is None:
+            self._data = [DataPoint(v, dt)
+                          for v, dt in zip(self._values, self.datetimes)]
+            self._values = None
+            self._moys = None
+        return self._data
+
+    def _aggregation_data(self):
+        """Return the values, the minutes of the year and a leap year boolean."""
+        if self._data is not None:
+            return DataCollection._aggregation_data(self)
+        return self._values, self.moys, self._is_leap_year
+
+    def _aggregation_groups(self, by):
+        """Return the values and the sorted list of (key, getter) for groups."""
+        ap = self.header.analysis_period if self.header else None
+        if self._data is None and self._moys is None and ap.is_annual:
+            # all the annual collections with the same timestep share the groups
+            key = (by, ap.timestep, self._is_leap_year)
+            if key not in _ANNUAL_GROUPS:
+                _ANNUAL_GROUPS[key] = _group_indices(self.moys, by, self._is_leap_year)
+            return self._values, _ANNUAL_GROUPS[key]
+        return DataCollection._aggregation_groups(self, by)
+
+    def _new_collection(self, values, header):
+        """Create a new compact collection with the same datetimes as this collection.
+        """
+        if self._data is not None:
+            return DataCollection._new_collection(self, values, header)
+        return CompactDataCollection(values, header, self._moys, self._is_leap_year)
+
+    def duplicate(self):
+        """Duplicate current data collection.
+
+        The values are shared between the two collections until one of them is
+        updated.
+        """
+        if self._data is not None:
+            return DataCollection.duplicate(self)
+        return self._view(self._values, self._moys, self.header)
+
+    def _view(self, values, moys, header):
+        """Create a collection which shares the values of this collection."""
+        view = CompactDataCollection.__new__(CompactDataCollection)
+        view._header = header
+        view._data = None
+        view._values = values
+        view._moys = moys
+        view._is_leap_year = self._is_leap_year
+        view._shared = self._shared = True
+        return view
+
+    def _writable_values(self):
+        """Return the values to be updated in place.
+
+        Values are copied first if they are shared with a view or a duplicate.
+        """
+        values = self._values
+        if self._shared or not isinstance(values, (array, list)):
+            try:
+                values = array(_typecode_of(values), values)
+            except TypeError:
+                # non-numerical values
+                values = list(values)
+            self._values = values
+            self._shared = False
+        return values
+
+    def _moy_indices(self, moys):
+        """Return the sorted indices of values for a list of minutes of the year."""
+        ap = self.header.analysis_period if self.header else None
+        if self._moys is None and ap.is_annual:
+            # values are continuous. calculate the indices from the moys.
+            return _annual_indices(moys, ap.timestep, len(self._values))
+
+        moys = set(moys)
+        return [i for i, moy in enumerate(self.moys) if moy in moys]
+
+    def update_data_for_hours_of_year(self, values, hours_of_year):
+        """Update values new set of values for a list of hours of the year.
+
+        Length of values should be equal to number of hours in hours of year.
+
+        Args:
+            values: A list of values to be replaced in the file
+            hours_of_year: A list of hoy between 1 and 8760
+        """
+        if self._data is not None:
+            return DataCollection.update_data_for_hours_of_year(
+                self, values, hours_of_year)
+
+        # check length of data vs length of analysis hours_of_year
+        if len(values) != len(hours_of_year):
+            raise ValueError(
+                "Length of values %d is not equal to number of hours in analysis "
+                "period %d" % (len(values), len(hours_of_year)))
+
+        ap = self.header.analysis_period if self.header else None
+        count = len(self._values)
+        if self._moys is None and ap.is_annual:
+            # values are continuous. calculate the indices from the moys.
+            step = 60 // ap.timestep
+
+            def get_index(moy):
+                index, remainder = divmod(moy, step)
+                return index if remainder == 0 and 0 <= index < count else None
         else:
-            return "DataCollection\n\n...{} values...".format(len(self._data))
+            get_index = {moy: i for i, moy in enumerate(self.moys)}.get
+
+        # write the values in reverse order so the first value for an hour is kept
+        data = self._writable_values()
+        for hoy, value in zip(reversed(hours_of_year), reversed(values)):
+            index = get_index(int(round(hoy * 60)))
+            if index is None:
+                continue
+            try:
+                data[index] = value
+            except TypeError:
+                # float value for integer values
+                data = self._values = array('d', data)
+                data[index] = value
+
+        # return self for chaining methods
+        return self
+
+    def _filtered_collection(self, indices):
+        """Return a view of this collection for a slice or a sorted list of indices.
+
+        The view references the values of this collection and they are only copied
+        once the view or this collection is updated.
+        """
+        moys = self._moys if self._moys is not None else \
+            self.header.analysis_period.moys
+        header = None
+        if self.header:
+            header = self.header.duplicate()
+            header.analysis_period = None
+        return self._view(_view_of(self._values, indices), _view_of(moys, indices),
+                          header)
+
+    def filter_by_moys(self, moys):
+        """Filter the list based on a list of minutes of the year.
+
+        Args:
+           moys: A List of minutes of the year [0..8759 * 60]
+
+        Return:
+            A new compact collection with filtered data
+        """
+        if self._data is not None:
+            return DataCollection.filter_by_moys(self, moys)
+        return self._filtered_collection(self._moy_indices(moys))
+
+    def filter_by_pattern(self, pattern):
+        """Filter the list based on a list of Boolean.
+
+        Length of Boolean should be equal to length of values in _dataList
+
+        Args:
+            pattern: A list of True, False values
+
+        Return:
+            A new compact collection with filtered data
+        """
+        if self._data is not None:
+            return DataCollection.filter_by_pattern(self, pattern)
+        try:
+            _len = len(pattern)
+        except TypeError:
+            raise ValueError("pattern should be a list of values.")
+        indices = [i for i in xrange(len(self._values)) if pattern[i % _len]]
+        return self._filtered_collection(indices)
+
+    def average_data(self):
+        """Return average value for data collection."""
+        if self._data is not None:
+            return DataCollection.average_data(self)
+        return sum(self._values) / len(self._values)
+
+    def __len__(self):
+        if self._data is not None:
+            return len(self._data)
+        return len(self._values)
+
+    def __reduce__(self):
+        # pickle the packed values instead of data points
+        return _collection_from_bytes, (self.to_bytes(),)
+
+    def __getitem__(self, key):
+        if self._data is None and isinstance(key, slice):
+            return self._filtered_collection(key)
+        return DataCollection.__getitem__(self, key)
+
+
+def _collection_from_bytes(data, compact=True):
+    """Create a data collection from bytes when it is unpickled.
+
+    Bound class methods can't be pickled in python 2.
+
+    Args:
+        data: Bytes of a data collection which are created using to_bytes.
+        compact: A boolean to create a compact data collection or a data collection
+            with data points.
+    """
+    collection = DataCollection.from_bytes(data)
+    if compact:
+        return collection
+    return DataCollection(collection.data, collection.header)
@@ -107,20 +107,30 @@ class DataTypeBase(object):
         return self.unitSI if self.standard == 'SI' else \
             self.unitIP
 
-    @property
-    def to_ip(self):
+    @classmethod
+    def si_to_ip(cls, value):
         """Write a static method that converts a value from SI to IP."""
         raise NotImplementedError(
-            'to_ip is not implemented to %s' % self.__class__.__name__
+            'to_ip is not implemented to %s' % cls.__name__
         )
 
-    @property
-    def to_si(self):
+    @classmethod
+    def ip_to_si(cls, value):
         """Write a static method that converts a value from IP to SI."""
         raise NotImplementedError(
-            'to_si is not implemented to %s' % self.__class__.__name__
+            'to_si is not implemented to %s' % cls.__name__
         )
 
+    @property
+    def to_ip(self):
+        """Return the value in IP assuming the value is in SI."""
+        return self.si_to_ip(self.value)
+
+    @property
+    def to_si(self):
+        """Return the value in SI assuming the value is in IP."""
+        return self.ip_to_si(self.value)
+
     def convert_to_si(self):
         """Change value to SI.
 
@@ -172,7 +182,7 @@ class DataTypeBase(object):
 
         _isInRange = self.minimum <= value <= self.maximum \
             if self.standard == 'SI' \
-            else self.to_ip(self.minimum) <= value <= self.to_ip(self.maximum)
+            else self.si_to_ip(self.minimum) <= value <= self.si_to_ip(self.maximum)
 
         if _isInRange or not raise_exception:
             return _isInRange
@@ -347,15 +357,15 @@ class Temperature(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in F assuming input value is in C."""
-        return self.value * 9 / 5 + 32
+        return value * 9 / 5 + 32
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in C assuming input value is in F."""
-        return (self.value - 32) * 5 / 9
+        return (value - 32) * 5 / 9
 
 
 class DryBulbTemperature(Temperature):
@@ -410,15 +420,15 @@ class RelativeHumidity(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in IP."""
-        return self.value
+        return value
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in SI."""
-        return self.value
+        return value
 
 
 class Pressure(DataPoint):
@@ -443,15 +453,15 @@ class Pressure(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in IP."""
-        return self.value * 0.0002953
+        return value * 0.0002953
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in SI."""
-        return self.value / 0.0002953
+        return value / 0.0002953
 
 
 class Radiation(DataPoint):
@@ -475,15 +485,15 @@ class Radiation(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in IP assuming input value is in SI."""
-        return self.value * 0.316998331
+        return value * 0.316998331
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in SI assuming input value is in IP."""
-        return self.value / 0.316998331
+        return value / 0.316998331
 
 
 class Illuminance(DataPoint):
@@ -507,15 +517,15 @@ class Illuminance(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in IP assuming input value is in SI."""
-        return self.value * 0.09290304
+        return value * 0.09290304
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in SI assuming input value is in IP."""
-        return self.value / 0.09290304
+        return value / 0.09290304
 
 
 class Luminance(Illuminance):
@@ -562,15 +572,15 @@ class Angle(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in IP assuming input value is in SI."""
-        return (self.value * PI) / 360
+        return (value * PI) / 180
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in SI assuming input value is in IP."""
-        return (self.value / PI) * 360
+        return (value / PI) * 180
 
 
 class Speed(DataPoint):
@@ -594,15 +604,15 @@ class Speed(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in IP assuming input value is in SI."""
-        return self.value * 2.23694  # m/s to mph
+        return value * 2.23694  # m/s to mph
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in SI assuming input value is in IP."""
-        return self.value / 2.23694  # mph to m/s
+        return value / 2.23694  # mph to m/s
 
 
 class WindSpeed(Speed):
@@ -709,15 +719,15 @@ class Distance(DataPoint):
         """Init class."""
         DataPoint.__init__(self, value * conversion, datetime, standard, nickname)
 
-    @property
-    def to_ip(self):
+    @staticmethod
+    def si_to_ip(value):
         """Return the value in IP assuming input value is in SI."""
-        return self.value * 3.28084
+        return value * 3.28084
 
-    @property
-    def to_si(self):
+    @staticmethod
+    def ip_to_si(value):
         """Return the value in SI assuming input value is in IP."""
-        return self.value / 3.28084
+        return value / 3.28084
 
 
 class SkyPatch(DataPoint):
@@ -830,3 +840,106 @@ class Clothing(DataPoint):
     def __init__(self, value, datetime=None, standard='SI', nickname=None):
         """Init class."""
         DataPoint.__init__(self, value, datetime, standard, nickname)
+
+
+# units of epw fields which don't have a data type. (IP unit, SI to IP factor)
+_LENGTH_UNITS = {'mm': ('inch', 0.0393701), 'cm': ('inch', 0.393701),
+                 'km': ('mile', 0.621371)}
+_UNIT_CONVERSIONS = {}
+_EPW_FIELD_UNITS = {}  # SI unit and missing value of epw fields by name
+
+
+def _data_types(cls=DataTypeBase):
+    """Return all the subclasses of a data type."""
+    for sub_cls in cls.__subclasses__():
+        yield sub_cls
+        for sub_sub_cls in _data_types(sub_cls):
+            yield sub_sub_cls
+
+
+def _load_unit_conversions():
+    """Collect the units and the conversion functions of the data types."""
+    for data_type in _data_types():
+        si, ip = data_type.unitSI, data_type.unitIP
+        if not si or si in _UNIT_CONVERSIONS:
+            continue
+        if si == ip:
+            _UNIT_CONVERSIONS[si] = {'SI': (si, None), 'IP': (ip, None)}
+        else:
+            _UNIT_CONVERSIONS[si] = {'SI': (si, None), 'IP': (ip, data_type.si_to_ip)}
+            _UNIT_CONVERSIONS[ip] = {'SI': (si, data_type.ip_to_si), 'IP': (ip, None)}
+    for si, (ip, factor) in sorted(_LENGTH_UNITS.items()):
+        # inch is converted back to mm
+        _UNIT_CONVERSIONS[si] = {'SI': (si, None),
+                                 'IP': (ip, lambda v, f=factor: v * f)}
+        _UNIT_CONVERSIONS[ip] = {'SI': (si, lambda v, f=factor: v / f),
+                                 'IP': (ip, None)}
+    # units which are the same in both standards
+    for unit in ('degrees', 'hr', 'thousandths'):
+        _UNIT_CONVERSIONS[unit] = {'SI': (unit, None), 'IP': (unit, None)}
+
+
+def _load_epw_field_units():
+    """Collect the SI units and the missing values of the epw fields."""
+    # epw imports this module. the fields are imported on the first request.
+    from .epw import EPWFields
+    for field in EPWFields.FIELDS.values():
+        if field.get('unit'):
+            _EPW_FIELD_UNITS[field['name']] = (field['unit'], field.get('missing'))
+
+
+def unit_conversion(unit, standard, data_type=None):
+    """Get the unit and the function to convert values of a unit to a standard.
+
+    Args:
+        unit: Current unit of the values (e.g. C).
+        standard: Target standard. SI or IP.
+        data_type: Optional name of the data type (e.g. Snow Depth). Values of
+            epw fields are converted back to the SI unit of the field and the
+            missing value of the field (e.g. 999) is restored exactly when it is
+            converted back from IP.
+
+    Returns:
+        A tuple of (unit, function). Function converts a single value from the
+        input unit to the returned unit and is None if the unit is already in
+        the target standard.
+
+    Usage:
+
+        unit, to_ip = unit_conversion('C', 'IP')
+        print(unit, [to_ip(v) for v in (0, 100)])  # F [32.0, 212.0]
+    """
+    if standard not in ('SI', 'IP'):
+        raise ValueError('Invalid standard: {}. Choose SI or IP.'.format(standard))
+    if not _UNIT_CONVERSIONS:
+        _load_unit_conversions()
+    try:
+        target, convert = _UNIT_CONVERSIONS[unit][standard]
+    except KeyError:
+        raise ValueError('Unit conversion is not available for {}.'.format(unit))
+    if data_type is None or convert is None:
+        return target, convert
+
+    if not _EPW_FIELD_UNITS:
+        _load_epw_field_units()
+    si, missing = _EPW_FIELD_UNITS.get(data_type, (None, None))
+    if standard == 'SI' and si != target and si in _LENGTH_UNITS and \
+            _LENGTH_UNITS[si][0] == unit:
+        # several SI units have the same IP unit (e.g. mm and cm to inch)
+        target, convert = si, lambda v, f=_LENGTH_UNITS[si][1]: v / f
+    if missing is not None and standard == 'SI' and target == si:
+        ip, to_ip = _UNIT_CONVERSIONS[si]['IP']
+        if ip == unit and to_ip is not None:
+            convert = _restore_missing(convert, to_ip(missing), missing)
+    return target, convert
+
+
+def _restore_missing(convert, ip_missing, missing):
+    """Return a conversion function which converts the IP missing value exactly.
+
+    The missing value is converted to IP like any other value. Converting it back
+    to SI can be off by a rounding error which makes it a valid value again.
+    """
+    def convert_value(value):
+        return missing if value == ip_missing else convert(value)
+    return convert_value
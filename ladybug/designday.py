@@ -1,5 +1,5 @@
 from .location import Location
-from .futil import write_to_file
+from .futil import write_to_file, is_archive, open_archive_member
 from .dt import DateTime
 from .header import Header
 from .datacollection import DataCollection
@@ -46,7 +46,18 @@ class DDY(object):
 
         args:
             file_path: A string representing a complete path to the .ddy file.
+                It can also be a file object to read the ddy data from.
         """
+        if hasattr(file_path, 'read'):
+            ddytxt = file_path.read()
+            if isinstance(ddytxt, bytes) and not isinstance(ddytxt, str):
+                ddytxt = ddytxt.decode('utf-8', 'ignore')
+            cls_ = cls._from_ddy_text(ddytxt)
+            name = getattr(file_path, 'name', None)
+            if isinstance(name, str):
+                cls_._file_path = os.path.normpath(name)
+            return cls_
+
         # check that the file is there
         if not os.path.isfile(file_path):
             raise ValueError(
@@ -69,6 +80,36 @@ class DDY(object):
 
         try:
             ddytxt = ddywin.read()
+        finally:
+            ddywin.close()
+
+        cls_ = cls._from_ddy_text(ddytxt)
+        cls_._file_path = os.path.normpath(file_path)
+        return cls_
+
+    @classmethod
+    def from_archive(cls, archive_path, member=None):
+        """Initalize from a ddy file inside a .zip or a .gz file without extracting it.
+
+        args:
+            archive_path: A string representing a complete path to the archive.
+            member: Name of the ddy file inside a zip file. Default is the first
+                ddy file in the archive.
+        """
+        if not is_archive(archive_path):
+            raise ValueError('{} is not a .zip or a .gz file.'.format(archive_path))
+
+        with open_archive_member(archive_path, member, '.ddy') as ddywin:
+            ddytxt = ddywin.read()
+
+        cls_ = cls._from_ddy_text(ddytxt)
+        cls_._file_path = os.path.normpath(archive_path)
+        return cls_
+
+    @classmethod
+    def _from_ddy_text(cls, ddytxt):
+        """Initalize from the text content of a ddy file."""
+        try:
             location_format = re.compile(
                 r"(Site:Location,(.|\n)*?((;\s*!)|(;\s*\n)|(;\n)))")
             design_day_format = re.compile(
@@ -87,12 +128,8 @@ class DDY(object):
             location = Location.from_location(location_matches[0][0])
             design_days = [DesignDay.from_ep_string(
                 match[0], location) for match in des_day_matches]
-        finally:
-            ddywin.close()
 
-        cls_ = cls(location, design_days)
-        cls_._file_path = os.path.normpath(file_path)
-        return cls_
+        return cls(location, design_days)
 
     @classmethod
     def from_design_day(cls, design_day):
@@ -17,6 +17,8 @@ class DateTime(datetime):
 
     __slots__ = ()
 
+    _DAYSBEFOREMONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+
     def __new__(cls, month=1, day=1, hour=0, minute=0, leap_year=False):
         """Create Ladybug datetime.
 
@@ -128,7 +130,11 @@ class DateTime(datetime):
     @property
     def doy(self):
         """Calculate day of the year for this date time."""
-        return self.timetuple().tm_yday
+        doy = self._DAYSBEFOREMONTH[self.month - 1] + self.day
+        if self.month > 2 and self.year % 4 == 0 and \
+                (self.year % 100 != 0 or self.year % 400 == 0):
+            doy += 1
+        return doy
 
     @property
     def hoy(self):
@@ -195,6 +201,11 @@ class DateTime(datetime):
         """
         return self.add_hour(-hour)
 
+    def __reduce_ex__(self, protocol):
+        """Pickle the arguments of the constructor."""
+        return self.__class__, (self.month, self.day, self.hour, self.minute,
+                                self.year == 2016)
+
     def to_simple_string(self, separator="_"):
         """Return a simplified string."""
         return self.strftime('%d_%b_%H_%M').replace("_", separator)
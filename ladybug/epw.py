@@ -3,26 +3,62 @@ from .location import Location
 from .analysisperiod import AnalysisPeriod
 from .datatype import DataPoint  # Temperature, RelativeHumidity, Radiation, Illuminance
 from .header import Header
-from .datacollection import DataCollection
+from .epwheader import DesignConditions, TypicalPeriod, GroundTemperature, \
+    HolidaysDaylightSavings, DataPeriod
+from .datacollection import DataCollection, CompactDataCollection
 from .dt import DateTime
-from .futil import write_to_file
-
+from .futil import write_to_file, preparedir, is_archive, find_archive_member, \
+    open_archive_member
+
+from array import array
+from collections import namedtuple, deque
+from itertools import chain
+import hashlib
+import io
+import json
 import os
 import copy
+import struct
 import sys
 readmode = 'rb'
-if (sys.version_info > (3, 0)):
+writemode = 'wb'
+try:
+    from itertools import izip as zip
+except ImportError:
+    # python 3
     xrange = range
     readmode = 'r'
+    writemode = 'w'
+
+# magic, version, epw file size, epw file modified time, json document size
+_CACHE_HEADER = struct.Struct('<5sBQdI')
 
 
 class EPW(object):
     """Import epw data from a local epw file.
 
     args:
-        file_path: Local file address to an epw file.
+        file_path: Local file address to an epw file. It can also be a path to a
+            .zip or a .gz file with an epw file inside or a file object to read
+            the epw data from.
+        lazy: Set to True to only tokenize the data lines when the data is
+            loaded. Each field will be converted to values on the first request.
+            This is useful when only a few fields of the file are needed
+            (Default: False).
+        cache_dir: An optional folder to keep a binary copy of the parsed data.
+            The cache for a file is used as long as the size and the modified
+            time of the epw file do not change. Loading data from the cache
+            skips parsing the text file. In lazy mode the cache only keeps the
+            fields which are converted when the file is loaded (Default: None).
 
     properties:
+        design_conditions
+        typical_extreme_periods
+        ground_temperatures
+        holidays_daylight_savings
+        comments_1
+        comments_2
+        data_periods
         years
         dry_bulb_temperature
         dew_point_temperature
@@ -56,26 +92,126 @@ class EPW(object):
         sky_temperature
     """
 
-    def __init__(self, file_path):
-        """Init class."""
-        self._file_path = os.path.normpath(file_path)
-        if not os.path.isfile(self._file_path):
-            raise ValueError(
-                'Cannot find an epw file at {}'.format(self._file_path))
-        if not file_path.lower().endswith('epw'):
-            raise TypeError('{} is not an .epw file.'.format(file_path))
+    CACHEVERSION = 1
 
+    def __init__(self, file_path, lazy=False, cache_dir=None):
+        """Init class."""
+        self._content = None  # content of the file for file objects
+        self._archive_member = None  # name of epw file inside an archive
+        if hasattr(file_path, 'read'):
+            content = file_path.read()
+            if isinstance(content, bytes) and not isinstance(content, str):
+                content = content.decode('utf-8', 'ignore')
+            self._content = content
+            name = getattr(file_path, 'name', None)
+            self._file_path = os.path.normpath(name) \
+                if isinstance(name, str) else None
+            # there is no file to validate the cache
+            cache_dir = None
+        else:
+            self._file_path = os.path.normpath(file_path)
+            if not os.path.isfile(self._file_path):
+                raise ValueError(
+                    'Cannot find an epw file at {}'.format(self._file_path))
+            if is_archive(file_path):
+                self._archive_member = find_archive_member(file_path, '.epw')
+            elif not file_path.lower().endswith('epw'):
+                raise TypeError('{} is not an .epw file.'.format(file_path))
+
+        self._lazy = lazy
+        self._cache_dir = cache_dir
         self._is_data_loaded = False
         self._is_location_loaded = False
+        self._lines = None  # raw data lines for lazy loading
         self._data = []  # place holder for data as ladybug data collection
+        self._columns = []  # place holder for data as packed arrays
+        self._analysis_period = None  # annual analysis period for data collections
+        self._timestep = 1  # number of records per hour
+        self._is_leap_year = False  # True if the data has records for Feb 29
         self._header = None  # epw header
+        self._header_data = {}  # parsed objects from header lines
         self._num_of_fields = 35  # it is 35 for TMY3 files
 
+    @classmethod
+    def from_archive(cls, archive_path, member=None, lazy=False, cache_dir=None):
+        """Create an EPW from an epw file inside a .zip or a .gz file.
+
+        The data is read directly from the archive without extracting it.
+
+        Args:
+            archive_path: Local file address to a .zip or a .gz file.
+            member: Name of the epw file inside a zip file. Default is the first
+                epw file in the archive.
+            lazy: Set to True to convert each field on the first request.
+            cache_dir: An optional folder to keep a binary copy of the parsed data.
+
+        Usage:
+
+            epw = EPW.from_archive("c:/ladybug/USA_CO_Golden-NREL.724666_TMY3.zip")
+            print(epw.dry_bulb_temperature)
+        """
+        if not is_archive(archive_path):
+            raise ValueError('{} is not a .zip or a .gz file.'.format(archive_path))
+        epw = cls(archive_path, lazy, cache_dir)
+        if member is not None:
+            epw._archive_member = find_archive_member(archive_path, '.epw', member)
+        return epw
+
     @property
     def file_path(self):
-        """Get path to epw file."""
+        """Get path to epw file.
+
+        For epw files inside an archive this is the path to the archive.
+        """
         return self._file_path
 
+    @property
+    def archive_member(self):
+        """Get the name of the epw file inside the archive if loaded from an archive.
+        """
+        return self._archive_member
+
+    def _open(self):
+        """Open the epw file for reading the lines."""
+        if self._content is not None:
+            if isinstance(self._content, bytes):
+                return io.BytesIO(self._content)
+            return io.StringIO(self._content)
+        elif self._archive_member is not None:
+            return open_archive_member(self._file_path, self._archive_member)
+        return open(self._file_path, readmode)
+
+    @property
+    def is_lazy(self):
+        """Return True if fields are converted to values on request."""
+        return self._lazy
+
+    @property
+    def timestep(self):
+        """Return number of records per hour in the epw file (e.g. 4 for 15 minutes).
+        """
+        if not self.is_data_loaded:
+            self._import_data()
+        return self._timestep
+
+    @property
+    def is_leap_year(self):
+        """Return True if the epw file has data for February 29."""
+        if not self.is_data_loaded:
+            self._import_data()
+        return self._is_leap_year
+
+    @property
+    def analysis_period(self):
+        """Return the annual analysis period for data collections of the epw file.
+        """
+        if not self.is_data_loaded:
+            self._import_data()
+        if self._analysis_period is None:
+            self._analysis_period = AnalysisPeriod(
+                timestep=self._timestep, is_leap_year=self._is_leap_year)
+        return self._analysis_period
+
     @property
     def is_data_loaded(self):
         """Return True if weather data is loaded."""
@@ -100,102 +236,458 @@ class EPW(object):
             self._import_data(import_location_only=True)
         return self._location
 
-    # TODO: import EPW header. Currently I just ignore header data
+    @property
+    def design_conditions(self):
+        """Return ASHRAE design conditions from the epw header as DesignConditions.
+
+        Only the header of the file is read to get the design conditions.
+        """
+        return self._get_header_data(1, DesignConditions.from_epw_string)
+
+    @property
+    def typical_extreme_periods(self):
+        """Return a list of typical and extreme periods from the epw header."""
+        return self._get_header_data(2, TypicalPeriod.from_epw_string)
+
+    @property
+    def ground_temperatures(self):
+        """Return a list of monthly ground temperatures from the epw header."""
+        return self._get_header_data(3, GroundTemperature.from_epw_string)
+
+    @property
+    def holidays_daylight_savings(self):
+        """Return holidays and daylight saving period from the epw header."""
+        return self._get_header_data(4, HolidaysDaylightSavings.from_epw_string)
+
+    @property
+    def comments_1(self):
+        """Return the first line of comments in the epw header."""
+        return self._get_header_data(5, self._parse_comment)
+
+    @property
+    def comments_2(self):
+        """Return the second line of comments in the epw header."""
+        return self._get_header_data(6, self._parse_comment)
+
+    @property
+    def data_periods(self):
+        """Return a list of data periods from the epw header."""
+        return self._get_header_data(7, DataPeriod.from_epw_string)
+
+    def _get_header_data(self, line_number, parser):
+        """Parse a line of the header on the first request and return the result."""
+        if line_number not in self._header_data:
+            self._header_data[line_number] = parser(self.header[line_number])
+        return self._header_data[line_number]
+
+    @staticmethod
+    def _parse_comment(epw_string):
+        """Return the comment from a COMMENTS line."""
+        return epw_string.strip().split(',', 1)[-1].strip()
+
     def _import_data(self, import_location_only=False):
         """Import data from an epw file.
 
-        Hourly data will be saved in self.data and location data
-        will be saved in self.location
+        Hourly data will be saved in self._columns as one packed array per field
+        and location data will be saved in self.location. Data collections are
+        only created when a field is requested.
         """
-        with open(self._file_path, readmode) as epwin:
+        with self._open() as epwin:
             line = epwin.readline()
 
-            # import location data
-            # first line has location data - Here is an example
-            # LOCATION,Denver Centennial  Golden   Nr,CO,USA,TMY3,724666,39.74,
-            # -105.18,-7.0,1829.0
             if not self._is_location_loaded:
-                location_data = line.strip().split(',')
-                self._location = Location()
-                self._location.city = location_data[1].replace('\\', ' ') \
-                    .replace('/', ' ')
-                self._location.country = location_data[3]
-                self._location.source = location_data[4]
-                self._location.station_id = location_data[5]
-                self._location.latitude = location_data[6]
-                self._location.longitude = location_data[7]
-                self._location.time_zone = location_data[8]
-                self._location.elevation = location_data[9]
-
-                self._is_location_loaded = True
-
-            # TODO: add parsing for header
+                self._import_location(line)
+
+            # the rest of header lines are parsed on request
             self._header = [line] + [epwin.readline() for i in xrange(7)]
 
             if import_location_only:
                 return
 
-            # read first line of data to overwrite the number of fields
-            line = epwin.readline()
-            self._num_of_fields = min(len(line.strip().split(',')), 35)
-
-            # create an annual analysis period
-            analysis_period = AnalysisPeriod()
-
-            # create an empty collection for each field in epw file
-            for field_number in range(self._num_of_fields):
-                # create header
-                field = EPWFields.field_by_number(field_number)
-                # the header of data collection
-                header = Header(location=self.location, analysis_period=analysis_period,
-                                data_type=field.name, unit=field.unit,
-                                middle_hour=field.middle_hour)
-
-                # create an empty data list with the header
-                self._data.append(DataCollection(header=header))
-
-            # collect hourly data
-            while line:
-                data = line.strip().split(',')
-                year, month, day, hour = map(int, data[:4])
-
-                # in an epw file year can be different for each month
-                # since I'm using this timestamp as the key and will be using it for
-                # sorting. I'm setting it up to 2015 - the real year will be collected
-                # under modelYear
-                timestamp = DateTime(month, day, hour - 1)
-
-                for field_number in xrange(self._num_of_fields):
-                    value_type = EPWFields.field_by_number(field_number).value_type
-                    try:
-                        value = value_type(data[field_number])
-                    except ValueError as e:
-                        # failed to convert the value for the specific TypeError
-                        if value_type != int:
-                            raise ValueError(e)
-                        value = int(round(float(data[field_number])))
-
-                    self._data[field_number].append(DataPoint(value, timestamp))
+            if self._cache_dir and self._import_cache():
+                return
 
-                line = epwin.readline()
+            if self._lazy:
+                # only keep the lines. fields will be converted on request
+                lines = [line.rstrip() for line in epwin]
+            else:
+                # split all the data lines once and transpose them into columns
+                rows = [line.strip().split(',') for line in epwin]
+
+        if self._lazy:
+            # overwrite the number of fields based on the first line of data
+            self._num_of_fields = min(len(lines[0].split(',')), 35)
+            self._set_timestep(
+                [line.split(',', 4)[:4] for line in lines[:61]], len(lines),
+                lambda i: lines[i].split(',', 3)[1:3])
+            self._lines = lines
+            self._columns = [None] * self._num_of_fields
+        else:
+            # overwrite the number of fields based on the first line of data
+            self._num_of_fields = min(len(rows[0]), 35)
+            self._set_timestep(rows[:61], len(rows), lambda i: rows[i][1:3])
+            columns = zip(*rows)
+
+            self._columns = [
+                self._parse_column(EPWFields.field_by_number(field_number), column)
+                for field_number, column in zip(xrange(self._num_of_fields), columns)
+            ]
+
+        # data collections will be created once they are requested
+        self._data = [None] * self._num_of_fields
+        self._is_data_loaded = True
+
+        if self._cache_dir:
+            self._write_cache()
+
+    def _set_timestep(self, rows, num_of_records, month_day):
+        """Set timestep and leap year from the data records.
+
+        Args:
+            rows: The first records of data as lists of values where the fourth item
+                is the hour. At least timestep + 1 records should be provided.
+            num_of_records: Total number of records.
+            month_day: A function that returns month and day for a record index.
+        """
+        self._timestep = self._detect_timestep(row[3] for row in rows)
+        self._is_leap_year = self._detect_leap_year(
+            num_of_records, self._timestep, month_day)
+
+    @staticmethod
+    def _detect_timestep(hours):
+        """Detect the number of records per hour from the hours of the first records.
 
-            # move last item to start position for fields on the hour
-            for field_number in xrange(self._num_of_fields):
-                middle_hour = EPWFields.field_by_number(field_number).middle_hour
-                if middle_hour is False:
-                    # shift datetimes for an hour
-                    for data in self._data[field_number]:
-                        try:
-                            data.datetime = data.datetime.add_hour(1)
-                        except ValueError:
-                            # this is the last hour
-                            data.datetime = DateTime(1, 1, 0)
+        All the records for the same hour share the same value in the hour column.
+        The minute column is not reliable for hourly files (e.g. 0 or 60 in TMY
+        files) so it is not used.
+        """
+        hours = iter(hours)
+        first_hour = int(next(hours))
+        timestep = 1
+        for hour in hours:
+            if int(hour) != first_hour:
+                break
+            timestep += 1
+        if timestep not in AnalysisPeriod.VALIDTIMESTEPS:
+            raise ValueError(
+                'Invalid number of records per hour in the epw file: %d' % timestep)
+        return timestep
+
+    @staticmethod
+    def _detect_leap_year(num_of_records, timestep, month_day):
+        """Check if the data has records for Feb 29 for an annual epw file."""
+        # Feb 29 starts after the records for 31 days of January and 28 days of
+        # February
+        index = 59 * 24 * timestep
+        if num_of_records <= index:
+            return False
+        month, day = month_day(index)
+        return int(month) == 2 and int(day) == 29
+
+    def _import_location(self, line):
+        """Import location data from the first line of the epw file."""
+        # first line has location data - Here is an example
+        # LOCATION,Denver Centennial  Golden   Nr,CO,USA,TMY3,724666,39.74,
+        # -105.18,-7.0,1829.0
+        location_data = line.strip().split(',')
+        self._location = Location()
+        self._location.city = location_data[1].replace('\\', ' ') \
+            .replace('/', ' ')
+        self._location.country = location_data[3]
+        self._location.source = location_data[4]
+        self._location.station_id = location_data[5]
+        self._location.latitude = location_data[6]
+        self._location.longitude = location_data[7]
+        self._location.time_zone = location_data[8]
+        self._location.elevation = location_data[9]
+
+        self._is_location_loaded = True
+
+    @property
+    def cache_path(self):
+        """Path to the binary cache file for this epw file.
+
+        The cache file name is unique to the full path of the epw file. Returns None
+        if cache_dir is not set.
+        """
+        if not self._cache_dir:
+            return None
+        abs_path = os.path.abspath(self._file_path)
+        if self._archive_member is not None:
+            abs_path = os.path.join(abs_path, self._archive_member)
+        key = hashlib.md5(abs_path.encode('utf-8')).hexdigest()
+        file_name = os.path.split(abs_path)[-1][:-4]
+        return os.path.join(self._cache_dir, '%s_%s.epwc' % (file_name, key))
+
+    def _file_signature(self):
+        """Return size and modified time of the epw file to validate the cache."""
+        st = os.stat(self._file_path)
+        return st.st_size, st.st_mtime
+
+    def _import_cache(self):
+        """Import location, header and data from the cache file.
+
+        The cache file starts with a fixed size binary header followed by a json
+        document for header lines and string fields. Values of numerical fields
+        are stored as packed arrays at the end of the file.
+
+        Returns:
+            True if the data is loaded from the cache. False if the cache is
+            missing or outdated.
+        """
+        cache_path = self.cache_path
+        if not os.path.isfile(cache_path):
+            return False
+
+        size, mtime = self._file_signature()
+        with open(cache_path, 'rb') as cachein:
+            st = cachein.read(_CACHE_HEADER.size)
+            if len(st) != _CACHE_HEADER.size:
+                return False
+            magic, version, c_size, c_mtime, meta_size = _CACHE_HEADER.unpack(st)
+            if magic != b'LBEPW' or version != self.CACHEVERSION \
+                    or c_size != size or c_mtime != mtime:
+                return False
+
+            self._read_columns(cachein, meta_size)
+        return True
+
+    def _read_columns(self, stream, meta_size):
+        """Read the json document and the packed columns after a cache header.
 
-                    # now move the last hour to first
-                    last_hour = self._data[field_number].pop()
-                    self._data[field_number].insert(0, last_hour)
+        Returns:
+            The json document.
+        """
+        meta = json.loads(stream.read(meta_size).decode('utf-8'))
+        swap = meta['byteorder'] != sys.byteorder
+        columns = []
+        for typecode, values in meta['columns']:
+            if typecode is None:
+                # strings are stored in the json document. fields which are not
+                # loaded from the epw file yet are None.
+                columns.append(values)
+                continue
+            column = array(str(typecode))
+            try:
+                column.fromfile(stream, values)
+            except TypeError:
+                # python 2 only reads from built-in file objects
+                column.fromstring(stream.read(column.itemsize * values))
+            if swap:
+                column.byteswap()
+            columns.append(column)
+
+        self._header = meta['header']
+        self._num_of_fields = len(columns)
+        self._set_timestep(
+            [(None, None, None, h) for h in columns[3][:61]], len(columns[3]),
+            lambda i: (columns[1][i], columns[2][i]))
+        self._columns = columns
+        self._lines = None
+        self._data = [None] * self._num_of_fields
+        self._is_data_loaded = True
+        return meta
+
+    def _write_columns(self, stream, columns, size=0, mtime=0, **kwargs):
+        """Write a cache header, a json document and the packed columns.
+
+        Args:
+            stream: A binary file object.
+            columns: A list of columns for fields of the epw file.
+            size: Size of the epw file to validate the cache.
+            mtime: Modified time of the epw file to validate the cache.
+            kwargs: Additional keys for the json document.
+        """
+        meta = {
+            'header': self._header,
+            'byteorder': sys.byteorder,
+            'columns': [(col.typecode, len(col)) if isinstance(col, array)
+                        else (None, col) for col in columns]
+        }
+        meta.update(kwargs)
+        meta = json.dumps(meta).encode('utf-8')
+        stream.write(_CACHE_HEADER.pack(
+            b'LBEPW', self.CACHEVERSION, size, mtime, len(meta)))
+        stream.write(meta)
+        for col in columns:
+            if isinstance(col, array):
+                try:
+                    col.tofile(stream)
+                except TypeError:
+                    # python 2 only writes to built-in file objects
+                    stream.write(col.tostring())
+
+    def _write_cache(self):
+        """Write location, header and data to the cache file.
+
+        Only the fields which are already converted are written so the cache doesn't
+        convert all the fields in lazy mode. Other fields are loaded from the epw
+        file on request. Month, day and hour are always written to set the timestep.
+        """
+        columns = [self._get_column(field) if field in (1, 2, 3)
+                   else self._columns[field]
+                   for field in xrange(self._num_of_fields)]
+        size, mtime = self._file_signature()
+
+        cache_path = self.cache_path
+        temp_path = '%s.%d.tmp' % (cache_path, os.getpid())
+        try:
+            if not os.path.isdir(self._cache_dir):
+                os.makedirs(self._cache_dir)
+            with open(temp_path, 'wb') as cacheout:
+                self._write_columns(cacheout, columns, size, mtime)
+            if os.path.isfile(cache_path):
+                os.remove(cache_path)
+            os.rename(temp_path, cache_path)
+        except (IOError, OSError):
+            # failing to write the cache should not stop loading the file.
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+
+    def to_bytes(self):
+        """Convert the epw data to bytes.
+
+        The bytes use the same format as the cache files: a small binary header, a
+        json document for header lines and string fields and the packed arrays of
+        numerical fields. Changes to the data collections are included. Fields
+        which are not loaded yet from an epw file in lazy mode are not included
+        and will be loaded from the file on request.
+
+        Usage:
+
+            data = epw.to_bytes()
+            epw = EPW.from_bytes(data)
+        """
+        if not self.is_data_loaded:
+            self._import_data()
+        columns = []
+        for field in xrange(self._num_of_fields):
+            if self._columns[field] is None and field not in (1, 2, 3) \
+                    and self._content is None:
+                columns.append(None)
+                continue
+            column = self._get_column(field)
+            values = self._field_values(field)
+            if isinstance(column, array) and not isinstance(values, array):
+                try:
+                    values = array(column.typecode, values)
+                except TypeError:
+                    # float values in an integer field
+                    values = array('d', values)
+            columns.append(values)
+        stream = io.BytesIO()
+        self._write_columns(stream, columns, file_path=self._file_path,
+                            archive_member=self._archive_member, lazy=self._lazy)
+        return stream.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Create an EPW from bytes which are created using to_bytes.
+
+        The path to the original file is kept but the file is only needed for the
+        methods which read the lines of the file (e.g. iter_records).
+
+        Args:
+            data: Bytes of an EPW.
+        """
+        stream = io.BytesIO(data)
+        st = stream.read(_CACHE_HEADER.size)
+        if len(st) != _CACHE_HEADER.size:
+            raise ValueError('Bytes are not a valid EPW.')
+        magic, version, size, mtime, meta_size = _CACHE_HEADER.unpack(st)
+        if magic != b'LBEPW' or version != cls.CACHEVERSION:
+            raise ValueError('Bytes are not a valid EPW.')
+
+        # create an epw with no content and load the data from the bytes
+        epw = cls(io.BytesIO(b''))
+        meta = epw._read_columns(stream, meta_size)
+        epw._content = None
+        epw._file_path = meta.get('file_path')
+        epw._archive_member = meta.get('archive_member')
+        epw._lazy = meta.get('lazy', False)
+        epw._import_location(epw._header[0])
+        return epw
+
+    def __reduce__(self):
+        # pickle the packed values instead of data collections
+        return _epw_from_bytes, (self.to_bytes(),)
+
+    def _get_column(self, field_number):
+        """Return the packed values of a field in the order of lines in epw file.
+
+        In lazy mode the field is converted from the data lines on the first call.
+        """
+        column = self._columns[field_number]
+        if column is None:
+            if self._lines is None:
+                # lines are released (e.g. after load_epws). read them again
+                with self._open() as epwin:
+                    self._lines = [line.rstrip() for line in epwin][8:]
+            field = EPWFields.field_by_number(field_number)
+            max_split = field_number + 1
+            column = self._parse_column(field, [
+                line.split(',', max_split)[field_number] for line in self._lines])
+            self._columns[field_number] = column
+            if all(col is not None for col in self._columns):
+                # all the fields are converted. lines are not needed anymore
+                self._lines = None
+        return column
+
+    @staticmethod
+    def _parse_column(field, column):
+        """Convert a column of strings to a packed array based on field value type.
+
+        Integer and float fields are stored in array('i') and array('d'). Integer
+        fields with decimal values in the file are stored in array('d') so no data is
+        lost. Other fields (e.g. Uncertainty Flags) are kept as a list of strings.
+        """
+        if field.value_type is float:
+            return array('d', map(float, column))
+        elif field.value_type is int:
+            try:
+                return array('i', map(int, column))
+            except ValueError:
+                # decimal values in an integer field (e.g. 60.63 for humidity)
+                return array('d', map(float, column))
+        return list(column)
+
+    def _field_values(self, field_number):
+        """Return values of a field in the same order as the lines in epw file.
+
+        If a data collection is already created for this field its values will
+        be used so that the changes to the collection are respected.
+        """
+        collection = self._data[field_number]
+        if collection is None:
+            return self._get_column(field_number)
+
+        values = collection.values
+        if EPWFields.field_by_number(field_number).middle_hour is False:
+            # move the first item to the end for fields on the hour
+            values = values[1:] + values[:1]
+        return values
+
+    def _create_data_collection(self, field_number):
+        """Create a data collection from the values of a field.
+
+        Values are kept in a packed array and data points are only created if they
+        are requested from the data collection.
+        """
+        field = EPWFields.field_by_number(field_number)
+        header = Header(location=self.location, analysis_period=self.analysis_period,
+                        data_type=field.name, unit=field.unit,
+                        middle_hour=field.middle_hour)
+
+        values = self._get_column(field_number)
+        if field.middle_hour is False:
+            # values in the file are for the end of the hour.
+            # move the last item to start position for fields on the hour
+            values = values[-1:] + values[:-1]
+        else:
+            # copy the values so updating the collection doesn't change the column
+            values = values[:]
 
-            self._is_data_loaded = True
+        return CompactDataCollection(values, header)
 
     def _get_data_by_field(self, field_number):
         """Return a data field by field number.
@@ -217,8 +709,133 @@ class EPW(object):
         if not 0 <= field_number < self._num_of_fields:
             raise ValueError("Field number should be between 0-%d" % self._num_of_fields)
 
+        if self._data[field_number] is None:
+            self._data[field_number] = self._create_data_collection(field_number)
+
         return self._data[field_number]
 
+    def iter_records(self, fields=None, analysis_period=None):
+        """Iterate over the records of the epw file.
+
+        Records are read line by line from the file and no data collection is
+        created, which makes this method suitable for one-pass calculations
+        (e.g. degree-days or maximum values) with a constant memory. Values on the
+        hour are shifted the same way as the data collections so each record
+        carries the values for the same hour as the collections.
+
+        Args:
+            fields: A list of field numbers to be included in each record.
+                Default is all the fields in the epw file.
+            analysis_period: An optional analysis period to only yield the
+                records for the hours in the analysis period.
+
+        Returns:
+            A generator of named tuples. The first item is the datetime of the
+            record followed by values for the fields (e.g. record.datetime,
+            record.dry_bulb_temperature).
+
+        Usage:
+
+            epw = EPW("c:/ladybug/weatherdata.epw")
+            hdd = sum(max(18 - r.dry_bulb_temperature, 0)
+                      for r in epw.iter_records([6])) / 24
+        """
+        with self._open() as epwin:
+            for i in xrange(8):
+                epwin.readline()
+
+            line = epwin.readline()
+            num_of_fields = min(len(line.strip().split(',')), 35)
+            fields = tuple(xrange(num_of_fields)) if fields is None else tuple(fields)
+            for field_number in fields:
+                if not 0 <= field_number < num_of_fields:
+                    raise ValueError(
+                        "Field number should be between 0-%d" % num_of_fields)
+
+            epw_fields = [EPWFields.field_by_number(f) for f in fields]
+            record_type = namedtuple(
+                'EPWRecord', ['datetime'] +
+                [field.name.lower().replace(' ', '_') for field in epw_fields])
+            converters = [self._value_converter(field) for field in epw_fields]
+            on_hour = [i for i, field in enumerate(epw_fields)
+                       if field.middle_hour is False]
+            max_split = max(fields) + 1 if fields else 0
+
+            # read the records until the end of February to find the timestep and
+            # the leap year. The rest of the lines are read one by one.
+            head = [line]
+            while line and len(head) < 61:
+                line = epwin.readline()
+                head.append(line)
+            timestep = self._detect_timestep(
+                record.split(',', 4)[3] for record in head[:61] if record)
+            while line and len(head) <= 59 * 24 * timestep:
+                line = epwin.readline()
+                head.append(line)
+            head = [record for record in head if record]
+            is_leap_year = self._detect_leap_year(
+                len(head), timestep, lambda i: head[i].split(',', 3)[1:3])
+            minutes_per_record = 60 // timestep
+
+            moys = None
+            if analysis_period is not None and not analysis_period.is_annual:
+                moys = set(analysis_period.moys)
+
+            # values on the hour for the first record are at the end of the file
+            previous = None
+            if on_hour:
+                data = self._read_last_line().split(',', max_split)
+                previous = [converters[i](data[fields[i]]) for i in on_hour]
+
+            moy = 0
+            for line in chain(head, epwin):
+                data = line.split(',', max_split)
+                values = [convert(data[f]) for convert, f in zip(converters, fields)]
+                # swap values on the hour with the values from the previous line
+                for count, i in enumerate(on_hour):
+                    values[i], previous[count] = previous[count], values[i]
+
+                if moys is None or moy in moys:
+                    yield record_type(DateTime.from_moy(moy, is_leap_year), *values)
+
+                moy += minutes_per_record
+
+    @staticmethod
+    def _value_converter(field):
+        """Return a function to convert a string value based on field value type."""
+        if field.value_type is int:
+            def to_int(value):
+                try:
+                    return int(value)
+                except ValueError:
+                    return int(round(float(value)))
+            return to_int
+        elif field.value_type is float:
+            return float
+        return str
+
+    def _read_last_line(self):
+        """Read the last line of the epw file without reading the whole file."""
+        if self._content is not None or self._archive_member is not None:
+            # compressed files can't be read backwards
+            with self._open() as epwin:
+                last_line = deque(epwin, maxlen=1)
+            return last_line[0].strip() if last_line else ''
+
+        with open(self._file_path, 'rb') as epwin:
+            epwin.seek(0, os.SEEK_END)
+            position = epwin.tell()
+            block = b''
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                epwin.seek(position)
+                block = epwin.read(step) + block
+                lines = block.strip().splitlines()
+                if len(lines) > 1 or position == 0:
+                    return lines[-1].decode('utf-8')
+        return ''
+
     def save(self, file_path):
         """Save epw object as an epw file.
 
@@ -229,40 +846,50 @@ class EPW(object):
         if not self.is_data_loaded:
             self._import_data()
 
-        # write the file
-        lines = self._header
-        try:
-            # move first item to end position for fields on the hour
-            for field in range(0, self._num_of_fields):
-                middle_hour = EPWFields.field_by_number(field).middle_hour
-                if middle_hour is False:
-                    first_hour = self._data[field].pop(0)
-                    self._data[field].append(first_hour)
-
-            for hour in xrange(0, 8760):
-                line = []
-                for field in range(0, self._num_of_fields):
-                    line.append(str(self._data[field].data[hour].value))
-                lines.append(",".join(line) + "\n")
-        except IndexError:
-            # cleaning up
-            length_error_msg = 'Data length is not 8760 hours and cannot be ' + \
-                'saved as an EPW file.'
-            raise ValueError(length_error_msg)
-        else:
-            file_data = ''.join(lines)
-            write_to_file(file_path, file_data, True)
-        finally:
-            del(lines)
-            # move last item to start position for fields on the hour
-            for field in range(0, self._num_of_fields):
-                middle_hour = EPWFields.field_by_number(field).middle_hour
-                if middle_hour is False:
-                    last_hour = self._data[field].pop()
-                    self._data[field].insert(0, last_hour)
+        # format each field as a column of strings
+        columns = [self._format_column(field) for field in xrange(self._num_of_fields)]
+        num_of_records = (8784 if self._is_leap_year else 8760) * self._timestep
+        for column in columns:
+            if len(column) != num_of_records:
+                length_error_msg = 'Data length is not %d records and cannot be ' \
+                    'saved as an EPW file.' % num_of_records
+                raise ValueError(length_error_msg)
+
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.isdir(folder):
+            preparedir(folder, False)
+
+        # write the rows to the file one by one
+        with open(file_path, writemode) as epwout:
+            epwout.writelines(self._header)
+            epwout.writelines(','.join(row) + '\n' for row in zip(*columns))
 
         return file_path
 
+    def _format_column(self, field_number):
+        """Return values of a field as a list of strings for writing to epw file.
+
+        Float values are written with the precision of the field and integer values
+        with no decimals as long as it doesn't change the value. Other values are
+        written with the shortest representation of the number so no data is lost.
+        """
+        field = EPWFields.field_by_number(field_number)
+        values = self._field_values(field_number)
+        if field.value_type is float and field.precision is not None:
+            fmt = '%.{}f'.format(field.precision)
+        elif field.value_type is int:
+            if isinstance(values, array) and values.typecode == 'i':
+                return [str(v) for v in values]
+            fmt = '%.0f'
+        else:
+            return [repr(v) if isinstance(v, float) else str(v) for v in values]
+
+        formatted = []
+        for v in values:
+            text = fmt % v
+            formatted.append(text if float(text) == v else repr(v))
+        return formatted
+
     def import_data_by_field(self, field_number):
         """Return annual values for any field_number in epw file.
 
@@ -756,12 +1383,27 @@ class EPW(object):
         generate the sky. For an annual analysis it is identical to using epw2wea.
 
         args:
-            file_path: Full file path for output file.
-            hoys: List of hours of the year. Default is 0-8759.
+            file_path: Full file path for output file. Default is the path of the
+                epw file with a .wea extension. It is required if the epw is loaded
+                from a file object.
+            hoys: List of hours of the year. Default is all the records of the epw
+                file (e.g. 0-8759 for hourly data).
         """
-        hoys = hoys or xrange(8760)
+        # records of sub-hourly files are found based on the timestep
+        timestep = self.timestep
+        if hoys:
+            indices = [int(round(hoy * timestep)) for hoy in hoys]
+        else:
+            indices = xrange((8784 if self.is_leap_year else 8760) * timestep)
         if not file_path:
-            file_path = self.file_path[:-4] + '.wea'
+            if self.file_path is None:
+                raise ValueError('file_path is required to write a wea file for an '
+                                 'epw which is not loaded from a file.')
+            if self._archive_member is not None:
+                file_path = os.path.join(os.path.split(self.file_path)[0],
+                                         self._archive_member[:-4] + '.wea')
+            else:
+                file_path = self.file_path[:-4] + '.wea'
 
         if not file_path.lower().endswith('.wea'):
             file_path += '.wea'
@@ -769,13 +1411,14 @@ class EPW(object):
         # write header
         lines = [self._get_wea_header()]
         # write values
-        for hoy in hoys:
-            dir_rad = self.direct_normal_radiation[hoy]
-            dif_rad = self.diffuse_horizontal_radiation[hoy]
+        for index in indices:
+            dir_rad = self.direct_normal_radiation[index]
+            dif_rad = self.diffuse_horizontal_radiation[index]
+            # radiation values are for the middle of each timestep
             line = "%d %d %.3f %d %d\n" \
                 % (dir_rad.datetime.month,
                    dir_rad.datetime.day,
-                   dir_rad.datetime.hour + 0.5,
+                   dir_rad.datetime.float_hour + 0.5 / timestep,
                    dir_rad, dif_rad)
             lines.append(line)
 
@@ -793,6 +1436,72 @@ class EPW(object):
         return "EPW file Data for [%s]" % self.location.city
 
 
+def _epw_from_bytes(data):
+    """Create an EPW from bytes when it is unpickled.
+
+    Bound class methods can't be pickled in python 2.
+    """
+    return EPW.from_bytes(data)
+
+
+def _load_epw(args):
+    """Load the requested fields of an epw file for load_epws."""
+    file_path, fields, cache_dir = args
+    epw = EPW(file_path, lazy=fields is not None, cache_dir=cache_dir)
+    epw._import_data()
+    if fields is not None:
+        for field_number in fields:
+            epw._get_column(field_number)
+        # only send the requested columns back
+        epw._lines = None
+    return epw
+
+
+def load_epws(paths, fields=None, workers=1, cache_dir=None):
+    """Load the data of several epw files using a pool of processes.
+
+    Data is loaded as packed columns and no data collection is created which
+    keeps the loaded objects small to transfer between the processes. Data
+    collections will be created on request from the returned EPW objects.
+
+    Args:
+        paths: A list of paths to epw files.
+        fields: An optional list of field numbers to be loaded. Other fields will
+            be loaded from the file on request. Default is all the fields.
+        workers: Number of processes to load the files (Default: 1). Files are
+            loaded in the current process if workers is 1 or multiprocessing is not
+            available.
+        cache_dir: An optional folder for binary cache of parsed epw files.
+
+    Returns:
+        A list of EPW objects in the same order as the input paths.
+
+    Usage:
+
+        epws = load_epws(epw_files, fields=(6, 8), workers=4)
+        for epw in epws:
+            print(epw.location.city, max(epw.dry_bulb_temperature.values))
+    """
+    fields = None if fields is None else tuple(fields)
+    args = [(path, fields, cache_dir) for path in paths]
+    if workers > 1 and len(args) > 1:
+        try:
+            from multiprocessing import Pool
+        except ImportError:
+            # IronPython
+            pass
+        else:
+            chunksize = max(1, len(args) // (workers * 4))
+            pool = Pool(workers)
+            try:
+                return pool.map(_load_epw, args, chunksize)
+            finally:
+                pool.close()
+                pool.join()
+
+    return [_load_epw(arg) for arg in args]
+
+
 class EPWFields(object):
     """EPW weather file fields.
 
@@ -835,6 +1544,7 @@ class EPWFields(object):
 
         6: {'name': 'Dry Bulb Temperature',
             'type': float,
+            'precision': 1,
             'unit': 'C',
             'min': -70,
             'max': 70,
@@ -844,6 +1554,7 @@ class EPWFields(object):
 
         7: {'name': 'Dew Point Temperature',
             'type': float,
+            'precision': 1,
             'unit': 'C',
             'min': -70,
             'max': 70,
@@ -960,6 +1671,7 @@ class EPWFields(object):
 
         21: {'name': 'Wind Speed',
              'type': float,
+             'precision': 1,
              'unit': 'm/s',
              'missing': 999,
              'min': 0,
@@ -983,6 +1695,7 @@ class EPWFields(object):
 
         24: {'name': 'Visibility',
              'type': float,
+             'precision': 1,
              'unit': 'km',
              'missing': 9999,
              'middle_hour': False
@@ -1014,6 +1727,7 @@ class EPWFields(object):
 
         29: {'name': 'Aerosol Optical Depth',
              'type': float,
+             'precision': 4,
              'unit': 'thousandths',
              'missing': 999,
              'middle_hour': False
@@ -1034,12 +1748,14 @@ class EPWFields(object):
 
         32: {'name': 'Albedo',
              'type': float,
+             'precision': 3,
              'missing': 999,
              'middle_hour': False
              },
 
         33: {'name': 'Liquid Precipitation Depth',
              'type': float,
+             'precision': 1,
              'unit': 'mm',
              'missing': 999,
              'middle_hour': False
@@ -1047,6 +1763,7 @@ class EPWFields(object):
 
         34: {'name': 'Liquid Precipitation Quantity',
              'type': float,
+             'precision': 1,
              'unit': 'hr',
              'missing': 99,
              'middle_hour': False
@@ -1112,6 +1829,7 @@ class EPWField(object):
         name: Name of the field.
         type: field value type (e.g. int, float, str)
         unit: Field unit.
+        precision: Number of decimal places for float fields in epw file.
     """
 
     def __init__(self, field_dict):
@@ -1122,3 +1840,4 @@ class EPWField(object):
             self.unit = field_dict['unit']
         else:
             self.unit = None
+        self.precision = field_dict.get('precision')
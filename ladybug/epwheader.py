@@ -0,0 +1,301 @@
+# coding=utf-8
+"""Ladybug objects for the header lines of an epw file.
+
+Read more at:
+https://energyplus.net/sites/all/modules/custom/nrel_custom/pdfs/
+    pdfs_v8.4.0/AuxiliaryPrograms.pdf
+(Chapter 2.9.1)
+"""
+from .analysisperiod import AnalysisPeriod
+
+from collections import OrderedDict
+
+
+def _to_float(value):
+    """Convert a header value to float. Return None for empty values."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _parse_date(date_string):
+    """Get month and day from a date in epw header (e.g. 7/13, 2/ 2, 2015/07/20)."""
+    month, day = date_string.split('/')[-2:]
+    return int(month), int(day)
+
+
+class DesignConditions(object):
+    """ASHRAE design conditions in the header of an epw file.
+
+    Attributes:
+        source: Source of the design conditions
+            (e.g. Climate Design Data 2009 ASHRAE Handbook).
+        heating: An ordered dictionary for heating design conditions.
+        cooling: An ordered dictionary for cooling design conditions.
+        extremes: An ordered dictionary for extreme design conditions.
+    """
+
+    HEATINGKEYS = (
+        'Coldest Month', 'DB996', 'DB990', 'DP996', 'HR_DP996', 'DB_DP996', 'DP990',
+        'HR_DP990', 'DB_DP990', 'WS004c', 'DB_WS004c', 'WS010c', 'DB_WS010c',
+        'WS_DB996', 'WD_DB996')
+
+    COOLINGKEYS = (
+        'Hottest Month', 'DBR', 'DB004', 'WB_DB004', 'DB010', 'WB_DB010', 'DB020',
+        'WB_DB020', 'WB004', 'DB_WB004', 'WB010', 'DB_WB010', 'WB020', 'DB_WB020',
+        'WS_DB004', 'WD_DB004', 'DP004', 'HR_DP004', 'DB_DP004', 'DP010', 'HR_DP010',
+        'DB_DP010', 'DP020', 'HR_DP020', 'DB_DP020', 'EN004', 'DB_EN004', 'EN010',
+        'DB_EN010', 'EN020', 'DB_EN020', 'Hrs_8-4_&_DB')
+
+    EXTREMESKEYS = (
+        'WS010', 'WS025', 'WS050', 'WBmax', 'DBmin_mean', 'DBmax_mean', 'DBmin_stddev',
+        'DBmax_stddev', 'DBmin05years', 'DBmax05years', 'DBmin10years', 'DBmax10years',
+        'DBmin20years', 'DBmax20years', 'DBmin50years', 'DBmax50years')
+
+    def __init__(self, source=None, heating=None, cooling=None, extremes=None):
+        """Init class."""
+        self.source = source
+        self.heating = heating or OrderedDict()
+        self.cooling = cooling or OrderedDict()
+        self.extremes = extremes or OrderedDict()
+
+    @classmethod
+    def from_epw_string(cls, epw_string):
+        """Create design conditions from the DESIGN CONDITIONS line of an epw file."""
+        data = epw_string.strip().split(',')
+        if len(data) < 3 or int(data[1] or 0) == 0:
+            return cls()
+
+        sections = {}
+        section = None
+        for value in data[4:]:
+            if value in ('Heating', 'Cooling', 'Extremes'):
+                section = sections[value] = []
+            elif section is not None:
+                section.append(_to_float(value))
+
+        def to_dict(keys, values):
+            return OrderedDict(zip(keys, values or ()))
+
+        return cls(data[2],
+                   to_dict(cls.HEATINGKEYS, sections.get('Heating')),
+                   to_dict(cls.COOLINGKEYS, sections.get('Cooling')),
+                   to_dict(cls.EXTREMESKEYS, sections.get('Extremes')))
+
+    @property
+    def is_available(self):
+        """Return True if the epw file has design conditions."""
+        return bool(self.heating or self.cooling or self.extremes)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Design conditions representation."""
+        return "Design Conditions [%s]" % self.source
+
+
+class TypicalPeriod(object):
+    """A typical or extreme period in the header of an epw file.
+
+    Attributes:
+        name: Period name (e.g. Summer - Week Nearest Max Temperature For Period).
+        period_type: Extreme or Typical.
+        st_month: Start month.
+        st_day: Start day.
+        end_month: End month.
+        end_day: End day.
+    """
+
+    __slots__ = ('name', 'period_type', 'st_month', 'st_day', 'end_month', 'end_day')
+
+    def __init__(self, name, period_type, st_month, st_day, end_month, end_day):
+        """Init class."""
+        self.name = name
+        self.period_type = period_type
+        self.st_month = st_month
+        self.st_day = st_day
+        self.end_month = end_month
+        self.end_day = end_day
+
+    @classmethod
+    def from_epw_string(cls, epw_string):
+        """Create a list of periods from the TYPICAL/EXTREME PERIODS line."""
+        data = epw_string.strip().split(',')
+        count = int(data[1] or 0) if len(data) > 1 else 0
+        periods = []
+        for i in range(count):
+            name, period_type, st_date, end_date = data[2 + 4 * i: 6 + 4 * i]
+            st_month, st_day = _parse_date(st_date)
+            end_month, end_day = _parse_date(end_date)
+            periods.append(cls(name, period_type, st_month, st_day, end_month, end_day))
+        return periods
+
+    @property
+    def analysis_period(self):
+        """Return the period as an AnalysisPeriod."""
+        return AnalysisPeriod(self.st_month, self.st_day, 0,
+                              self.end_month, self.end_day, 23)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Typical period representation."""
+        return "%s (%s) %d/%d to %d/%d" % (
+            self.name, self.period_type, self.st_month, self.st_day,
+            self.end_month, self.end_day)
+
+
+class GroundTemperature(object):
+    """Monthly ground temperatures for a depth in the header of an epw file.
+
+    Attributes:
+        depth: Depth in meters.
+        conductivity: Soil conductivity in W/m-K (None if not available).
+        density: Soil density in kg/m3 (None if not available).
+        specific_heat: Soil specific heat in J/kg-K (None if not available).
+        monthly_values: A list of 12 monthly ground temperatures in C.
+    """
+
+    __slots__ = ('depth', 'conductivity', 'density', 'specific_heat',
+                 'monthly_values')
+
+    def __init__(self, depth, conductivity, density, specific_heat, monthly_values):
+        """Init class."""
+        self.depth = depth
+        self.conductivity = conductivity
+        self.density = density
+        self.specific_heat = specific_heat
+        self.monthly_values = monthly_values
+
+    @classmethod
+    def from_epw_string(cls, epw_string):
+        """Create a list of ground temperatures from the GROUND TEMPERATURES line."""
+        data = epw_string.strip().split(',')
+        count = int(data[1] or 0) if len(data) > 1 else 0
+        ground_temperatures = []
+        for i in range(count):
+            values = [_to_float(v) for v in data[2 + 16 * i: 18 + 16 * i]]
+            ground_temperatures.append(cls(values[0], values[1], values[2], values[3],
+                                           values[4:]))
+        return ground_temperatures
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Ground temperature representation."""
+        return "Ground Temperature at %sm" % self.depth
+
+
+class HolidaysDaylightSavings(object):
+    """Holidays and daylight saving period in the header of an epw file.
+
+    Attributes:
+        leap_year_observed: A boolean to indicate if the file has data for Feb 29.
+        daylight_saving_start: Start of daylight saving period as a string
+            (0 if there is no daylight saving period).
+        daylight_saving_end: End of daylight saving period as a string
+            (0 if there is no daylight saving period).
+        holidays: A list of (name, date) tuples.
+    """
+
+    __slots__ = ('leap_year_observed', 'daylight_saving_start',
+                 'daylight_saving_end', 'holidays')
+
+    def __init__(self, leap_year_observed=False, daylight_saving_start='0',
+                 daylight_saving_end='0', holidays=None):
+        """Init class."""
+        self.leap_year_observed = leap_year_observed
+        self.daylight_saving_start = daylight_saving_start
+        self.daylight_saving_end = daylight_saving_end
+        self.holidays = holidays or []
+
+    @classmethod
+    def from_epw_string(cls, epw_string):
+        """Create holidays from the HOLIDAYS/DAYLIGHT SAVINGS line."""
+        data = [d.strip() for d in epw_string.strip().split(',')]
+        data += [''] * (5 - len(data))
+        count = int(data[4] or 0)
+        holidays = [(data[5 + 2 * i], data[6 + 2 * i]) for i in range(count)]
+        return cls(data[1].lower() == 'yes', data[2] or '0', data[3] or '0', holidays)
+
+    @property
+    def has_daylight_saving(self):
+        """Return True if the file has a daylight saving period."""
+        return self.daylight_saving_start != '0'
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Holidays representation."""
+        return "Leap Year: %s, Daylight Saving: %s to %s, %d Holidays" % (
+            self.leap_year_observed, self.daylight_saving_start,
+            self.daylight_saving_end, len(self.holidays))
+
+
+class DataPeriod(object):
+    """A data period in the header of an epw file.
+
+    Attributes:
+        records_per_hour: Number of records for each hour (timestep).
+        name: Data period name (e.g. Data).
+        start_day_of_week: Start day of week (e.g. Sunday).
+        st_month: Start month.
+        st_day: Start day.
+        end_month: End month.
+        end_day: End day.
+    """
+
+    __slots__ = ('records_per_hour', 'name', 'start_day_of_week', 'st_month',
+                 'st_day', 'end_month', 'end_day')
+
+    def __init__(self, records_per_hour, name, start_day_of_week, st_month, st_day,
+                 end_month, end_day):
+        """Init class."""
+        self.records_per_hour = records_per_hour
+        self.name = name
+        self.start_day_of_week = start_day_of_week
+        self.st_month = st_month
+        self.st_day = st_day
+        self.end_month = end_month
+        self.end_day = end_day
+
+    @classmethod
+    def from_epw_string(cls, epw_string):
+        """Create a list of data periods from the DATA PERIODS line."""
+        data = epw_string.strip().split(',')
+        count = int(data[1] or 0) if len(data) > 1 else 0
+        records_per_hour = int(data[2] or 1) if len(data) > 2 else 1
+        periods = []
+        for i in range(count):
+            name, start_day_of_week, st_date, end_date = data[3 + 4 * i: 7 + 4 * i]
+            st_month, st_day = _parse_date(st_date)
+            end_month, end_day = _parse_date(end_date)
+            periods.append(cls(records_per_hour, name, start_day_of_week,
+                               st_month, st_day, end_month, end_day))
+        return periods
+
+    @property
+    def analysis_period(self):
+        """Return the data period as an AnalysisPeriod."""
+        return AnalysisPeriod(self.st_month, self.st_day, 0,
+                              self.end_month, self.end_day, 23,
+                              self.records_per_hour)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Data period representation."""
+        return "%s %d/%d to %d/%d @%d" % (
+            self.name, self.st_month, self.st_day, self.end_month, self.end_day,
+            self.records_per_hour)
@@ -2,6 +2,8 @@
 import os
 import shutil
 import zipfile
+import gzip
+import io
 import sys
 
 if (sys.version_info < (3, 0)):
@@ -274,3 +276,79 @@ def unzip_file(source_file, dest_dir=None, mkdir=False):
                     continue
                 dest_dir = os.path.join(dest_dir, word)
             zf.extract(member, dest_dir)
+
+
+def find_archive_member(source_file, extension=None, member=None):
+    """Find the name of a file inside a compressed file.
+
+    Args:
+        source_file: Full path to a valid .zip or .gz file
+            (e.g. c:/ladybug/weather.zip)
+        extension: An optional file extension to find the first file with this
+            extension in the archive (e.g. .epw).
+        member: An optional name of the file inside the archive. If member is
+            provided it will be checked to exist in the archive.
+    """
+    if source_file.lower().endswith('.gz'):
+        # gzip files only have one member which is named after the file
+        name = os.path.split(source_file)[-1][:-3]
+        if member is not None and member != name:
+            raise ValueError("Failed to find %s in %s." % (member, source_file))
+        if extension is not None and not name.lower().endswith(extension.lower()):
+            raise ValueError("%s is not a %s file." % (source_file, extension))
+        return name
+
+    with zipfile.ZipFile(source_file) as zf:
+        names = zf.namelist()
+
+    if member is not None:
+        if member not in names:
+            raise ValueError("Failed to find %s in %s." % (member, source_file))
+        return member
+
+    for name in names:
+        if extension is None or name.lower().endswith(extension.lower()):
+            return name
+
+    raise ValueError("Failed to find a %s file in %s." % (extension, source_file))
+
+
+def open_archive_member(source_file, member=None, extension=None):
+    """Open a file inside a compressed file for reading without extracting it.
+
+    The content is decompressed while it is being read.
+
+    Args:
+        source_file: Full path to a valid .zip or .gz file
+            (e.g. c:/ladybug/weather.zip).
+        member: Name of the file inside the archive. Default is the first file
+            with the extension. The member of a .gz file is named after the file
+            (e.g. weather.epw for weather.epw.gz).
+        extension: File extension to find the member in a zip archive (e.g. .epw).
+
+    Returns:
+        A file object for reading the lines of the file as text. Close the file
+        once the reading is done.
+
+    Usage:
+
+        with open_archive_member("c:/ladybug/weather.zip", extension='.epw') as f:
+            location_line = f.readline()
+    """
+    member = find_archive_member(source_file, extension, member)
+    if source_file.lower().endswith('.gz'):
+        if (sys.version_info < (3, 0)):
+            return gzip.open(source_file, 'rb')
+        return gzip.open(source_file, 'rt', encoding='utf-8', errors='ignore')
+
+    with zipfile.ZipFile(source_file) as zf:
+        member_file = zf.open(member)
+
+    if (sys.version_info < (3, 0)):
+        return member_file
+    return io.TextIOWrapper(member_file, encoding='utf-8', errors='ignore')
+
+
+def is_archive(file_path):
+    """Check if a file path is for a .zip or a .gz file."""
+    return file_path.lower().endswith(('.zip', '.gz'))
@@ -56,15 +56,16 @@ class Header(object):
                 "middle_hour": {} // Whether values fall in the middle of the hour
             }
         """
-        # assign default values
-        keys = ('location', 'data_type', 'unit', 'analysis_period', 'middle_hour')
-        for key in keys:
-            if key not in data:
-                data[key] = None
-
-        location = Location.from_json(data['location'])
-        ap = AnalysisPeriod.from_json(data['analysis_period'])
-        return cls(location, data['data_type'], data['unit'], ap, data['middle_hour'])
+        location = data.get('location')
+        location = Location.from_json(dict(location)) if location else None
+        ap = data.get('analysis_period')
+        header = cls(location, data.get('data_type'), data.get('unit'),
+                     AnalysisPeriod.from_json(dict(ap)) if ap else None,
+                     data.get('middle_hour'))
+        if 'analysis_period' in data and not ap:
+            # header of a collection with no analysis period (e.g. filtered data)
+            header.analysis_period = None
+        return header
 
     @classmethod
     def from_header(cls, header):
@@ -106,10 +107,11 @@ class Header(object):
 
     def to_json(self):
         """Return a header as a dictionary."""
-        return {'location': self.location.to_json(),
+        return {'location': self.location.to_json() if self.location else None,
                 'data_type': self.data_type,
                 'unit': self.unit,
-                'analysis_period': self.analysis_period.to_json(),
+                'analysis_period': self.analysis_period.to_json()
+                if self.analysis_period else None,
                 'middle_hour': self.middle_hour}
 
     def ToString(self):
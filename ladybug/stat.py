@@ -6,6 +6,7 @@ from .designday import HumidityCondition
 from .designday import WindCondition
 from .designday import RevisedClearSkyCondition
 from .designday import OriginalClearSkyCondition
+from .futil import is_archive, find_archive_member, open_archive_member
 
 import os
 import re
@@ -17,7 +18,9 @@ class STAT(object):
     """Import data from a local .stat file.
 
     args:
-        file_path: Local file address to a .stat file.
+        file_path: Local file address to a .stat file. It can also be a path to a
+            .zip or a .gz file with a stat file inside or a file object to read
+            the stat data from.
 
     properties:
         location
@@ -29,15 +32,27 @@ class STAT(object):
 
     def __init__(self, file_path):
         """Initalize the class."""
-        if not os.path.isfile(file_path):
-            raise ValueError(
-                'Cannot find an stat file at {}'.format(file_path))
+        self._stat_file = None  # file object to read the data from
+        self._archive_member = None  # name of stat file inside an archive
+        if hasattr(file_path, 'read'):
+            self._stat_file = file_path
+            name = getattr(file_path, 'name', None)
+            self._file_path = os.path.normpath(name) \
+                if isinstance(name, str) else None
+        else:
+            if not os.path.isfile(file_path):
+                raise ValueError(
+                    'Cannot find an stat file at {}'.format(file_path))
+
+            if is_archive(file_path):
+                self._archive_member = find_archive_member(file_path, '.stat')
+            elif not file_path.lower().endswith('stat'):
+                raise TypeError('{} is not an .stat file.'.format(file_path))
 
-        if not file_path.lower().endswith('stat'):
-            raise TypeError('{} is not an .stat file.'.format(file_path))
+            self._file_path = os.path.normpath(file_path)
 
-        self._file_path = os.path.normpath(file_path)
-        self._folder, self._file_name = os.path.split(self.file_path)
+        self._folder, self._file_name = os.path.split(self.file_path) \
+            if self.file_path else (None, None)
 
         # defaults empty state for certain parameters
         self._winter_des_day_dict = {}
@@ -47,11 +62,40 @@ class STAT(object):
         # import the data from the file
         self._import_data()
 
+    @classmethod
+    def from_archive(cls, archive_path, member=None):
+        """Import a stat file inside a .zip or a .gz file without extracting it.
+
+        Args:
+            archive_path: Local file address to a .zip or a .gz file.
+            member: Name of the stat file inside a zip file. Default is the first
+                stat file in the archive.
+        """
+        if not is_archive(archive_path):
+            raise ValueError('{} is not a .zip or a .gz file.'.format(archive_path))
+        member = find_archive_member(archive_path, '.stat', member)
+        with open_archive_member(archive_path, member) as statwin:
+            stat = cls(statwin)
+        stat._file_path = os.path.normpath(archive_path)
+        stat._folder, stat._file_name = os.path.split(stat._file_path)
+        stat._archive_member = member
+        stat._stat_file = None
+        return stat
+
     @property
     def file_path(self):
-        """Get the path to the stat file."""
+        """Get the path to the stat file.
+
+        For stat files inside an archive this is the path to the archive.
+        """
         return self._file_path
 
+    @property
+    def archive_member(self):
+        """Get the name of the stat file inside the archive if loaded from an archive.
+        """
+        return self._archive_member
+
     @property
     def folder(self):
         """Get stat file folder."""
@@ -77,15 +121,23 @@ class STAT(object):
             if 'IronPython' in str(e):
                 iron_python = True
 
-        if iron_python:
+        if self._stat_file is not None:
+            statwin = self._stat_file
+        elif self._archive_member is not None:
+            statwin = open_archive_member(self.file_path, self._archive_member)
+        elif iron_python:
             statwin = codecs.open(self.file_path, 'r')
         else:
             statwin = codecs.open(self.file_path, 'r', encoding='utf-8', errors='ignore')
         try:
-            line = statwin.readline()
+            lines = [statwin.readline() for i in range(10)]
+            body = statwin.read()
+            if isinstance(body, bytes) and not isinstance(body, str):
+                lines = [line.decode('utf-8', 'ignore') for line in lines]
+                body = body.decode('utf-8', 'ignore')
             # import header with location
-            self._header = [line] + [statwin.readline() for i in range(9)]
-            self._body = statwin.read()
+            self._header = lines
+            self._body = body
         except Exception as e:
             import traceback
             raise Exception('{}\n{}'.format(e, traceback.format_exc()))
@@ -107,7 +159,7 @@ class STAT(object):
                 matches = coord_pattern.findall(self._header[3].replace('\xb0', 'deg'))
             else:
                 # CPython
-                coord_pattern = re.compile(r"{([NSEW])(\s*\d*) (\s*\d*)'}")
+                coord_pattern = re.compile(r"{([NSEW])(\s*\d*)[^\d\s']*\s(\s*\d*)'}")
                 matches = coord_pattern.findall(self._header[3])
             lat_sign = -1 if matches[0][0] == 'S' else 1
             latitude = lat_sign * (float(matches[0][1]) + (float(matches[0][2]) / 60))
@@ -177,7 +229,9 @@ class STAT(object):
                     self._monthly_wind_dirs.append(dirs)
 
         finally:
-            statwin.close()
+            # leave closing of the file objects to the caller
+            if statwin is not self._stat_file:
+                statwin.close()
 
     def _regex_check(self, regex_str, search_space):
         matches = re.compile(regex_str).findall(search_space)
@@ -0,0 +1,297 @@
+# coding=utf-8
+"""Spatial index of weather files for finding the nearest stations to a location.
+
+The index only reads the location of each weather file and can be saved to a small
+json file. Loading a saved index and querying it does not open the weather files.
+"""
+from .location import Location
+from .epw import EPW
+from .stat import STAT
+
+from collections import namedtuple
+import heapq
+import json
+import math
+import os
+
+EARTHRADIUS = 6371.0088  # mean radius of the earth in km
+
+Station = namedtuple('Station', 'file_path location distance')
+"""A weather station in the index.
+
+Attributes:
+    file_path: Full path to the weather file.
+    location: Ladybug location of the weather file.
+    distance: Great-circle distance to the query point in km (None for the
+        stations which are not the result of a query).
+"""
+
+
+def _to_vector(latitude, longitude):
+    """Convert latitude and longitude to a point on the unit sphere."""
+    lat = math.radians(latitude)
+    lon = math.radians(longitude)
+    return (math.cos(lat) * math.cos(lon), math.cos(lat) * math.sin(lon),
+            math.sin(lat))
+
+
+def _chord_to_distance(chord):
+    """Convert the straight distance between two points on the unit sphere to km."""
+    return 2 * EARTHRADIUS * math.asin(min(chord / 2.0, 1.0))
+
+
+def _distance_to_chord(distance):
+    """Convert a great-circle distance in km to the distance on the unit sphere."""
+    return 2 * math.sin(min(distance / (2.0 * EARTHRADIUS), math.pi / 2))
+
+
+class StationIndex(object):
+    """A spatial index of weather stations for fast nearest station queries.
+
+    The stations are kept in a kd-tree of points on the unit sphere so the queries
+    work across the poles and the date line.
+
+    args:
+        stations: A list of (file_path, location) tuples.
+
+    Usage:
+
+        index = StationIndex.from_folder("c:/ladybug/weather",
+                                         "c:/ladybug/weather/stations.json")
+        for station in index.nearest(41.98, -87.92, 3):
+            print(station.file_path, station.distance)
+    """
+
+    VERSION = 1
+
+    def __init__(self, stations=None):
+        """Init class."""
+        self._stations = [(os.path.abspath(path), location)
+                          for path, location in (stations or ())]
+        self._signatures = {}  # file signatures to update the index
+        self._build_tree()
+
+    @classmethod
+    def from_folder(cls, folder, index_file=None, extensions=('.epw',)):
+        """Create an index from the weather files in a folder and its subfolders.
+
+        Only the location of the files is read. If index_file already exists the
+        locations of the files that haven't changed are reused from the index file.
+
+        args:
+            folder: Path to a folder with weather files.
+            index_file: Optional path to a json file to save the index. Use the
+                same file to update the index once files are added or changed.
+            extensions: A tuple of file extensions to be indexed. Files with .epw
+                and .stat extensions are supported (Default: ('.epw',)).
+        """
+        if not os.path.isdir(folder):
+            raise ValueError('Cannot find a folder at {}'.format(folder))
+
+        existing = {}
+        if index_file and os.path.isfile(index_file):
+            try:
+                existing = cls.from_file(index_file)._signatures
+            except (ValueError, KeyError):
+                # corrupted or outdated index file. rebuild the index.
+                existing = {}
+
+        extensions = tuple(ext.lower() for ext in extensions)
+        stations = []
+        signatures = {}
+        for root, dirs, files in os.walk(folder):
+            dirs.sort()
+            for f in sorted(files):
+                if not f.lower().endswith(extensions):
+                    continue
+                path = os.path.abspath(os.path.join(root, f))
+                st = os.stat(path)
+                signature = (st.st_size, st.st_mtime)
+                if path in existing and existing[path][0] == signature:
+                    location = existing[path][1]
+                else:
+                    try:
+                        location = cls._read_location(path)
+                    except Exception as e:
+                        print('Failed to read location from {}:\n\t{}'.format(path, e))
+                        continue
+                signatures[path] = (signature, location)
+                stations.append((path, location))
+
+        index = cls(stations)
+        index._signatures = signatures
+        if index_file:
+            index.save(index_file)
+        return index
+
+    @classmethod
+    def from_file(cls, file_path):
+        """Load an index from a json file which is created using the save method."""
+        with open(file_path, 'r') as inf:
+            data = json.load(inf)
+        if data.get('version') != cls.VERSION:
+            raise ValueError('{} is not a valid station index file.'.format(file_path))
+
+        # paths are relative to the index file
+        folder = os.path.dirname(os.path.abspath(file_path))
+        stations = []
+        signatures = {}
+        for s in data['stations']:
+            path = os.path.abspath(os.path.join(folder, s['path']))
+            location = Location(s['city'], s['country'], s['latitude'],
+                                s['longitude'], s['time_zone'], s['elevation'],
+                                s['station_id'], s['source'])
+            stations.append((path, location))
+            signatures[path] = ((s['size'], s['mtime']), location)
+        index = cls(stations)
+        index._signatures = signatures
+        return index
+
+    @staticmethod
+    def _read_location(file_path):
+        """Read the location of a weather file."""
+        if file_path.lower().endswith('.stat'):
+            return STAT(file_path).location
+        return EPW(file_path).location
+
+    @property
+    def stations(self):
+        """A list of all the stations in the index."""
+        return [Station(path, location, None) for path, location in self._stations]
+
+    def save(self, file_path):
+        """Save the index to a json file.
+
+        File paths are saved relative to the index file.
+        """
+        folder = os.path.dirname(os.path.abspath(file_path))
+        stations = []
+        for path, location in self._stations:
+            size, mtime = self._signatures[path][0] \
+                if path in self._signatures else (None, None)
+            stations.append({
+                'path': os.path.relpath(path, folder),
+                'size': size,
+                'mtime': mtime,
+                'city': location.city,
+                'country': location.country,
+                'latitude': location.latitude,
+                'longitude': location.longitude,
+                'time_zone': location.time_zone,
+                'elevation': location.elevation,
+                'station_id': location.station_id,
+                'source': location.source
+            })
+        with open(file_path, 'w') as outf:
+            json.dump({'version': self.VERSION, 'stations': stations}, outf)
+        return file_path
+
+    def _build_tree(self):
+        """Build a kd-tree from the points of the stations.
+
+        Each node is a list of [station index, split axis, left node, right node].
+        """
+        self._points = [_to_vector(location.latitude, location.longitude)
+                        for path, location in self._stations]
+
+        def build(indices, depth):
+            if not indices:
+                return None
+            axis = depth % 3
+            indices.sort(key=lambda i: self._points[i][axis])
+            median = len(indices) // 2
+            return [indices[median], axis,
+                    build(indices[:median], depth + 1),
+                    build(indices[median + 1:], depth + 1)]
+
+        self._tree = build(list(range(len(self._stations))), 0)
+
+    def _station(self, i, chord):
+        """Get a station from the index of the station in the tree."""
+        path, location = self._stations[i]
+        return Station(path, location, _chord_to_distance(chord))
+
+    def nearest(self, latitude, longitude, count=1):
+        """Get the nearest stations to a location.
+
+        args:
+            latitude: Latitude of the location.
+            longitude: Longitude of the location.
+            count: Number of stations to be returned (Default: 1).
+
+        Returns:
+            A list of stations sorted by distance.
+        """
+        target = _to_vector(latitude, longitude)
+        points = self._points
+        heap = []  # max heap of the nearest stations as (-squared chord, index)
+
+        def search(node):
+            while node is not None:
+                i, axis, left, right = node
+                p = points[i]
+                d = (p[0] - target[0]) ** 2 + (p[1] - target[1]) ** 2 + \
+                    (p[2] - target[2]) ** 2
+                if len(heap) < count:
+                    heapq.heappush(heap, (-d, i))
+                elif d < -heap[0][0]:
+                    heapq.heapreplace(heap, (-d, i))
+
+                diff = target[axis] - p[axis]
+                near, far = (left, right) if diff < 0 else (right, left)
+                search(near)
+                # only search the other side if it can have a nearer station
+                if len(heap) < count or diff ** 2 < -heap[0][0]:
+                    node = far
+                else:
+                    node = None
+
+        if count > 0:
+            search(self._tree)
+        return [self._station(i, math.sqrt(-d)) for d, i in sorted(heap, reverse=True)]
+
+    def within(self, latitude, longitude, radius):
+        """Get all the stations within a radius from a location.
+
+        args:
+            latitude: Latitude of the location.
+            longitude: Longitude of the location.
+            radius: Radius in km.
+
+        Returns:
+            A list of stations sorted by distance.
+        """
+        target = _to_vector(latitude, longitude)
+        max_d = _distance_to_chord(radius) ** 2
+        points = self._points
+        found = []
+        nodes = [self._tree]
+        while nodes:
+            node = nodes.pop()
+            if node is None:
+                continue
+            i, axis, left, right = node
+            p = points[i]
+            d = (p[0] - target[0]) ** 2 + (p[1] - target[1]) ** 2 + \
+                (p[2] - target[2]) ** 2
+            if d <= max_d:
+                found.append((d, i))
+            diff = target[axis] - p[axis]
+            if diff < 0 or diff ** 2 <= max_d:
+                nodes.append(left)
+            if diff >= 0 or diff ** 2 <= max_d:
+                nodes.append(right)
+
+        return [self._station(i, math.sqrt(d)) for d, i in sorted(found)]
+
+    def __len__(self):
+        """Return number of stations."""
+        return len(self._stations)
+
+    def ToString(self):
+        """Overwrite .NET ToString."""
+        return self.__repr__()
+
+    def __repr__(self):
+        """Station index representation."""
+        return "Station Index [%d stations]" % len(self._stations)
@@ -5,7 +5,7 @@ from .stat import STAT
 from .location import Location
 from .dt import DateTime
 from .header import Header
-from .datacollection import DataCollection
+from .datacollection import DataCollection, CompactDataCollection
 from .datatype import DataPoint
 from .analysisperiod import AnalysisPeriod
 from .sunpath import Sunpath
@@ -16,8 +16,10 @@ from .skymodel import ashrae_revised_clear_sky
 from .skymodel import ashrae_clear_sky
 from .skymodel import zhang_huang_solar_model
 
+import json
 import math
 import os
+import struct
 
 try:
     from itertools import izip as zip
@@ -30,6 +32,9 @@ except ImportError:
     writemode = 'w'
     xrange = range
 
+# magic, version, json document size, direct normal radiation size
+_BYTES_HEADER = struct.Struct('<5sBII')
+
 
 class Wea(object):
     """An annual WEA object containing solar radiation.
@@ -46,6 +51,8 @@ class Wea(object):
             Default is False.
     """
 
+    BYTESVERSION = 1
+
     def __init__(self, location, direct_normal_radiation,
                  diffuse_horizontal_radiation, timestep=1, is_leap_year=False):
         """Create a wea object."""
@@ -95,31 +102,26 @@ class Wea(object):
         """ Create Wea from json file
             {
             "location": {} , // ladybug location schema
-            "direct_normal_radiation": [], // List of hourly direct normal
-                radiation data points
-            "diffuse_horizontal_radiation": [], // List of hourly diffuse
-                horizontal radiation data points
+            "direct_normal_radiation": {}, // ladybug data collection schema for
+                direct normal radiation
+            "diffuse_horizontal_radiation": {}, // ladybug data collection schema
+                for diffuse horizontal radiation
             "timestep": float //timestep between measurements, default is 1
             }
         """
         required_keys = ('location', 'direct_normal_radiation',
                          'diffuse_horizontal_radiation')
-        optional_keys = ('timestep', 'is_leap_year')
 
         for key in required_keys:
             assert key in data, 'Required key "{}" is missing!'.format(key)
 
-        for key in optional_keys:
-            if key not in data:
-                data[key] = None
-
-        location = Location.from_json(data['location'])
+        location = Location.from_json(dict(data['location']))
         direct_normal_radiation = \
             DataCollection.from_json(data['direct_normal_radiation'])
         diffuse_horizontal_radiation = \
             DataCollection.from_json(data['diffuse_horizontal_radiation'])
-        timestep = data['timestep']
-        is_leap_year = data['is_leap_year']
+        timestep = data.get('timestep')
+        is_leap_year = data.get('is_leap_year')
 
         return cls(location, direct_normal_radiation,
                    diffuse_horizontal_radiation, timestep, is_leap_year)
@@ -188,31 +190,29 @@ class Wea(object):
                    "are suitable for thermal models but are not recommended \n" +
                    "for daylight models.")
             # interpolate the data
-            direct_norm_values = direct_normal.interpolate_data(timestep)
-            diffuse_horiz_values = diffuse_horizontal.interpolate_data(timestep)
-            # build empty dta collections
+            direct_norm_values = direct_normal.interpolate_to_timestep(timestep).values
+            diffuse_horiz_values = \
+                diffuse_horizontal.interpolate_to_timestep(timestep).values
+            # set radiation values to 0 when the sun is not up
+            sun_up = cls._get_sun_up_pattern(epw.location, timestep, False)
+            direct_norm_values = [v if up else 0
+                                  for v, up in zip(direct_norm_values, sun_up)]
+            diffuse_horiz_values = [v if up else 0
+                                    for v, up in zip(diffuse_horiz_values, sun_up)]
+            # build the data collections
             direct_normal, diffuse_horizontal = \
                 cls._get_empty_data_collections(epw.location, timestep, False)
-            # create sunpath to check if the sun is up at a given timestep
-            sp = Sunpath.from_location(epw.location)
-            # add correct values to the emply data collection
-            for e_beam, e_diff in zip(direct_norm_values, diffuse_horiz_values):
-                # set radiation values to 0 when the sun is not up
-                sun = sp.calculate_sun_from_date_time(e_beam.datetime)
-                if sun.altitude > 0:
-                    direct_normal.append(e_beam)
-                    diffuse_horizontal.append(e_diff)
-                else:
-                    direct_normal.append(DataPoint(
-                        0, e_beam.datetime, 'SI', 'Direct Normal Radiation'))
-                    diffuse_horizontal.append(DataPoint(
-                        0, e_diff.datetime, 'SI', 'Diffuse Horizontal Radiation'))
+            direct_normal = CompactDataCollection(direct_norm_values,
+                                                  direct_normal.header)
+            diffuse_horizontal = CompactDataCollection(diffuse_horiz_values,
+                                                       diffuse_horizontal.header)
         else:
             # add half an hour to datetime to put sun in the middle of the hour
-            for dnr in direct_normal:
-                dnr.datetime = dnr.datetime.add_minute(30)
-            for dhr in diffuse_horizontal:
-                dhr.datetime = dhr.datetime.add_minute(30)
+            moys = [moy + 30 for moy in direct_normal.moys]
+            direct_normal = CompactDataCollection(
+                direct_normal.values, direct_normal.header, moys)
+            diffuse_horizontal = CompactDataCollection(
+                diffuse_horizontal.values, diffuse_horizontal.header, moys)
 
         # epw file is always for 8760 hours
         is_leap_year = False
@@ -433,12 +433,12 @@ class Wea(object):
     @property
     def hoys(self):
         """Hours of the year in wea file."""
-        return tuple(data.datetime.hoy for data in self.direct_normal_radiation)
+        return tuple(dt.hoy for dt in self.direct_normal_radiation.datetimes)
 
     @property
     def datetimes(self):
         """Datetimes in wea file."""
-        return tuple(data.datetime for data in self.direct_normal_radiation)
+        return self.direct_normal_radiation.datetimes
 
     @property
     def timestep(self):
@@ -543,6 +543,68 @@ class Wea(object):
             for count in xrange(hour_count * timestep)
         )
 
+    @staticmethod
+    def _get_sun_up_pattern(location, timestep, is_leap_year):
+        """List of booleans for the timesteps of the year when the sun is up.
+
+        The sun is only calculated around sunrise and sunset of each day and the
+        first and the last timesteps when the sun is up are found with a binary
+        search. Days without a clear sunrise and sunset (e.g. polar days) are
+        calculated for every timestep.
+        """
+        sp = Sunpath.from_location(location)
+        sp.is_leap_year = is_leap_year
+        minutes_step = 60 // timestep
+        day_count = 24 * timestep
+
+        def is_up(moy):
+            dt = DateTime.from_moy(moy, is_leap_year)
+            return sp.calculate_sun_from_date_time(dt).altitude > 0
+
+        def find_change(start, lo, hi):
+            """Find the first timestep in (lo, hi] with a different sun state."""
+            state = is_up(start + lo * minutes_step)
+            if is_up(start + hi * minutes_step) == state:
+                return None
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if is_up(start + mid * minutes_step) == state:
+                    lo = mid
+                else:
+                    hi = mid
+            return hi if not state else -hi
+
+        pattern = []
+        for day in xrange(366 if is_leap_year else 365):
+            start = day * 1440
+            try:
+                times = sp.calculate_sunrise_sunset_from_datetime(
+                    DateTime.from_moy(start + 720, is_leap_year))
+                rise = times['sunrise'].hour * timestep + \
+                    times['sunrise'].minute // minutes_step
+                sett = times['sunset'].hour * timestep + \
+                    times['sunset'].minute // minutes_step
+            except (AttributeError, ValueError):
+                # no sunrise or sunset for this day
+                rise = sett = None
+
+            if rise is not None and timestep < rise and sett + timestep < day_count \
+                    and rise + timestep < sett - timestep:
+                # sun rises in the hour around sunrise and sets around sunset
+                first_up = find_change(start, rise - timestep, rise + timestep)
+                first_down = find_change(start, sett - timestep, sett + timestep)
+                if first_up is not None and first_up > 0 and \
+                        first_down is not None and first_down < 0:
+                    first_down = -first_down
+                    pattern.extend([False] * first_up)
+                    pattern.extend([True] * (first_down - first_up))
+                    pattern.extend([False] * (day_count - first_down))
+                    continue
+
+            pattern.extend(is_up(start + i * minutes_step) for i in xrange(day_count))
+
+        return pattern
+
     @staticmethod
     def _get_empty_data_collections(location, timestep, is_leap_year):
         """Return two empty data collection.
@@ -678,10 +740,10 @@ class Wea(object):
         """Write Wea to json file
             {
             "location": {} , // ladybug location schema
-            "direct_normal_radiation": (), // Tuple of hourly direct normal
-                radiation
-            "diffuse_horizontal_radiation": (), // Tuple of hourly diffuse
-                horizontal radiation
+            "direct_normal_radiation": {}, // ladybug data collection schema for
+                direct normal radiation
+            "diffuse_horizontal_radiation": {}, // ladybug data collection schema
+                for diffuse horizontal radiation
             "timestep": float //timestep between measurements, default is 1
             }
         """
@@ -695,6 +757,53 @@ class Wea(object):
             'is_leap_year': self.is_leap_year
         }
 
+    def to_bytes(self):
+        """Convert the Wea to bytes.
+
+        The bytes start with a small binary header and a json document for the
+        location followed by the bytes of the two data collections.
+
+        Usage:
+
+            data = wea.to_bytes()
+            wea = Wea.from_bytes(data)
+        """
+        meta = json.dumps({
+            'location': self.location.to_json(),
+            'timestep': self.timestep,
+            'is_leap_year': self.is_leap_year
+        }).encode('utf-8')
+        direct = self.direct_normal_radiation.to_bytes()
+        diffuse = self.diffuse_horizontal_radiation.to_bytes()
+        return b''.join((
+            _BYTES_HEADER.pack(b'LBWEA', self.BYTESVERSION, len(meta), len(direct)),
+            meta, direct, diffuse))
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Create a Wea from bytes which are created using to_bytes.
+
+        Args:
+            data: Bytes of a Wea.
+        """
+        magic, version, meta_size, direct_size = _BYTES_HEADER.unpack_from(data)
+        if magic != b'LBWEA' or version != cls.BYTESVERSION:
+            raise ValueError('Bytes are not a valid Wea.')
+        start = _BYTES_HEADER.size
+        meta = json.loads(data[start:start + meta_size].decode('utf-8'))
+        start += meta_size
+        direct_normal_radiation = \
+            DataCollection.from_bytes(data[start:start + direct_size])
+        diffuse_horizontal_radiation = \
+            DataCollection.from_bytes(data[start + direct_size:])
+        return cls(Location.from_json(meta['location']), direct_normal_radiation,
+                   diffuse_horizontal_radiation, meta['timestep'],
+                   meta['is_leap_year'])
+
+    def __reduce__(self):
+        # pickle the packed values instead of data points
+        return _wea_from_bytes, (self.to_bytes(),)
+
     def write(self, file_path, hoys=None, write_hours=False):
         """Write the wea file.
 
@@ -752,3 +861,11 @@ class Wea(object):
     def __repr__(self):
         """epw file representation."""
         return "WEA [%s]" % self.location.city
+
+
+def _wea_from_bytes(data):
+    """Create a Wea from bytes when it is unpickled.
+
+    Bound class methods can't be pickled in python 2.
+    """
+    return Wea.from_bytes(data)
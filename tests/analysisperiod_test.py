@@ -88,6 +88,12 @@ class AnalysisPeriodTestCase(unittest.TestCase):
         assert annual_ap.is_annual
         assert not not_annual_ap.is_annual
 
+    def test_reversed_leap_year(self):
+        ap = AnalysisPeriod(12, 1, 0, 2, 28, 23, is_leap_year=True)
+        assert len(ap) == (31 + 31 + 28) * 24
+        assert ap.datetimes[-1].month == 2
+        assert ap.datetimes[-1].day == 28
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,9 +2,11 @@
 
 import unittest
 import pytest
+import pickle
+from array import array
 from ladybug.datatype import DryBulbTemperature
 from ladybug.dt import DateTime
-from ladybug.datacollection import DataCollection
+from ladybug.datacollection import DataCollection, CompactDataCollection
 from ladybug.header import Header
 from ladybug.analysisperiod import AnalysisPeriod
 
@@ -45,6 +47,233 @@ class DataCollectionTestCase(unittest.TestCase):
         assert dc1.data == [v1, v2]
         assert dc1.average_data() == average
 
+    def test_compact_collection(self):
+        """Test a data collection with values in a packed array."""
+        ap = AnalysisPeriod(end_month=1, end_day=2)
+        header = Header(None, 'Temperature', 'C', ap)
+        dc = CompactDataCollection(range(48), header)
+        assert dc.is_compact is True
+        assert len(dc) == 48
+        assert dc.values == list(range(48))
+        assert dc.datetimes == ap.datetimes
+        assert dc.moys == ap.moys
+        assert dc.average_data() == 23.5
+        assert dc.duplicate().values == dc.values
+
+        with pytest.raises(ValueError):
+            CompactDataCollection(range(10), header)
+
+        # data points are created on request and changes are kept
+        dc[1].value = 100
+        assert dc.is_compact is False
+        assert dc.values[:3] == [0, 100, 2]
+        assert dc.datetimes == ap.datetimes
+
+        dc = CompactDataCollection([1, 2, 3], moys=(0, 120, 180))
+        assert [str(dt) for dt in dc.datetimes] == \
+            ['01 Jan 00:00', '01 Jan 02:00', '01 Jan 03:00']
+
+    def test_arithmetic(self):
+        """Test arithmetic operators between data collections and numbers."""
+        ap = AnalysisPeriod(end_month=1, end_day=1)
+        dc1 = CompactDataCollection(range(24), Header(None, 'Temperature', 'C', ap))
+        dc2 = CompactDataCollection([2] * 24, Header(None, 'Temperature', 'C', ap))
+        humid = CompactDataCollection([50] * 24, Header(None, 'Humidity', '%', ap))
+
+        diff = dc1 - dc2
+        assert isinstance(diff, CompactDataCollection)
+        assert diff.values[:3] == [-2, -1, 0]
+        assert diff.header.unit == 'C'
+        assert diff.datetimes == dc1.datetimes
+        assert (dc1 + 1).values[:2] == [1, 2]
+        assert (10 - dc1).values[:2] == [10, 9]
+        assert (dc1 * dc2).header.unit == 'C*C'
+        assert (dc1 / 2).values[:2] == [0, 0.5]
+        assert (dc1 ** 2).values[:3] == [0, 1, 4]
+        assert (dc1 ** 2).header.unit == 'C^2'
+        assert (2 ** dc1).header.unit is None
+        assert (dc1 ** dc2).header.unit is None
+        assert (1 / dc2).header.unit == '1/C'
+        assert (dc1 / 2).header.unit == 'C'
+        no_unit = CompactDataCollection([2] * 24, Header(analysis_period=ap))
+        assert (no_unit * no_unit).header.unit is None
+        assert (no_unit * no_unit).header.data_type is None
+        assert (dc1 * no_unit).header.unit is None
+        assert abs(-dc1).values == dc1.values
+        assert dc1.clip(2, 5).values[:7] == [2, 2, 2, 3, 4, 5, 5]
+        assert dc1.maximum(dc2).values[:4] == [2, 2, 2, 3]
+        assert dc1.minimum(3).values[-2:] == [3, 3]
+        assert sum(dc1 > 20) == 3
+        assert len(dc1.filter_by_pattern(dc1 <= dc2)) == 3
+
+        with pytest.raises(ValueError):
+            dc1 + humid
+        with pytest.raises(ValueError):
+            dc1 + CompactDataCollection(range(48), Header(analysis_period=AnalysisPeriod(
+                end_month=1, end_day=2)))
+
+        data = DataCollection.from_data_and_analysis_period(range(24), ap)
+        assert (data + dc2).values == (dc1 + 2).values
+        assert type(data * 2) is DataCollection
+
+    def test_filter_by_moys(self):
+        """Test filtering data collections by minutes and hours of the year."""
+        ap = AnalysisPeriod(timestep=4)
+        dc = CompactDataCollection(range(8760 * 4), Header(analysis_period=ap))
+        filtered = dc.filter_by_moys([15, 0, 30, 45.5, 60, -15, 525600])
+        assert filtered.values == [0, 1, 2, 4]
+        assert filtered.moys == (0, 15, 30, 60)
+        assert filtered.filter_by_hoys([0.25, 1]).values == [1, 4]
+        assert filtered.filter_by_pattern([True, False]).values == [0, 2]
+
+        winter = AnalysisPeriod(12, 1, 0, 2, 28, 23, 4)
+        filtered = dc.filter_by_analysis_period(winter)
+        assert len(filtered) == len(winter)
+        assert filtered.header.analysis_period == winter
+        assert filtered.datetimes == tuple(sorted(winter.datetimes))
+
+        data = DataCollection.from_data_and_analysis_period(range(48), AnalysisPeriod(
+            end_month=1, end_day=2))
+        assert data.filter_by_hoys(range(0, 48, 6)).values == list(range(0, 48, 6))
+
+        # collections with data points use the indices for continuous annual data
+        annual = DataCollection.from_data_and_analysis_period(
+            range(8760 * 4), ap, Header(analysis_period=ap))
+        filtered = annual.filter_by_moys([15, 0, 30, 45.5, 60, -15, 525600])
+        assert filtered.values == [0, 1, 2, 4]
+        assert tuple(d.moy for d in filtered.datetimes) == (0, 15, 30, 60)
+        # data points which are not in order are found by their datetimes
+        data_points = list(annual.data)
+        data_points[1], data_points[4] = data_points[4], data_points[1]
+        shuffled = DataCollection(data_points, annual.header)
+        assert shuffled.filter_by_moys([15]).values == [1]
+        data_points = list(annual.data)
+        gap = DataCollection(data_points[:2] + data_points[3:] + data_points[-1:],
+                             annual.header)
+        assert gap.filter_by_moys([30, 45]).values == [3]
+
+        assert dc.filter_by_analysis_period().values == dc.values
+        assert data.filter_by_analysis_period(None).values == data.values
+
+    def test_update_data_for_hours_of_year(self):
+        ap = AnalysisPeriod()
+        header = Header(None, 'Temperature', 'C', ap)
+        compact = CompactDataCollection(range(8760), header)
+        compact.update_data_for_hours_of_year([0.5, 1.5, 2.5], [0, 10, 10])
+        assert compact._data is None
+        assert compact.values[:2] == [0.5, 1]
+        assert compact.values[10] == 1.5
+
+        data = DataCollection.from_data_and_analysis_period(range(8760), ap, header)
+        data.update_data_for_hours_of_year([0.5, 1.5, 2.5], [0, 10, 10])
+        assert data.values == compact.values
+
+        with pytest.raises(ValueError):
+            data.update_data_for_hours_of_year([0.5], [0, 10])
+
+    def test_filter_by_conditional_statement(self):
+        ap = AnalysisPeriod(end_month=1, end_day=2)
+        temp = CompactDataCollection(range(48), Header(None, 'Temperature', 'C', ap))
+        humid = CompactDataCollection([50, 30] * 24, Header(None, 'Humidity', '%', ap))
+        assert temp.filter_by_conditional_statement('x > 40').values == \
+            list(range(41, 48))
+        filtered = temp.filter_by_conditional_statement(
+            'x % 5 == 0 and rh < 40', {'rh': humid})
+        assert filtered.values == [5, 15, 25, 35, 45]
+        assert filtered.datetimes[0].hour == 5
+
+        data = DataCollection.from_data_and_analysis_period(range(48), ap)
+        assert data.filter_by_conditional_statement('x in (1, 2)').values == [1, 2]
+        assert data.filter_by_conditional_statement('x not in [0, 1]').values == \
+            list(range(2, 48))
+
+        for statement in ('y > 25', 'x.real > 25', '__import__("os")', 'x > "a"',
+                          'x > 9 ** 9 ** 9', '[0] * 10000000000 == x',
+                          'x in (1, 2) * 10000000000', 'x in ((1, 2),)',
+                          '(1, 2) == (x, x)', 'x // 0 > 1', 'x % 0 == 1'):
+            with pytest.raises(ValueError):
+                temp.filter_by_conditional_statement(statement)
+        with pytest.raises(ValueError):
+            temp.filter_by_conditional_statement('x > rh', {'rh': range(48)})
+        for name in ('y=().__class__.__base__.__subclasses__()', 'if', '1y', 'None'):
+            with pytest.raises(ValueError):
+                data.filter_by_conditional_statement('x > 1', {name: data})
+
+    def test_aggregate(self):
+        ap = AnalysisPeriod(end_month=1, end_day=2)
+        header = Header(None, 'Temperature', 'C', ap)
+        compact = CompactDataCollection(range(48), header)
+        data = DataCollection.from_data_and_analysis_period(range(48), ap, header)
+        for dc in (compact, data):
+            daily = dc.aggregate('day', ('mean', 'min', 'max', 'sum', 'count', 'std'))
+            assert list(daily.keys()) == [1, 2]
+            assert list(daily[2].values()) == \
+                [35.5, 24, 47, 852, 24, pytest.approx(6.922186552)]
+            hourly = dc.aggregate(('hour', 'day'), 'max')
+            assert list(hourly.items())[:3] == [((0, 1), 0), ((0, 2), 24), ((1, 1), 1)]
+            assert dc.aggregate(('month', 'hour'), 'count')[(1, 12)] == 2
+            assert dc.average_monthly_for_each_hour()[1][12] == 24
+            assert dc.aggregate(u'day', u'max') == dc.aggregate('day', 'max')
+
+        with pytest.raises(ValueError):
+            compact.aggregate('week')
+        with pytest.raises(ValueError):
+            compact.aggregate('month', 'median')
+
+        # standard deviation keeps its precision for large values (e.g. pressure)
+        statistics = pytest.importorskip('statistics')
+        values = [101325 + 0.01 * (i % 7) for i in range(48)]
+        pressure = CompactDataCollection(values, Header(None, 'Pressure', 'Pa', ap))
+        assert pressure.aggregate('day', 'std')[1] == \
+            pytest.approx(statistics.pstdev(values[:24]), rel=1e-9)
+
+    def test_rolling(self):
+        ap = AnalysisPeriod(end_month=1, end_day=1, timestep=2)
+        dc = CompactDataCollection([3, 1, 4, 1, 5, 9] * 8, Header(analysis_period=ap))
+        assert dc.rolling(1, 'sum').values[:4] == [3, 4, 5, 5]
+        assert dc.rolling(1.5, 'max').values[:6] == [3, 3, 4, 4, 5, 9]
+        assert dc.rolling(1.5, 'min').values[:6] == [3, 1, 1, 1, 1, 1]
+        assert dc.rolling(1, 'mean').values[:2] == [3, 2]
+        with pytest.raises(ValueError):
+            dc.rolling(1, 'median')
+        with pytest.raises(ValueError):
+            dc.rolling(1, wrap=True)
+
+        annual = CompactDataCollection(
+            range(8760), Header(analysis_period=AnalysisPeriod()))
+        rolled = annual.rolling(3, 'sum')
+        assert rolled.values[:3] == [8758 + 8759, 8759 + 1, 3]
+        assert annual.rolling(3, 'sum', wrap=False).values[:3] == [0, 1, 3]
+        assert annual.cumulative_sum().values[:4] == [0, 1, 3, 6]
+
+        running = dc.running_mean(0.5, wrap=False)
+        assert running.values[:3] == [3, 2, 3]
+        assert annual.running_mean(1).values == annual.values
+
+    def test_percentiles_and_histogram(self):
+        dc = CompactDataCollection([3, 1, 4, 1, 5, 9, 2, 6] * 3, Header(
+            analysis_period=AnalysisPeriod(end_month=1, end_day=1)))
+        assert dc.top_k(3) == ([9, 9, 9], [5, 13, 21])
+        assert dc.bottom_k(4) == ([1, 1, 1, 1], [1, 3, 9, 11])
+        assert dc.percentile(0) == 1
+        assert dc.percentile(100) == 9
+        assert dc.percentile(50) == 3.5
+        assert dc.percentiles([25, 75]) == [1.75, 5.25]
+        with pytest.raises(ValueError):
+            dc.percentile(101)
+
+        values = list(range(1000))
+        data = DataCollection.from_list(values)
+        assert data.percentiles([0.4, 99.6]) == [3.996, 995.004]
+
+        counts, edges = dc.histogram(4)
+        assert edges == [1, 3, 5, 7, 9]
+        assert counts == [9, 6, 6, 3]
+        assert dc.histogram([0, 2, 5]) == ([6, 12], [0, 2, 5])
+        assert dc.histogram(2, (0, 4)) == ([6, 9], [0, 2, 4])
+        with pytest.raises(ValueError):
+            dc.histogram([5, 2])
+
     def test_interpolation(self):
         # To test an annual data collection, we will just use a range of values
         test_data = range(8760)
@@ -56,10 +285,216 @@ class DataCollectionTestCase(unittest.TestCase):
         assert dc2.interpolate_data(2)[1] == 0.5
         assert dc2.interpolate_data(2, True)[1] == 0.25
 
+    def test_interpolate_to_timestep(self):
+        ap = AnalysisPeriod(end_month=1, end_day=1)
+        dc = CompactDataCollection([0, 10, 10, 20] * 6, Header(
+            analysis_period=ap, data_type='Temperature', unit='C'))
+        linear = dc.interpolate_to_timestep(4)
+        assert linear.header.analysis_period.timestep == 4
+        assert len(linear) == 96
+        assert linear.values[:8] == [0, 2.5, 5, 7.5, 10, 10, 10, 10]
+        assert linear.datetimes[1].minute == 15
+        assert dc.interpolate_to_timestep(2, True).values[:2] == [0, 2.5]
+
+        # monotone interpolation does not overshoot the values
+        monotone = dc.interpolate_to_timestep(4, method='monotone').values
+        assert monotone[4:8] == [10, 10, 10, 10]
+        assert all(0 <= v <= 20 for v in monotone)
+        assert monotone[1] < 2.5
+
+        with pytest.raises(ValueError):
+            dc.interpolate_to_timestep(4, method='spline')
+        with pytest.raises(ValueError):
+            dc.filter_by_hoys([0, 1]).interpolate_to_timestep(4)
+
+    def test_resample(self):
+        ap = AnalysisPeriod(end_month=1, end_day=2, timestep=4)
+        dc = CompactDataCollection(range(48 * 4), Header(
+            analysis_period=ap, data_type='Temperature', unit='C'))
+        hourly = dc.resample(1)
+        assert hourly.header.analysis_period.timestep == 1
+        assert hourly.values[:2] == [1.5, 5.5]
+        assert dc.resample(2, 'max').values[:2] == [1, 3]
+
+        daily = dc.resample('daily', 'sum')
+        assert daily.header.analysis_period is None
+        assert daily.header.unit == 'C'
+        assert daily.values == [sum(range(96)), sum(range(96, 192))]
+        assert daily.datetimes[1].day == 2
+        monthly = dc.resample('monthly', 'count')
+        assert monthly.values == [192]
+        assert monthly.datetimes[0].month == 1
+
+        # collections without an analysis period keep their datetimes
+        filtered = hourly.filter_by_hoys(range(10, 30)).resample(1)
+        assert filtered.header.analysis_period is None
+        assert len(filtered) == 20
+
+        with pytest.raises(ValueError):
+            hourly.resample(2)
+        with pytest.raises(ValueError):
+            dc.resample('weekly')
+
+    def test_align(self):
+        ap = AnalysisPeriod(end_month=1, end_day=1)
+        header = Header(None, 'Temperature', 'C', ap)
+        dc = CompactDataCollection(range(24), header)
+        gap = dc.filter_by_hoys([0, 1, 5, 6, 7])
+        extra = CompactDataCollection([100, 101], None, [60 * 30, 60 * 6])
+
+        a, b = DataCollection.align(dc, gap)
+        assert a.values == b.values == [0, 1, 5, 6, 7]
+        assert list(a.moys) == list(b.moys) == [0, 60, 300, 360, 420]
+
+        a, b, c = DataCollection.align(dc, gap, extra, how='outer', fill=-1)
+        assert len(a) == len(b) == len(c) == 25
+        assert b.values[:3] == [0, 1, -1]
+        assert c.values[6] == 101 and c.values[-1] == 100
+        assert a.values[-1] == -1
+
+        # collections on the same datetimes keep their analysis period
+        a, b = DataCollection.align(dc, dc)
+        assert a.header.analysis_period == ap
+        assert b.values == list(range(24))
+
+        with pytest.raises(ValueError):
+            DataCollection.align(dc, gap, how='left')
+
+    def test_views(self):
+        ap = AnalysisPeriod(end_month=1, end_day=2)
+        dc = CompactDataCollection(range(48), Header(None, 'Temperature', 'C', ap))
+        sliced = dc[10:20:2]
+        assert sliced.values == [10, 12, 14, 16, 18]
+        assert [dt.hour for dt in sliced.datetimes] == [10, 12, 14, 16, 18]
+        masked = dc.filter_by_pattern(dc > 40)
+        assert masked.values == list(range(41, 48))
+        assert masked[2:4].values == [43, 44]
+        assert masked.filter_by_pattern([True, False]).aggregate('day', 'max') == \
+            {2: 47}
+
+        # views are copied once they or the collection are updated
+        duplicate = dc.duplicate()
+        sliced.update_data_for_an_hour(100, 10)
+        dc.update_data_for_an_hour(-1, 12)
+        masked.update_data_for_an_hour(0, 41)
+        assert sliced.values[:2] == [100, 12]
+        assert dc.values[10:13] == [10, 11, -1]
+        assert duplicate.values[12] == 12
+        assert masked.values[:2] == [0, 42]
+        assert dc.values[41] == 41
+
+        # integer values are kept as integers once the views are copied
+        rh = CompactDataCollection(array('i', range(48)), Header(analysis_period=ap))
+        for view in (rh.duplicate(), rh[10:20:2], rh.filter_by_pattern(rh > 40)):
+            view.update_data_for_an_hour(0, 41)
+            assert view._values.typecode == 'i'
+        assert rh._values.typecode == 'i'
+        rh.update_data_for_an_hour(50, 41)
+        assert rh._values.typecode == 'i'
+        assert all(isinstance(v, int) for v in rh.values)
+
     def test_json_methods(self):
-        pass
-        # I leave the test here as a TODO
-        # assert dc.to_json() == dc_from_data_and_datetimes.to_json()
+        ap = AnalysisPeriod(end_month=1, end_day=2)
+        dc = CompactDataCollection(range(48), Header(None, 'Temperature', 'C', ap))
+        data = dc.to_json()
+        assert data['values'] == list(range(48))
+        assert 'moys' not in data
+        dc_from_json = DataCollection.from_json(data)
+        assert dc_from_json.values == dc.values
+        assert dc_from_json.datetimes == dc.datetimes
+        assert dc_from_json.header.unit == 'C'
+
+        # filtered collections keep their datetimes
+        filtered = dc.filter_by_hoys([1, 5, 30])
+        data = filtered.to_json()
+        assert data['moys'] == [60, 300, 1800]
+        assert data['header']['analysis_period'] is None
+        assert DataCollection.from_json(data).datetimes == filtered.datetimes
+
+        # data points are written as values
+        points = DataCollection.from_data_and_analysis_period(range(48), ap)
+        assert points.to_json()['values'] == list(range(48))
+        assert DataCollection.from_json(points.to_json()).values == dc.values
+
+        # older data point lists are still supported and are not changed
+        legacy = {'data': [d.to_json() for d in points]}
+        assert DataCollection.from_json(legacy).values == dc.values
+        assert 'header' not in legacy
+
+        with pytest.raises(ValueError):
+            DataCollection.from_json({'version': 99, 'values': []})
+
+    def test_bytes_methods(self):
+        ap = AnalysisPeriod(end_month=1, end_day=2)
+        dc = CompactDataCollection(range(48), Header(None, 'Temperature', 'C', ap))
+        dc_from_bytes = DataCollection.from_bytes(dc.to_bytes())
+        assert dc_from_bytes.values == dc.values
+        assert dc_from_bytes.datetimes == dc.datetimes
+        assert dc_from_bytes.header.unit == 'C'
+
+        filtered = dc.filter_by_hoys([1, 5, 30])
+        assert pickle.loads(pickle.dumps(filtered)).moys == (60, 300, 1800)
+        flags = CompactDataCollection(['A', 'B'], None, [0, 60])
+        assert pickle.loads(pickle.dumps(flags)).values == ['A', 'B']
+
+        data = DataCollection.from_data_and_analysis_period(range(48), ap)
+        data_from_pickle = pickle.loads(pickle.dumps(data))
+        assert type(data_from_pickle) is DataCollection
+        assert data_from_pickle.datetimes == dc.datetimes
+        assert data_from_pickle.values == data.values
+        # data points are pickled as packed values
+        assert len(pickle.dumps(data, 2)) < len(pickle.dumps(data.data, 2)) / 2
+
+        # typed data points are pickled as they are to keep their type
+        typed = DataCollection([DryBulbTemperature(20, DateTime(1, 1, 1))])
+        typed_from_pickle = pickle.loads(pickle.dumps(typed))
+        assert type(typed_from_pickle[0]) is DryBulbTemperature
+        assert typed_from_pickle[0].datetime == typed[0].datetime
+
+        with pytest.raises(ValueError):
+            DataCollection.from_bytes(b'LBEPW' + dc.to_bytes()[5:])
+
+    def test_unit_conversion(self):
+        ap = AnalysisPeriod(end_month=1, end_day=1)
+        dc = CompactDataCollection(range(24), Header(None, 'Temperature', 'C', ap))
+        dc_ip = dc.to_ip()
+        assert dc_ip.header.unit == 'F'
+        assert dc_ip.values[:2] == [32, pytest.approx(33.8)]
+        assert dc.header.unit == 'C'
+        assert dc_ip.to_si().values == pytest.approx(dc.values)
+        assert dc_ip.to_ip().values == dc_ip.values
+
+        data = DataCollection.from_data_and_analysis_period(
+            range(24), ap, Header(None, 'Wind Speed', 'm/s', ap))
+        assert data.to_ip().header.unit == 'mph'
+        assert data.to_ip().values[1] == pytest.approx(2.23694)
+
+        # wind direction is in degrees in both standards
+        wind_dir = CompactDataCollection(
+            [240] * 24, Header(None, 'Wind Direction', 'degrees', ap))
+        assert wind_dir.to_ip().header.unit == 'degrees'
+        assert wind_dir.to_ip().values == wind_dir.values
+        wind_dir = CompactDataCollection(
+            array('i', [240] * 24), Header(None, 'Wind Direction', 'degrees', ap))
+        assert wind_dir.to_ip()._values.typecode == 'i'
+
+        # epw fields are converted back to their own unit with the same missing value
+        snow = CompactDataCollection(
+            [10] * 23 + [999], Header(None, 'Snow Depth', 'cm', ap))
+        snow_ip = snow.to_ip()
+        assert snow_ip.header.unit == 'inch'
+        assert snow_ip.values[0] == pytest.approx(3.93701)
+        assert snow_ip.values[-1] == pytest.approx(393.307299)
+        assert snow_ip.to_si().header.unit == 'cm'
+        assert snow_ip.to_si().values == pytest.approx(snow.values)
+        assert snow_ip.to_si().values[-1] == 999
+        # ip values which are the same as the si missing value are converted
+        snow_ip = CompactDataCollection(
+            [999] * 24, Header(None, 'Snow Depth', 'inch', ap))
+        assert snow_ip.to_si().values[0] == pytest.approx(2537.4586)
+
+        with pytest.raises(ValueError):
+            CompactDataCollection(range(3), None, [0, 60, 120]).to_ip()
 
     def test_get_highest_values(self):
         # To test get_highest_values, a range of yearly-hour values will be used
@@ -2,8 +2,10 @@
 
 import unittest
 import pytest
+import math
 from ladybug.dt import DateTime
-from ladybug.datatype import DataTypeBase, DryBulbTemperature
+from ladybug.datatype import DataTypeBase, DryBulbTemperature, Angle, \
+    unit_conversion
 
 
 class DataTypeBaseTestCase(unittest.TestCase):
@@ -96,6 +98,45 @@ class DryBulbTemperatureTestCase(unittest.TestCase):
         assert temp.to_json() == json_data
         assert temp.to_ip == t * 9 / 5 + 32
 
+    def test_convert(self):
+        temp = DryBulbTemperature(20.0)
+        temp.convert_to_ip()
+        assert temp.value == 68
+        assert temp.unit == 'F'
+        temp.convert_to_si()
+        assert temp.value == 20
+
+    def test_angle_conversion(self):
+        assert Angle.si_to_ip(180) == pytest.approx(math.pi)
+        assert Angle.ip_to_si(math.pi / 2) == pytest.approx(90)
+        assert Angle(90).to_ip == pytest.approx(math.pi / 2)
+
+    def test_unit_conversion(self):
+        unit, to_ip = unit_conversion('C', 'IP')
+        assert unit == 'F'
+        assert to_ip(100) == 212
+        unit, to_si = unit_conversion('inch', 'SI')
+        assert unit == 'mm'
+        assert to_si(1) == pytest.approx(25.4, rel=1e-5)
+        assert unit_conversion('%', 'IP') == ('%', None)
+        assert unit_conversion('F', 'IP') == ('F', None)
+
+        assert unit_conversion('degrees', 'IP') == ('degrees', None)
+        unit, to_si = unit_conversion('inch', 'SI', 'Snow Depth')
+        assert unit == 'cm'
+        assert to_si(1) == pytest.approx(2.54, rel=1e-5)
+        # missing values are converted and restored exactly
+        unit, to_ip = unit_conversion('C', 'IP', 'Dry Bulb Temperature')
+        unit, to_si = unit_conversion('F', 'SI', 'Dry Bulb Temperature')
+        assert to_ip(99.9) == pytest.approx(211.82)
+        assert to_si(to_ip(99.9)) == 99.9
+        assert to_si(99.9) == pytest.approx(37.7222222)
+
+        with pytest.raises(ValueError):
+            unit_conversion('C', 'US')
+        with pytest.raises(ValueError):
+            unit_conversion('parsec', 'IP')
+
 
 if __name__ == "__main__":
     unittest.main()
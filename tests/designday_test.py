@@ -1,6 +1,7 @@
 # coding=utf-8
 
 import unittest
+import pytest
 from pytest import approx
 import os
 from ladybug.location import Location
@@ -34,6 +35,21 @@ class DdyTestCase(unittest.TestCase):
         assert ddy.file_path == abs_path
         assert ddy_rel.file_path == os.path.normpath(relative_path)
 
+    def test_import_ddy_from_archive(self):
+        """Test import ddy from a zip file without extracting it."""
+        ddy = DDY.from_archive('./tests/zip/test.zip')
+        assert ddy.file_path == os.path.normpath('./tests/zip/test.zip')
+        assert ddy.location.city == 'SYDNEY_AUS Design_Conditions'
+        assert len(ddy.design_days) == 18
+
+        with pytest.raises(ValueError):
+            DDY.from_archive('./tests/ddy/chicago.ddy')
+
+        with open('./tests/ddy/chicago.ddy', 'rb') as ddy_file:
+            file_ddy = DDY.from_ddy_file(ddy_file)
+        assert len(file_ddy.design_days) == \
+            len(DDY.from_ddy_file('./tests/ddy/chicago.ddy').design_days)
+
     def test_ddy_from_design_day(self):
         """Test ddy from design day method."""
         relative_path = './tests/ddy/chicago_monthly.ddy'
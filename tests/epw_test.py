@@ -1,8 +1,15 @@
 # coding=utf-8
 
 import unittest
+import pytest
+import io
 import os
-from ladybug.epw import EPW
+import gzip
+import pickle
+import shutil
+from ladybug.epw import EPW, load_epws
+from ladybug.analysisperiod import AnalysisPeriod
+from ladybug.futil import nukedir, open_archive_member
 
 
 class EPWTestCase(unittest.TestCase):
@@ -48,17 +55,332 @@ class EPWTestCase(unittest.TestCase):
         assert epw.is_data_loaded is True
         assert len(dbt) == 8760
 
+    def test_import_header_data(self):
+        """Test parsing the header of epw file without loading the data."""
+        epw = EPW('./tests/epw/chicago.epw')
+        design_conditions = epw.design_conditions
+        assert design_conditions.source == 'Climate Design Data 2009 ASHRAE Handbook'
+        assert design_conditions.heating['DB996'] == -20
+        assert design_conditions.cooling['DB004'] == 33.3
+        assert design_conditions.extremes['DBmax50years'] == 40.9
+
+        periods = epw.typical_extreme_periods
+        assert len(periods) == 6
+        assert periods[2].period_type == 'Extreme'
+        assert (periods[2].st_month, periods[2].st_day) == (1, 27)
+        assert (periods[2].end_month, periods[2].end_day) == (2, 2)
+        assert len(periods[2].analysis_period) == 7 * 24
+
+        ground_temperatures = epw.ground_temperatures
+        assert [gt.depth for gt in ground_temperatures] == [0.5, 2, 4]
+        assert ground_temperatures[0].conductivity is None
+        assert ground_temperatures[0].monthly_values[0] == -1.89
+        assert len(ground_temperatures[2].monthly_values) == 12
+
+        holidays = epw.holidays_daylight_savings
+        assert holidays.leap_year_observed is False
+        assert holidays.has_daylight_saving is False
+        assert holidays.holidays == []
+
+        assert epw.comments_1.startswith('Custom/User Format')
+        assert epw.data_periods[0].records_per_hour == 1
+        assert epw.data_periods[0].start_day_of_week == 'Sunday'
+        assert epw.data_periods[0].analysis_period.is_annual
+        assert epw.is_data_loaded is False
+
+        # tokyo file has dates with year in the header
+        epw = EPW('./tests/epw/tokyo.epw')
+        assert epw.typical_extreme_periods[0].st_month == 7
+        assert epw.typical_extreme_periods[0].st_day == 20
+        assert epw.data_periods[0].end_month == 12
+
+    def test_import_data_as_columns(self):
+        """Test that data collections are only created for requested fields."""
+        path = './tests/epw/chicago.epw'
+        epw = EPW(path)
+        dbt = epw.dry_bulb_temperature
+        assert epw._data[6] is dbt
+        assert epw._data[7] is None
+        assert epw._columns[6].typecode == 'd'
+        assert epw._columns[8].typecode == 'i'
+        # values on the hour are shifted so that the last hour comes first
+        assert dbt[0].value == epw._columns[6][-1]
+        assert dbt[1].value == epw._columns[6][0]
+        assert dbt[1].datetime.hour == 1
+        # values in the middle of the hour are not shifted
+        dnr = epw.direct_normal_radiation
+        assert dnr[8].value == epw._columns[14][8]
+        assert dnr[8].datetime.hour == 8
+        # updating a collection doesn't change the values of the epw column
+        value = epw._columns[14][8]
+        dnr.update_data_for_an_hour(1234, 8)
+        assert dnr[8].value == 1234
+        assert epw._columns[14][8] == value
+
+    def test_import_data_lazy(self):
+        """Test that lazy mode only converts the requested fields."""
+        path = './tests/epw/tokyo.epw'
+        epw = EPW(path, lazy=True)
+        full_epw = EPW(path)
+        assert epw.is_lazy is True
+        rh = epw.relative_humidity
+        assert epw.is_data_loaded is True
+        assert epw._columns[8] is not None
+        assert epw._columns[6] is None
+        assert rh.values == full_epw.relative_humidity.values
+        assert epw.dry_bulb_temperature.values == \
+            full_epw.dry_bulb_temperature.values
+
+    def test_import_data_from_cache(self):
+        """Test loading data from a binary cache file."""
+        path = './tests/epw/chicago.epw'
+        cache_dir = './tests/epw/cache'
+        epw = EPW(path, cache_dir=cache_dir)
+        dbt = epw.dry_bulb_temperature
+        assert os.path.isfile(epw.cache_path)
+
+        cached_epw = EPW(path, cache_dir=cache_dir)
+        assert cached_epw._import_cache() is True
+        assert cached_epw.location.city == 'Chicago Ohare Intl Ap'
+        assert cached_epw.header == epw.header
+        assert cached_epw.dry_bulb_temperature.values == dbt.values
+        assert cached_epw._get_data_by_field(5).values == \
+            epw._get_data_by_field(5).values
+
+        # an outdated cache should be ignored
+        with open(cached_epw.cache_path, 'r+b') as cache_file:
+            cache_file.seek(6)
+            cache_file.write(b'\x00')
+        assert EPW(path, cache_dir=cache_dir)._import_cache() is False
+        nukedir(cache_dir, True)
+
+        # writing the cache in lazy mode doesn't convert all the fields
+        lazy_epw = EPW(path, lazy=True, cache_dir=cache_dir)
+        rh = lazy_epw.relative_humidity
+        assert lazy_epw._columns[6] is None
+        cached_epw = EPW(path, lazy=True, cache_dir=cache_dir)
+        assert cached_epw._import_cache() is True
+        assert cached_epw._columns[6] is None
+        assert cached_epw.dry_bulb_temperature.values == dbt.values
+        assert cached_epw.relative_humidity.values == rh.values
+        nukedir(cache_dir, True)
+
+    def test_iter_records(self):
+        """Test iterating over epw records without loading the data."""
+        path = './tests/epw/chicago.epw'
+        epw = EPW(path)
+        records = list(epw.iter_records(fields=(6, 14)))
+        assert epw.is_data_loaded is False
+        assert len(records) == 8760
+        assert records[0].datetime.hour == 0
+        assert records[8].datetime.hour == 8
+
+        dbt = epw.dry_bulb_temperature
+        dnr = epw.direct_normal_radiation
+        assert [r.dry_bulb_temperature for r in records] == dbt.values
+        assert [r.direct_normal_radiation for r in records] == dnr.values
+
+        ap = AnalysisPeriod(2, 1, 9, 2, 3, 17)
+        records = list(epw.iter_records([6], ap))
+        assert len(records) == 27
+        assert [r.dry_bulb_temperature for r in records] == \
+            dbt.filter_by_analysis_period(ap).values
+
+    def test_import_epw_from_archive(self):
+        """Test importing epw data from compressed files without extracting them."""
+        epw = EPW.from_archive('./tests/zip/test.zip')
+        assert epw.archive_member == 'AUS_NSW.Sydney.947670_IWEC.epw'
+        assert epw.location.city == 'SYDNEY'
+        assert len(epw.dry_bulb_temperature.values) == 8760
+
+        path = './tests/epw/chicago.epw'
+        gz_path = './tests/epw/chicago.epw.gz'
+        with open(path, 'rb') as epw_file, gzip.open(gz_path, 'wb') as gz_file:
+            shutil.copyfileobj(epw_file, gz_file)
+        epw = EPW(path)
+        gz_epw = EPW(gz_path, lazy=True)
+        assert gz_epw.dry_bulb_temperature.values == epw.dry_bulb_temperature.values
+        assert list(gz_epw.iter_records([6]))[-1] == list(epw.iter_records([6]))[-1]
+        # the member of a gzip file is named after the file
+        assert EPW.from_archive(gz_path, member='chicago.epw').archive_member == \
+            'chicago.epw'
+        with pytest.raises(ValueError):
+            EPW.from_archive(gz_path, member='tokyo.epw')
+        with pytest.raises(ValueError):
+            open_archive_member(gz_path, 'tokyo.epw')
+        os.remove(gz_path)
+
+        with open(path, 'rb') as epw_file:
+            file_epw = EPW(epw_file)
+        assert file_epw.file_path == os.path.normpath(path)
+        assert file_epw.relative_humidity.values == epw.relative_humidity.values
+
+        # a wea file can't be named after an epw with no file
+        with open(path, 'rb') as epw_file:
+            content_epw = EPW(io.BytesIO(epw_file.read()))
+        assert content_epw.file_path is None
+        with pytest.raises(ValueError):
+            content_epw.to_wea()
+
+    def test_load_epws(self):
+        """Test loading several epw files in parallel."""
+        paths = ['./tests/epw/chicago.epw', './tests/epw/tokyo.epw']
+        epws = load_epws(paths, fields=(6, 8), workers=2)
+        assert [epw.location.city for epw in epws] == ['Chicago Ohare Intl Ap', 'Tokyo']
+        assert epws[1]._data == [None] * 35
+        assert epws[1]._columns[7] is None
+        tokyo = EPW(paths[1])
+        assert epws[1].relative_humidity.values == tokyo.relative_humidity.values
+        # fields which are not requested are loaded from the file on request
+        assert epws[1].dew_point_temperature.values == \
+            tokyo.dew_point_temperature.values
+
+        epws = load_epws(paths[:1])
+        assert epws[0].is_data_loaded is True
+        assert epws[0]._columns[7] is not None
+
     def test_save_epw(self):
         """Test save epw_rel."""
         path = './tests/epw/tokyo.epw'
         epw = EPW(path)
 
         modified_path = './tests/epw/tokyo_modified.epw'
+        epw.dry_bulb_temperature[12].value = 30
         epw.save(modified_path)
         assert os.path.isfile(modified_path)
         assert os.stat(modified_path).st_size > 1
+
+        new_epw = EPW(modified_path)
+        assert new_epw.dry_bulb_temperature[12].value == 30
+        assert new_epw.header == epw.header
         os.remove(modified_path)
 
+    def test_bytes_methods(self):
+        """Test binary serialization and pickling of epw data."""
+        epw = EPW('./tests/epw/chicago.epw')
+        epw.dry_bulb_temperature.update_data_for_an_hour(40.5, 12)
+        epw_from_bytes = EPW.from_bytes(epw.to_bytes())
+        assert epw_from_bytes.location.city == epw.location.city
+        assert epw_from_bytes.dry_bulb_temperature.values[12] == 40.5
+        assert epw_from_bytes.wind_speed.values == epw.wind_speed.values
+        assert epw_from_bytes.header == epw.header
+
+        epw_from_pickle = pickle.loads(pickle.dumps(epw))
+        assert epw_from_pickle.relative_humidity.values == \
+            epw.relative_humidity.values
+        assert epw_from_pickle.file_path == epw.file_path
+
+    def test_save_epw_round_trip(self):
+        """Test that saving an epw file does not change the data."""
+        path = './tests/epw/chicago.epw'
+        epw = EPW(path)
+        dbt = epw.dry_bulb_temperature
+        first_value = dbt[0].value
+        modified_path = './tests/epw/chicago_modified.epw'
+        epw.save(modified_path)
+        assert dbt[0].value == first_value
+        assert len(dbt) == 8760
+
+        with open(path) as epw_f, open(modified_path) as modified_f:
+            assert epw_f.read() == modified_f.read()
+        os.remove(modified_path)
+
+        # values with more digits than the precision of the field are not rounded
+        path = './tests/epw/tokyo.epw'
+        epw = EPW(path)
+        epw.save(modified_path)
+        saved_epw = EPW(modified_path)
+        for field_number in range(epw._num_of_fields):
+            assert saved_epw._get_data_by_field(field_number).values == \
+                epw._get_data_by_field(field_number).values
+        assert saved_epw.dew_point_temperature[1].value == -3.1204786043046
+        assert saved_epw.relative_humidity[1].value == 60.6368919336604
+        os.remove(modified_path)
+
+    def test_import_leap_year_epw(self):
+        """Test importing an epw file with data for February 29."""
+        path = './tests/epw/chicago.epw'
+        leap_path = './tests/epw/chicago_leap.epw'
+        with open(path) as epw_f:
+            lines = epw_f.readlines()
+        feb_28 = [line for line in lines[8:] if line.split(',')[1:3] == ['2', '28']]
+        feb_29 = [line.replace(',2,28,', ',2,29,', 1) for line in feb_28]
+        index = lines.index(feb_28[-1]) + 1
+        with open(leap_path, 'w') as epw_f:
+            epw_f.writelines(lines[:index] + feb_29 + lines[index:])
+
+        for lazy in (False, True):
+            epw = EPW(leap_path, lazy=lazy)
+            dbt = epw.dry_bulb_temperature
+            assert epw.timestep == 1
+            assert epw.is_leap_year is True
+            assert len(dbt) == 8784
+            assert dbt.header.analysis_period.is_leap_year is True
+            assert str(dbt[59 * 24 + 8].datetime) == '29 Feb 08:00'
+            assert str(dbt[-1].datetime) == '31 Dec 23:00'
+
+        records = list(epw.iter_records([6]))
+        assert [r.dry_bulb_temperature for r in records] == dbt.values
+        assert [r.datetime for r in records] == list(dbt.datetimes)
+
+        saved_path = epw.save('./tests/epw/chicago_leap_saved.epw')
+        with open(leap_path) as epw_f, open(saved_path) as saved_f:
+            assert epw_f.read() == saved_f.read()
+        os.remove(leap_path)
+        os.remove(saved_path)
+
+    def test_import_sub_hourly_epw(self):
+        """Test importing an epw file with 15-minute data."""
+        path = './tests/epw/chicago.epw'
+        sub_hourly_path = './tests/epw/chicago_15min.epw'
+        with open(path) as epw_f:
+            lines = epw_f.readlines()
+        records = []
+        for line in lines[8:]:
+            data = line.split(',')
+            for minute in ('15', '30', '45', '60'):
+                records.append(','.join(data[:4] + [minute] + data[5:]))
+        with open(sub_hourly_path, 'w') as epw_f:
+            epw_f.writelines(lines[:8] + records)
+
+        epw = EPW(sub_hourly_path)
+        dbt = epw.dry_bulb_temperature
+        assert epw.timestep == 4
+        assert epw.is_leap_year is False
+        assert len(dbt) == 8760 * 4
+        assert dbt.header.analysis_period.timestep == 4
+        assert str(dbt[5].datetime) == '01 Jan 01:15'
+        # values on the hour are shifted by one record
+        assert dbt.values[1:5] == [EPW(path).dry_bulb_temperature[1].value] * 4
+
+        records = list(EPW(sub_hourly_path).iter_records([6, 7]))
+        assert len(records) == 8760 * 4
+        assert str(records[-1].datetime) == '31 Dec 23:45'
+        assert [r.dry_bulb_temperature for r in records] == dbt.values
+        assert [r.dew_point_temperature for r in records] == \
+            epw.dew_point_temperature.values
+
+        saved_path = epw.save('./tests/epw/chicago_15min_saved.epw')
+        with open(sub_hourly_path) as epw_f, open(saved_path) as saved_f:
+            assert epw_f.read() == saved_f.read()
+        os.remove(saved_path)
+
+        # wea files have a line for each record
+        wea_path = epw.to_wea('./tests/wea/chicago_15min.wea')
+        with open(wea_path) as wea_f:
+            lines = wea_f.readlines()[6:]
+        dnr = epw.direct_normal_radiation
+        assert len(lines) == 8760 * 4
+        assert lines[49].split()[:3] == ['1', '1', '12.375']
+        assert float(lines[49].split()[-2]) == dnr[49].value
+        wea_path = epw.to_wea(wea_path, hoys=[12.25, 13])
+        with open(wea_path) as wea_f:
+            lines = wea_f.readlines()[6:]
+        assert [line.split()[2] for line in lines] == ['12.375', '13.125']
+        assert float(lines[1].split()[-2]) == dnr[52].value
+        os.remove(wea_path)
+        os.remove(sub_hourly_path)
+
     def test_save_wea(self):
         """Test save wea_rel."""
         path = './tests/epw/chicago.epw'
@@ -37,6 +37,16 @@ class DataCollectionTestCase(unittest.TestCase):
         assert 1500000 < os.stat(extracted_epw).st_size < 1600000
         futil.nukedir(folder)
 
+    def test_open_archive_member(self):
+        """Test reading a file inside a zip file without extracting it."""
+        wf_path = "./tests/zip/test.zip"
+        member = futil.find_archive_member(wf_path, '.epw')
+        assert member == "AUS_NSW.Sydney.947670_IWEC.epw"
+        with futil.open_archive_member(wf_path, member) as epw_file:
+            assert epw_file.readline().startswith('LOCATION,SYDNEY')
+        with self.assertRaises(ValueError):
+            futil.find_archive_member(wf_path, member='missing.epw')
+
     def test_copy_files_to_folder(self):
         """Test the copy file to folder capability"""
         existing_file = "./tests/ddy/chicago.ddy"
@@ -1,7 +1,10 @@
 # coding utf-8
 
 import unittest
+import pytest
 from ladybug.comfort.pmv import PMV
+from ladybug.datacollection import DataCollection
+from ladybug.dt import DateTime
 
 
 class PMVTestCase(unittest.TestCase):
@@ -183,3 +186,23 @@ class PMVTestCase(unittest.TestCase):
         # What are we testing here?
         pmv_comf = PMV.from_individual_values(26, 26, 0.75, 80, 1.1, 0.5)
         pmv = pmv_comf.pmv
+
+    def test_gapped_data_collections(self):
+        """Test that data collections are aligned on their datetimes."""
+        air_temp = DataCollection.from_data_and_datetimes(
+            [19, 20, 21, 22], [DateTime(1, 1, h) for h in range(4)])
+        # humidity is missing for the second hour
+        rel_humid = DataCollection.from_data_and_datetimes(
+            [60, 60, 60], [DateTime(1, 1, h) for h in (0, 2, 3)])
+
+        pmv_comf = PMV(air_temperature=air_temp, rel_humidity=rel_humid)
+        pmv = pmv_comf.pmv
+        assert pmv_comf.air_temperature == [19, 21, 22]
+        assert len(pmv) == 3
+        assert pmv[0] == PMV.from_individual_values(19, 19, rel_humidity=60).pmv
+
+        # lists can't be aligned with the collections
+        pmv_comf = PMV(air_temperature=air_temp, rel_humidity=rel_humid,
+                       wind_speed=[0.5, 0.5, 0.5, 0.5])
+        with pytest.raises(ValueError):
+            pmv_comf.pmv
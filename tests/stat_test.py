@@ -1,6 +1,7 @@
 # coding=utf-8
 
 import unittest
+import pytest
 from pytest import approx
 import os
 
@@ -33,6 +34,22 @@ class StatTestCase(unittest.TestCase):
         assert stat_rel.file_path == os.path.normpath(relative_path)
         assert hasattr(stat, 'isStat')
 
+    def test_import_stat_from_archive(self):
+        """Test import stat from a zip file without extracting it."""
+        stat = STAT.from_archive('./tests/zip/test.zip')
+        assert stat.archive_member == 'AUS_NSW.Sydney.947670_IWEC.stat'
+        assert stat.location.city == 'SYDNEY'
+        assert stat.location.latitude == approx(-33.95, rel=1e-3)
+        assert stat.location.longitude == approx(151.17, rel=1e-3)
+
+        with pytest.raises(ValueError):
+            STAT.from_archive('./tests/stat/chicago.stat')
+
+        with open('./tests/stat/chicago.stat', 'rb') as stat_file:
+            file_stat = STAT(stat_file)
+        assert file_stat.location.latitude == \
+            STAT('./tests/stat/chicago.stat').location.latitude
+
     def test_stat_location(self):
         relative_path = './tests/stat/tokyo.stat'
         stat = STAT(relative_path)
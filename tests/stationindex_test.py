@@ -0,0 +1,58 @@
+# coding=utf-8
+
+import unittest
+from pytest import approx
+import os
+
+from ladybug.stationindex import StationIndex
+
+
+class StationIndexTestCase(unittest.TestCase):
+    """Test for (ladybug/stationindex.py)"""
+
+    # preparing to test.
+    def setUp(self):
+        """set up."""
+        self.index_file = './tests/epw/stations.json'
+
+    def tearDown(self):
+        """Remove the index file."""
+        if os.path.isfile(self.index_file):
+            os.remove(self.index_file)
+
+    def test_nearest_station(self):
+        """Test finding the nearest stations."""
+        index = StationIndex.from_folder('./tests/epw')
+        assert len(index) == 2
+
+        stations = index.nearest(41.88, -87.63, 2)
+        assert [os.path.split(s.file_path)[-1] for s in stations] == \
+            ['chicago.epw', 'tokyo.epw']
+        assert stations[0].location.city == 'Chicago Ohare Intl Ap'
+        assert stations[0].distance == approx(26, abs=1)
+
+        stations = index.within(35.55, 139.78, 50)
+        assert len(stations) == 1
+        assert stations[0].location.country == 'JPN'
+        assert index.within(0, 0, 1000) == []
+
+    def test_save_station_index(self):
+        """Test saving and updating the index file."""
+        index = StationIndex.from_folder('./tests/epw', self.index_file)
+        assert os.path.isfile(self.index_file)
+
+        loaded_index = StationIndex.from_file(self.index_file)
+        assert len(loaded_index) == 2
+        station = loaded_index.nearest(41.88, -87.63)[0]
+        assert station.file_path == index.nearest(41.88, -87.63)[0].file_path
+        assert station.location.station_id == '725300'
+        assert os.path.isfile(station.file_path)
+
+        stat_index = StationIndex.from_folder(
+            './tests/stat', self.index_file, extensions=('.stat',))
+        assert len(stat_index) == 3
+        assert stat_index.nearest(34.0, -118.5)[0].location.city == 'Santa Monica Muni'
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,6 +3,7 @@
 import unittest
 import pytest
 import os
+import pickle
 from ladybug.wea import Wea
 from ladybug.location import Location
 
@@ -52,6 +53,21 @@ class WeaTestCase(unittest.TestCase):
         assert wea_from_epw.diffuse_horizontal_radiation[8].datetime.hour == 8
         assert wea_from_epw.diffuse_horizontal_radiation[8].datetime.minute == 30
 
+    def test_from_epw_timestep(self):
+        """Test import from epw with a sub-hourly timestep"""
+        epw_path = './tests/epw/chicago.epw'
+        wea_from_epw = Wea.from_epw_file(epw_path, 2)
+
+        assert wea_from_epw.timestep == 2
+        assert len(wea_from_epw.direct_normal_radiation) == 8760 * 2
+        # hourly values are for the middle of the hour
+        assert wea_from_epw.direct_normal_radiation[15] == 22
+        assert wea_from_epw.direct_normal_radiation[15].datetime.hour == 7
+        assert wea_from_epw.direct_normal_radiation[15].datetime.minute == 30
+        assert wea_from_epw.direct_normal_radiation[16] == (22 + 397) / 2.0
+        # radiation is set to 0 before sunrise
+        assert wea_from_epw.direct_normal_radiation[13] == 0
+
     def test_from_stat(self):
         """Test import from stat"""
         stat_path = './tests/stat/chicago.stat'
@@ -118,6 +134,16 @@ class WeaTestCase(unittest.TestCase):
 
         assert wea.to_json() == Wea.from_json(wea.to_json()).to_json()
 
+    def test_bytes_methods(self):
+        """Test binary serialization and pickling."""
+        wea = Wea.from_epw_file('./tests/epw/chicago.epw')
+        wea_from_bytes = Wea.from_bytes(wea.to_bytes())
+        assert wea_from_bytes.to_json() == wea.to_json()
+        assert pickle.loads(pickle.dumps(wea)).to_json() == wea.to_json()
+
+        with pytest.raises(ValueError):
+            Wea.from_bytes(wea.direct_normal_radiation.to_bytes())
+
     def test_import_epw(self):
         """Test to compare import from epw with its json version."""
         epw_path = './tests/epw/chicago.epw'